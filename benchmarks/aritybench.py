@@ -0,0 +1,91 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares PQs of several arities under workloads mixing adds, decreases of priorities, and
+# extractions in different ratios.  Each workload performs the given numbers of adds and
+# decreases per extraction, interleaved, until the number of elements have been added, and then
+# extracts the remaining elements.
+#
+# Usage: python aritybench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, randrange, seed
+from pq import PQ
+
+ARITIES = (2, 3, 4, 8, 16)
+
+# (name, adds per round, decreases per round, extractions per round)
+WORKLOADS = [
+    ("add, extract", 1, 0, 1),
+    ("add, decrease, extract", 1, 1, 1),
+    ("decrease heavy", 1, 4, 1),
+    ("extract heavy", 4, 0, 3)
+]
+
+def operations(n, adds, decreases, extracts) :
+    # a fixed sequence of operations, so each arity runs the same workload:
+    # ("a", element, priority), ("d", element, scale), or ("x",)
+    seed(0)
+    ops = []
+    added = 0
+    while added < n :
+        for i in range(adds) :
+            if added < n :
+                ops.append(("a", added, random()))
+                added += 1
+        for i in range(decreases) :
+            ops.append(("d", randrange(added), random()))
+        for i in range(extracts) :
+            ops.append(("x",))
+    return ops
+
+def run(arity, ops) :
+    q = PQ(arity=arity)
+    add = q.add
+    get_priority = q.get_priority
+    contains = q.contains
+    change = q.change_priority
+    extract_min = q.extract_min
+    for op in ops :
+        if op[0] == "a" :
+            add(op[1], op[2])
+        elif op[0] == "d" :
+            if contains(op[1]) :
+                change(op[1], get_priority(op[1]) * op[2])
+        else :
+            if not q.is_empty() :
+                extract_min()
+    while not q.is_empty() :
+        extract_min()
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{0} elements".format(n))
+    print("{0:24}".format("workload") + "".join("{0:>10}".format("d=" + str(d)) for d in ARITIES))
+    for name, adds, decreases, extracts in WORKLOADS :
+        ops = operations(n, adds, decreases, extracts)
+        times = []
+        for arity in ARITIES :
+            start = perf_counter()
+            run(arity, ops)
+            times.append(perf_counter() - start)
+        print("{0:24}".format(name) + "".join("{0:10.3f}".format(t) for t in times))
@@ -0,0 +1,62 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares extracting the elements with the least priorities from a PQ one at a time, with
+# peek_min and extract_min, against extracting them in one call with extract_many and
+# extract_while, for several fractions of the PQ.
+#
+# Usage: python batchbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, seed
+from pq import PQ
+
+def one_at_a_time(q, threshold) :
+    peek_min = q.peek_min
+    get_priority = q.get_priority
+    extract_min = q.extract_min
+    extracted = []
+    while not q.is_empty() and get_priority(peek_min()) <= threshold :
+        extracted.append(extract_min())
+    return extracted
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    seed(0)
+    pairs = [(i, random()) for i in range(n)]
+    print("{0} elements".format(n))
+    print("{0:>10}{1:>18}{2:>16}{3:>18}".format("fraction", "one at a time", "extract_many", "extract_while"))
+    for fraction in (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0) :
+        times = []
+        q = PQ(pairs)
+        start = perf_counter()
+        k = len(one_at_a_time(q, fraction))
+        times.append(perf_counter() - start)
+        q = PQ(pairs)
+        start = perf_counter()
+        q.extract_many(k)
+        times.append(perf_counter() - start)
+        q = PQ(pairs)
+        start = perf_counter()
+        q.extract_while(fraction)
+        times.append(perf_counter() - start)
+        print("{0:10}{1:18.3f}{2:16.3f}{3:18.3f}".format(fraction, *times))
@@ -0,0 +1,74 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares BucketPQ with the binary heap PQ for priorities in [0..255], on a workload of adds and
+# extractions only, and on a scheduling-like workload that changes the priority of a random element
+# several times per extraction.
+#
+# Usage: python bucketbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import randrange, seed
+from pq import PQ
+from bucketqueue import BucketPQ
+
+LEVELS = 256
+
+def add_extract(q, n) :
+    seed(0)
+    add = q.add
+    extract_min = q.extract_min
+    for i in range(n) :
+        add(i, randrange(LEVELS))
+    while not q.is_empty() :
+        extract_min()
+
+def change_heavy(q, n, changes) :
+    seed(0)
+    q.add_all((i, randrange(LEVELS)) for i in range(n))
+    change = q.change_priority
+    contains = q.contains
+    extract_min = q.extract_min
+    while not q.is_empty() :
+        extract_min()
+        for i in range(changes) :
+            e = randrange(n)
+            if contains(e) :
+                change(e, randrange(LEVELS))
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{0} elements, priorities in [0..{1}]".format(n, LEVELS - 1))
+    print("{0:30}{1:>12}{2:>12}".format("workload", "PQ", "BucketPQ"))
+    times = []
+    for q in (PQ(), BucketPQ(LEVELS)) :
+        start = perf_counter()
+        add_extract(q, n)
+        times.append(perf_counter() - start)
+    print("{0:30}{1:12.3f}{2:12.3f}".format("add, extract", *times))
+    for changes in (1, 4) :
+        times = []
+        for q in (PQ(), BucketPQ(LEVELS)) :
+            start = perf_counter()
+            change_heavy(q, n, changes)
+            times.append(perf_counter() - start)
+        print("{0:30}{1:12.3f}{2:12.3f}".format("{0} changes per extract".format(changes), *times))
@@ -0,0 +1,66 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares CalendarPQ with the binary heap PQ on the hold model of discrete-event simulation: the PQ is
+# filled with pending events, and then each hold extracts the earliest event and schedules a new one at a
+# random increment later, keeping the number of pending events constant.  The increments are drawn from
+# several distributions commonly used to evaluate event queues.
+#
+# Usage: python calendarbench.py [number of pending events, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, expovariate, seed
+from pq import PQ
+from calendarqueue import CalendarPQ
+
+DISTRIBUTIONS = [
+    ("exponential", lambda : expovariate(1.0)),
+    ("uniform [0,2]", lambda : 2 * random()),
+    ("bimodal", lambda : 9.95 * random() + (95.0 if random() < 0.1 else 0.0)),
+    ("triangular [0,1.5]", lambda : 1.5 * max(random(), random())),
+]
+
+def hold(q, n, holds, increment) :
+    seed(0)
+    q.add_all((i, increment()) for i in range(n))
+    add = q.add
+    peek_min = q.peek_min
+    get_priority = q.get_priority
+    extract_min = q.extract_min
+    for i in range(holds) :
+        e = peek_min()
+        now = get_priority(e)
+        extract_min()
+        add(e, now + increment())
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{0} pending events, {0} holds".format(n))
+    print("{0:30}{1:>12}{2:>12}".format("increments", "PQ", "CalendarPQ"))
+    for name, increment in DISTRIBUTIONS :
+        times = []
+        for cls in (PQ, CalendarPQ) :
+            q = cls()
+            start = perf_counter()
+            hold(q, n, n, increment)
+            times.append(perf_counter() - start)
+        print("{0:30}{1:12.3f}{2:12.3f}".format(name, *times))
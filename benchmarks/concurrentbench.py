@@ -0,0 +1,73 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compares ingesting a list of edges into a single forest: sequentially, from several threads
+# sharing an IntDisjointSets behind one global lock, from several threads sharing a
+# ConcurrentIntDisjointSets, and with parallel_union_all across several processes.
+#
+# Usage: python concurrentbench.py [number of elements, default 1000000] [edges per element, default 2]
+
+import sys
+sys.path.append('../lib')
+
+import os
+from threading import Thread, Lock
+from time import perf_counter
+from random import randrange, seed
+from disjointsets import IntDisjointSets
+from concurrentdisjointsets import ConcurrentIntDisjointSets, parallel_union_all
+
+def locked_union_all(forest, lock, pairs) :
+    for x, y in pairs :
+        with lock :
+            forest.union(x, y)
+
+def time_threads(target, args_per_thread) :
+    threads = [Thread(target=target, args=args) for args in args_per_thread]
+    start = perf_counter()
+    for t in threads :
+        t.start()
+    for t in threads :
+        t.join()
+    return perf_counter() - start
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    m = n * (int(sys.argv[2]) if len(sys.argv) > 2 else 2)
+    seed(0)
+    pairs = [(randrange(n), randrange(n)) for i in range(m)]
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print("{0} elements, {1} random unions, {2} processors".format(n, m, os.cpu_count()))
+    print("{0:40}{1:>10}{2:>16}".format("method", "time (s)", "unions/s"))
+    def report(name, seconds) :
+        print("{0:40}{1:10.3f}{2:16.0f}".format(name, seconds, m / seconds))
+    forest = IntDisjointSets(n)
+    start = perf_counter()
+    forest.union_all(pairs)
+    report("sequential IntDisjointSets", perf_counter() - start)
+    for k in counts :
+        forest = IntDisjointSets(n)
+        lock = Lock()
+        report("{0} threads, global lock".format(k), time_threads(locked_union_all, [(forest, lock, pairs[i::k]) for i in range(k)]))
+    for k in counts :
+        forest = ConcurrentIntDisjointSets(n)
+        report("{0} threads, ConcurrentIntDisjointSets".format(k), time_threads(forest.union_all, [(pairs[i::k],) for i in range(k)]))
+    for k in counts :
+        start = perf_counter()
+        parallel_union_all(n, pairs, k)
+        report("{0} processes, parallel_union_all".format(k), perf_counter() - start)
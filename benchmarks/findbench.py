@@ -0,0 +1,51 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compares find throughput of the path compression, path halving, and path splitting
+# strategies of DisjointSets and IntDisjointSets.
+#
+# Usage: python findbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import randrange, seed
+from disjointsets import DisjointSets, IntDisjointSets
+
+def time_ops(forest, unions, finds) :
+    start = perf_counter()
+    for x, y in unions :
+        forest.union(x, y)
+    middle = perf_counter()
+    for x in finds :
+        forest.find_set(x)
+    end = perf_counter()
+    return middle - start, end - middle
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    seed(0)
+    unions = [(randrange(n), randrange(n)) for i in range(n)]
+    finds = [randrange(n) for i in range(n)]
+    print("{0} elements, {0} random unions, then {0} random finds".format(n))
+    print("{0:16}{1:14}{2:>12}{3:>12}{4:>16}".format("class", "strategy", "union (s)", "find (s)", "finds/s"))
+    for cls in (DisjointSets, IntDisjointSets) :
+        for strategy in ("compression", "halving", "splitting") :
+            union_time, find_time = time_ops(cls(n, strategy), unions, finds)
+            print("{0:16}{1:14}{2:12.3f}{3:12.3f}{4:16.0f}".format(cls.__name__, strategy, union_time, find_time, n / find_time))
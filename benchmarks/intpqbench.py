@@ -0,0 +1,64 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares IntPQ with PQ for integer elements and float priorities: the memory used by a PQ
+# of all of the elements, and the time to build it, to decrease priorities, and to extract
+# all elements.
+#
+# Usage: python intpqbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+import tracemalloc
+from time import perf_counter
+from random import random, randrange, seed
+from pq import PQ, IntPQ
+
+def run(make, n) :
+    seed(0)
+    pairs = [(i, random()) for i in range(n)]
+    decreases = [(randrange(n), random()) for i in range(n)]
+    times = []
+    tracemalloc.start()
+    start = perf_counter()
+    q = make(n, pairs)
+    times.append(perf_counter() - start)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    change = q.change_priority
+    get_priority = q.get_priority
+    start = perf_counter()
+    for e, scale in decreases :
+        change(e, get_priority(e) * scale)
+    times.append(perf_counter() - start)
+    extract_min = q.extract_min
+    start = perf_counter()
+    while not q.is_empty() :
+        extract_min()
+    times.append(perf_counter() - start)
+    return memory, times
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{0} elements".format(n))
+    print("{0:8}{1:>16}{2:>12}{3:>14}{4:>14}".format("", "bytes/element", "init (s)", "decrease (s)", "extract (s)"))
+    for name, make in (("PQ", lambda n, pairs : PQ(pairs)), ("IntPQ", IntPQ)) :
+        memory, times = run(make, n)
+        print("{0:8}{1:16.1f}{2:12.3f}{3:14.3f}{4:14.3f}".format(name, memory / n, *times))
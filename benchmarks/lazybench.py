@@ -0,0 +1,70 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares eager and lazy deletion in PQ, on workloads that remove random elements, or increase
+# the priorities of random elements, interleaved with extractions, and then extract the
+# remaining elements.
+#
+# Usage: python lazybench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, seed, shuffle
+from pq import PQ
+
+def removals(q, elements, increases) :
+    remove = q.remove
+    extract_min = q.extract_min
+    for j, i in enumerate(elements) :
+        remove(i)
+        if j % 4 == 0 :
+            extract_min()
+    while not q.is_empty() :
+        extract_min()
+
+def increases(q, elements, increases) :
+    change = q.change_priority
+    extract_min = q.extract_min
+    for j, i in enumerate(elements) :
+        change(i, increases[i])
+        if j % 4 == 0 and not q.is_empty() :
+            extract_min()
+    while not q.is_empty() :
+        extract_min()
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    seed(0)
+    priorities = [random() for i in range(n)]
+    raised = [p + random() for p in priorities]
+    elements = list(range(n))
+    shuffle(elements)
+    pairs = [(i, priorities[i]) for i in range(n)]
+    print("{0} elements".format(n))
+    print("{0:20}{1:>10}{2:>10}".format("workload", "eager", "lazy"))
+    for name, workload in (("remove", removals), ("increase priority", increases)) :
+        times = []
+        for lazy in (False, True) :
+            q = PQ(pairs, lazy_deletion=lazy)
+            start = perf_counter()
+            workload(q, elements[:n // 2], raised)
+            times.append(perf_counter() - start)
+        print("{0:20}{1:10.3f}{2:10.3f}".format(name, *times))
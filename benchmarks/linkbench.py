@@ -0,0 +1,88 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compares the union by rank, union by size, and randomized linking strategies of
+# DisjointSets and IntDisjointSets on random, chain, and star union sequences, reporting
+# the average find path length (depth) after the unions, and union and find throughput.
+#
+# Usage: python linkbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from array import array
+from time import perf_counter
+from random import randrange, seed
+from disjointsets import DisjointSets, IntDisjointSets
+
+def union_sequences(n) :
+    seed(0)
+    return [
+        ("random", [(randrange(n), randrange(n)) for i in range(n)]),
+        ("chain", [(i, i+1) for i in range(n-1)]),
+        ("star", [(0, i) for i in range(1, n)])
+    ]
+
+def parents(forest, n) :
+    if isinstance(forest, IntDisjointSets) :
+        return forest._parent
+    return [forest._nodes[i].p.data for i in range(n)]
+
+def average_depth(parent) :
+    depth = array('l', [-1]) * len(parent)
+    total = 0
+    for x in range(len(parent)) :
+        path = []
+        y = x
+        while depth[y] < 0 :
+            if parent[y] == y :
+                depth[y] = 0
+                break
+            path.append(y)
+            y = parent[y]
+        d = depth[y]
+        for z in reversed(path) :
+            d += 1
+            depth[z] = d
+        total += depth[x]
+    return total / len(parent)
+
+def time_ops(forest, unions, finds) :
+    start = perf_counter()
+    for x, y in unions :
+        forest.union(x, y)
+    middle = perf_counter()
+    depth = average_depth(parents(forest, len(finds)))
+    middle2 = perf_counter()
+    for x in finds :
+        forest.find_set(x)
+    end = perf_counter()
+    return depth, middle - start, end - middle2
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    # seeded apart from the union sequences, so every run times the same finds
+    seed(1)
+    finds = [randrange(n) for i in range(n)]
+    print("{0} elements, union sequence followed by {0} random finds".format(n))
+    print("{0:10}{1:16}{2:10}{3:>12}{4:>12}{5:>12}{6:>16}".format("sequence", "class", "linking", "avg depth", "union (s)", "find (s)", "finds/s"))
+    for name, unions in union_sequences(n) :
+        for cls in (DisjointSets, IntDisjointSets) :
+            for strategy in ("rank", "size", "random") :
+                depth, union_time, find_time = time_ops(cls(n, link_strategy=strategy), unions, finds)
+                print("{0:10}{1:16}{2:10}{3:12.3f}{4:12.3f}{5:12.3f}{6:16.0f}".format(name, cls.__name__, strategy, depth, union_time, find_time, n / find_time))
@@ -0,0 +1,83 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares PairingPQ with the binary heap PQ on a Dijkstra-like workload, which adds all elements,
+# then decreases priorities several times per extraction, and on a workload of adds and extractions
+# only.  Also times merging two PQs, which is O(1) for PairingPQ plus combining their dictionaries.
+#
+# Usage: python pairingbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, randrange, seed
+from pq import PQ
+from pairingheap import PairingPQ
+
+def decrease_heavy(cls, n, decreases) :
+    seed(0)
+    q = cls([(i, 1.0 + random()) for i in range(n)])
+    change = q.change_priority
+    contains = q.contains
+    get_priority = q.get_priority
+    extract_min = q.extract_min
+    while not q.is_empty() :
+        extract_min()
+        for i in range(decreases) :
+            e = randrange(n)
+            if contains(e) :
+                change(e, get_priority(e) * random())
+
+def add_extract(cls, n) :
+    seed(0)
+    q = cls()
+    add = q.add
+    extract_min = q.extract_min
+    for i in range(n) :
+        add(i, random())
+    while not q.is_empty() :
+        extract_min()
+
+def merge(cls, n) :
+    seed(0)
+    a = cls([(i, random()) for i in range(n)])
+    b = cls([(i, random()) for i in range(n, 2 * n)])
+    start = perf_counter()
+    a.merge(b)
+    return perf_counter() - start
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{0} elements".format(n))
+    print("{0:30}{1:>12}{2:>12}".format("workload", "PQ", "PairingPQ"))
+    for decreases in (1, 4, 16) :
+        times = []
+        for cls in (PQ, PairingPQ) :
+            start = perf_counter()
+            decrease_heavy(cls, n, decreases)
+            times.append(perf_counter() - start)
+        print("{0:30}{1:12.3f}{2:12.3f}".format("{0} decreases per extract".format(decreases), *times))
+    times = []
+    for cls in (PQ, PairingPQ) :
+        start = perf_counter()
+        add_extract(cls, n)
+        times.append(perf_counter() - start)
+    print("{0:30}{1:12.3f}{2:12.3f}".format("add, extract", *times))
+    print("{0:30}{1:12.3f}{2:12.3f}".format("merge", merge(PQ, n), merge(PairingPQ, n)))
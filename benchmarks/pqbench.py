@@ -0,0 +1,75 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Measures the throughput of the PQ operations add, change_priority, extract_min and remove,
+# and of MaxPQ's add and extract_max, on large heaps.
+#
+# Usage: python pqbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, seed, shuffle
+from pq import PQ, MaxPQ
+
+def timed(label, count, f, *args) :
+    start = perf_counter()
+    f(*args)
+    seconds = perf_counter() - start
+    print("{0:36}{1:10.3f}{2:16.0f}".format(label, seconds, count / seconds))
+
+def add_each(q, elements, priorities) :
+    add = q.add
+    for i in elements :
+        add(i, priorities[i])
+
+def change_each(q, elements, priorities) :
+    change = q.change_priority
+    for i in elements :
+        change(i, priorities[i])
+
+def extract_all(q, extract) :
+    for i in range(q.size()) :
+        extract()
+
+def remove_each(q, elements) :
+    remove = q.remove
+    for i in elements :
+        remove(i)
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    seed(0)
+    elements = list(range(n))
+    shuffle(elements)
+    priorities = [random() for i in range(n)]
+    decreased = [p * random() for p in priorities]
+    increased = [p + random() for p in priorities]
+    print("{0} elements".format(n))
+    print("{0:36}{1:>10}{2:>16}".format("operation", "time (s)", "ops/s"))
+    q = PQ()
+    timed("PQ.add", n, add_each, q, elements, priorities)
+    timed("PQ.change_priority (decrease)", n, change_each, q, elements, decreased)
+    timed("PQ.change_priority (increase)", n, change_each, q, elements, increased)
+    timed("PQ.extract_min", n, extract_all, q, q.extract_min)
+    q = PQ([(i, priorities[i]) for i in range(n)])
+    timed("PQ.remove", n, remove_each, q, elements)
+    q = MaxPQ()
+    timed("MaxPQ.add", n, add_each, q, elements, priorities)
+    timed("MaxPQ.extract_max", n, extract_all, q, q.extract_max)
@@ -0,0 +1,74 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares RadixPQ with the binary heap PQ and PairingPQ as the priority queue of Dijkstra's algorithm,
+# on random directed graphs with non-negative integer edge weights, for small and large maximum weights.
+#
+# Usage: python radixbench.py [number of vertices, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import randrange, seed
+from pq import PQ
+from pairingheap import PairingPQ
+from radixheap import RadixPQ
+
+def random_graph(n, degree, max_weight) :
+    seed(0)
+    return [[(randrange(n), randrange(max_weight + 1)) for j in range(degree)] for i in range(n)]
+
+def dijkstra(cls, graph, source) :
+    distances = {}
+    q = cls([(source, 0)])
+    contains = q.contains
+    get_priority = q.get_priority
+    change = q.change_priority
+    add = q.add
+    extract_min = q.extract_min
+    while not q.is_empty() :
+        v = q.peek_min()
+        d = get_priority(v)
+        extract_min()
+        distances[v] = d
+        for w, weight in graph[v] :
+            if w not in distances :
+                dw = d + weight
+                if contains(w) :
+                    if dw < get_priority(w) :
+                        change(w, dw)
+                else :
+                    add(w, dw)
+    return distances
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{0} vertices, out-degree 4".format(n))
+    print("{0:20}{1:>12}{2:>12}{3:>12}".format("max weight", "PQ", "PairingPQ", "RadixPQ"))
+    for max_weight in (10, 1000, 1000000) :
+        graph = random_graph(n, 4, max_weight)
+        times = []
+        results = []
+        for cls in (PQ, PairingPQ, RadixPQ) :
+            start = perf_counter()
+            results.append(dijkstra(cls, graph, 0))
+            times.append(perf_counter() - start)
+        assert results[0] == results[1] == results[2]
+        print("{0:<20}{1:12.3f}{2:12.3f}{3:12.3f}".format(max_weight, *times))
@@ -0,0 +1,83 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Compares the linear and binary search strategies for percolating elements up a PQ, counting
+# comparisons of priorities as well as timing, for adds with random priorities (where most
+# elements move only a level or two), adds with decreasing priorities (where every element
+# moves to the root), and decreases of priorities by random amounts.
+#
+# Usage: python siftupbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, seed
+from pq import PQ
+
+class Counted :
+    # a priority that counts how many times it is compared
+    __slots__ = ['value']
+    comparisons = 0
+
+    def __init__(self, value) :
+        self.value = value
+
+    def __lt__(self, other) :
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other) :
+        Counted.comparisons += 1
+        return self.value > other.value
+
+def workloads(n) :
+    seed(0)
+    randomPriorities = [random() for i in range(n)]
+    return [
+        ("add, random", randomPriorities, None),
+        ("add, decreasing", [float(n - i) for i in range(n)], None),
+        ("decrease, random", randomPriorities, [p * random() for p in randomPriorities])
+    ]
+
+def run(sift_up, priorities, decreases, wrap) :
+    q = PQ(sift_up=sift_up)
+    add = q.add
+    for i, p in enumerate(priorities) :
+        add(i, wrap(p))
+    if decreases is None :
+        return
+    change = q.change_priority
+    for i, p in enumerate(decreases) :
+        change(i, wrap(p))
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    print("{0} elements".format(n))
+    print("{0:20}{1:>8}{2:>16}{3:>14}{4:>22}".format("workload", "sift_up", "comparisons/op", "time (s)", "time, Counted (s)"))
+    for name, priorities, decreases in workloads(n) :
+        for sift_up in ("linear", "binary") :
+            start = perf_counter()
+            run(sift_up, priorities, decreases, float)
+            plain = perf_counter() - start
+            Counted.comparisons = 0
+            start = perf_counter()
+            run(sift_up, priorities, decreases, Counted)
+            counted = perf_counter() - start
+            ops = n if decreases is None else 2 * n
+            print("{0:20}{1:>8}{2:16.2f}{3:14.3f}{4:22.3f}".format(name, sift_up, Counted.comparisons / ops, plain, counted))
@@ -0,0 +1,70 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+# Compares ways of keeping the K least priorities of a stream with a MaxPQ: adding each
+# element and calling extract_max when the size exceeds K, a bounded MaxPQ's add, and a
+# bounded MaxPQ's offer, which rejects most elements of a long stream in O(1) time.
+#
+# Usage: python topkbench.py [number of elements, default 1000000]
+
+import sys
+sys.path.append('../lib')
+
+from time import perf_counter
+from random import random, seed
+from pq import MaxPQ
+
+def manual(stream, k) :
+    q = MaxPQ()
+    add = q.add
+    extract_max = q.extract_max
+    size = q.size
+    for i, v in enumerate(stream) :
+        add(i, v)
+        if size() > k :
+            extract_max()
+    return q
+
+def bounded_add(stream, k) :
+    q = MaxPQ(capacity=k)
+    add = q.add
+    for i, v in enumerate(stream) :
+        add(i, v)
+    return q
+
+def bounded_offer(stream, k) :
+    q = MaxPQ(capacity=k)
+    offer = q.offer
+    for i, v in enumerate(stream) :
+        offer(i, v)
+    return q
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    seed(0)
+    stream = [random() for i in range(n)]
+    print("{0} elements".format(n))
+    print("{0:>8}{1:>12}{2:>14}{3:>16}".format("K", "manual", "bounded add", "bounded offer"))
+    for k in (10, 1000, 100000) :
+        times = []
+        for method in (manual, bounded_add, bounded_offer) :
+            start = perf_counter()
+            method(stream, k)
+            times.append(perf_counter() - start)
+        print("{0:8}{1:12.3f}{2:14.3f}{3:16.3f}".format(k, *times))
@@ -0,0 +1,233 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+class BucketPQ :
+    """A Priority Queue (PQ) of small non-negative integer priorities, implemented with a bucket queue.
+
+    A bucket queue, as in Dial's algorithm for shortest paths, has one bucket for each of the priorities
+    0..levels-1, with each bucket holding the elements of that priority.  A python dictionary maps each element
+    to its priority, and each bucket is also a dictionary (with elements as its keys), so an element is added,
+    moved to another bucket, or removed in O(1) time.  A cursor is kept at or below the least non-empty bucket,
+    and extract_min moves it up past the empty buckets.  Adding an element with a priority below the cursor
+    moves the cursor back down to it.  Elements of equal priority are extracted in last in, first out order.
+
+    Priorities must be integers in the interval [0..levels-1], otherwise a ValueError is raised.
+
+    Elements must be of a hashable type (due to use of Python dictionary).  However, be careful
+    when mutating state of an element that is already in the PQ, and don't change any element property
+    that is used in generating the hash or else you will break the PQ.
+
+    Assuming a PQ with N elements, and priorities in [0..C-1], the runtimes of the operations are as follows.
+
+    The following operations run in O(1) time: add, change_priority, remove, contains, get_priority, size,
+    is_empty.
+
+    The following operations run in O(1) amortized time when the priorities extracted never decrease, as in
+    Dial's algorithm, and otherwise in O(C) time: extract_min, peek_min.  In either case, a sequence of operations
+    takes O(C) time in total to move the cursor, plus the distance the cursor is moved back down by adds.
+
+    The following operations run in O(N + C) time: __init__ to initialize PQ with a list of N (element, value) pairs.
+
+    The add_all and merge methods run in O(k) time where k is the number of new elements.
+    """
+
+    __slots__ = ['_buckets', '_index', '_cursor']
+
+    def __init__(self, levels, pairs=[]) :
+        """Initialize a PQ with priorities in interval [0..levels-1].
+
+        PQ is empty is pairs is empty.  Otherwise, intialized to a bucket queue consisting of the
+        (element, value) pairs in pairs, excluding all but the first pair for each element.
+
+        Keyword arguments:
+        levels -- The priorities must be integers in the interval [0..levels-1].
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
+        """
+
+        if levels < 1 :
+            raise ValueError("levels must be at least 1")
+        self._buckets = [{} for i in range(levels)]
+        # priority of each element
+        self._index = {}
+        # no bucket below the cursor is non-empty
+        self._cursor = levels
+        self.add_all(pairs)
+
+
+    def size(self) :
+        """Size of the PQ."""
+
+        return len(self._index)
+
+
+    def is_empty(self) :
+        """Returns True if PQ is empty and False otherwise."""
+
+        return not self._index
+
+
+    def add(self, element, value) :
+        """Adds an element to the PQ with a specified priority.
+
+        Adds the element to the PQ provided PQ doesn't already contain it.
+        Does nothing if the PQ already contains the element.
+
+        Returns True if element added and False if already present.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The priority of the element, an integer in [0..levels-1].
+        """
+
+        index = self._index
+        if element in index :
+            return False
+        buckets = self._buckets
+        if not 0 <= value < len(buckets) :
+            raise ValueError("priority " + str(value) + " is not in [0.." + str(len(buckets) - 1) + "]")
+        buckets[value][element] = None
+        index[element] = value
+        if value < self._cursor :
+            self._cursor = value
+        return True
+
+
+    def add_all(self, pairs) :
+        """Adds (element, value) pairs to the PQ.
+
+        Adds the (element, value) pairs from pairs to the PQ.  Only the
+        pairs for which element is not already in the PQ are added, and for each element
+        only its first pair.
+
+        Keyword arguments:
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
+        """
+
+        add = self.add
+        for el,val in pairs :
+            add(el,val)
+
+
+    def merge(self, q) :
+        """Merges a BucketPQ into this PQ.
+
+        Adds all (element, value) pairs from a given BucketPQ to this PQ.  Only the
+        pairs for which element is not already in this PQ are added (duplicates are exluded).
+
+        Keyword arguments:
+        q -- A BucketPQ to merge with this one.  q is not changed.
+        """
+
+        if q is not self :
+            self.add_all(q._index.items())
+
+
+    def peek_min(self) :
+        """Returns, but does not remove, the element with the minimum priority value."""
+
+        return next(reversed(self._min_bucket()))
+
+
+    def extract_min(self) :
+        """Removes and returns the element with minimum priority value."""
+
+        element = self._min_bucket().popitem()[0]
+        del self._index[element]
+        return element
+
+
+    def contains(self, element) :
+        """Returns True if element is in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element
+        """
+
+        return element in self._index
+
+
+    def get_priority(self, element) :
+        """Gets the current priority of the specified element.
+
+        Keyword arguments:
+        element -- The element
+        """
+
+        return self._index[element]
+
+
+    def change_priority(self, element, value) :
+        """Changes the priority of an element in the PQ.
+
+        Changes the priority of an element that is in the PQ.
+        Does nothing if the PQ doesn't contains the element.
+
+        Returns True if element is present in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The new priority for the element, an integer in [0..levels-1].
+        """
+
+        index = self._index
+        old = index.get(element)
+        if old is None :
+            return False
+        buckets = self._buckets
+        if not 0 <= value < len(buckets) :
+            raise ValueError("priority " + str(value) + " is not in [0.." + str(len(buckets) - 1) + "]")
+        if value != old :
+            del buckets[old][element]
+            buckets[value][element] = None
+            index[element] = value
+            if value < self._cursor :
+                self._cursor = value
+        return True
+
+
+    def remove(self, element) :
+        """Removes a specified element from the PQ.
+
+        Removes a specified element from the PQ, if it is present.
+        Returns True if element removed, and False if not present in PQ.
+
+        Keyword arguments:
+        element -- The element to remove.
+        """
+
+        value = self._index.pop(element, None)
+        if value is None :
+            return False
+        del self._buckets[value][element]
+        return True
+
+
+    def _min_bucket(self) :
+        # moves the cursor up to the least non-empty bucket, and returns that bucket
+        buckets = self._buckets
+        cursor = self._cursor
+        bucket = buckets[cursor]
+        while not bucket :
+            cursor += 1
+            bucket = buckets[cursor]
+        self._cursor = cursor
+        return bucket
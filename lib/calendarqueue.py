@@ -0,0 +1,336 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+from bisect import bisect_left, insort
+from heapq import nsmallest
+from itertools import count
+from operator import itemgetter
+
+
+class CalendarPQ :
+    """A Priority Queue (PQ) implemented with a calendar queue, for discrete-event simulation.
+
+    A calendar queue, due to R. Brown (1988), works like a desk calendar: the priorities are divided into
+    days of a fixed width, and the days into years of as many days as there are buckets, with all of the
+    days that fall on the same day of the year sharing a bucket.  Each bucket is a sorted list of
+    (value, sequence number, element) entries, and a python dictionary maps each element to its entry.
+    extract_min starts at the bucket of the current day, and moves forward a day at a time until it finds a
+    bucket whose least entry falls on the current day, and if a whole year passes without one it searches
+    all buckets directly for the minimum.  Adding an element whose priority falls before the current day
+    moves the current day back to it.
+
+    The number of buckets doubles when the PQ grows to twice as many elements as buckets, and halves when it
+    shrinks to a quarter as many, and the day width is then recomputed as three times the average separation of
+    the priorities at the front of the PQ, so that each bucket holds a few elements of the current year.  With
+    priorities drawn from a typical event-time distribution, such as in the hold model of a simulation, which
+    extracts the next event and adds a new one at a random later time, each add and extract_min then takes
+    O(1) expected time.
+
+    Priorities may be any finite numbers, int or float.  A priority that isn't finite, such as float('inf'), has
+    no day on the calendar, so add and change_priority raise a ValueError for it, leaving the PQ unchanged.
+    Elements of equal priority are extracted in the order they were added (or last had their priority changed).
+
+    Elements must be of a hashable type (due to use of Python dictionary).  However, be careful
+    when mutating state of an element that is already in the PQ, and don't change any element property
+    that is used in generating the hash or else you will break the PQ.
+
+    Assuming a PQ with N elements, the runtimes of the operations are as follows.
+
+    The following operations run in O(1) expected time, with the occasional O(N) resizing amortized, for typical
+    distributions of priorities: add, extract_min, peek_min, change_priority, remove.
+
+    The following operations run in O(1) time: contains, get_priority, size, is_empty.
+
+    The following operations run in O(N) time: __init__ to initialize PQ with a list of N (element, value) pairs.
+
+    The add_all and merge methods run in O(k) expected time where k is the number of new elements.
+    """
+
+    __slots__ = ['_buckets', '_index', '_width', '_day', '_sequence']
+
+    def __init__(self, pairs=[]) :
+        """Initialize a PQ.
+
+        PQ is empty is pairs is empty.  Otherwise, intialized to a calendar queue consisting of the
+        (element, value) pairs in pairs, excluding all but the first pair for each element.
+
+        Keyword arguments:
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
+        """
+
+        self._buckets = [[] for i in range(_MIN_BUCKETS)]
+        self._index = {}
+        self._width = 1.0
+        # every element falls on the current day or later
+        self._day = 0
+        self._sequence = count()
+        self.add_all(pairs)
+
+
+    def size(self) :
+        """Size of the PQ."""
+
+        return len(self._index)
+
+
+    def is_empty(self) :
+        """Returns True if PQ is empty and False otherwise."""
+
+        return not self._index
+
+
+    def add(self, element, value) :
+        """Adds an element to the PQ with a specified priority.
+
+        Adds the element to the PQ provided PQ doesn't already contain it.
+        Does nothing if the PQ already contains the element.
+
+        Returns True if element added and False if already present.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The priority of the element.
+        """
+
+        index = self._index
+        if element in index :
+            return False
+        self._insert(element, value, self._day_of(value))
+        if len(index) > 2 * len(self._buckets) :
+            self._resize(2 * len(self._buckets))
+        return True
+
+
+    def add_all(self, pairs) :
+        """Adds (element, value) pairs to the PQ.
+
+        Adds the (element, value) pairs from pairs to the PQ.  Only the
+        pairs for which element is not already in the PQ are added, and for each element
+        only its first pair.
+
+        Keyword arguments:
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
+        """
+
+        add = self.add
+        for el,val in pairs :
+            add(el,val)
+
+
+    def merge(self, q) :
+        """Merges a CalendarPQ into this PQ.
+
+        Adds all (element, value) pairs from a given CalendarPQ to this PQ.  Only the
+        pairs for which element is not already in this PQ are added (duplicates are exluded).
+
+        Keyword arguments:
+        q -- A CalendarPQ to merge with this one.  q is not changed.
+        """
+
+        if q is not self :
+            self.add_all((e, entry[0]) for e, entry in q._index.items())
+
+
+    def peek_min(self) :
+        """Returns, but does not remove, the element with the minimum priority value.
+
+        Raises IndexError if the PQ is empty, as PQ does.
+        """
+
+        return self._min_bucket()[0][2]
+
+
+    def extract_min(self) :
+        """Removes and returns the element with minimum priority value.
+
+        Raises IndexError if the PQ is empty, as PQ does.
+        """
+
+        element = self._min_bucket().pop(0)[2]
+        index = self._index
+        del index[element]
+        if len(self._buckets) > _MIN_BUCKETS and 4 * len(index) < len(self._buckets) :
+            self._resize(len(self._buckets) // 2)
+        return element
+
+
+    def contains(self, element) :
+        """Returns True if element is in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element
+        """
+
+        return element in self._index
+
+
+    def get_priority(self, element) :
+        """Gets the current priority of the specified element.
+
+        Keyword arguments:
+        element -- The element
+        """
+
+        return self._index[element][0]
+
+
+    def change_priority(self, element, value) :
+        """Changes the priority of an element in the PQ.
+
+        Changes the priority of an element that is in the PQ.
+        Does nothing if the PQ doesn't contains the element.
+
+        Returns True if element is present in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The new priority for the element.
+        """
+
+        entry = self._index.get(element)
+        if entry is None :
+            return False
+        day = self._day_of(value)
+        self._delete(entry)
+        self._insert(element, value, day)
+        return True
+
+
+    def remove(self, element) :
+        """Removes a specified element from the PQ.
+
+        Removes a specified element from the PQ, if it is present.
+        Returns True if element removed, and False if not present in PQ.
+
+        Keyword arguments:
+        element -- The element to remove.
+        """
+
+        index = self._index
+        entry = index.pop(element, None)
+        if entry is None :
+            return False
+        self._delete(entry)
+        if len(self._buckets) > _MIN_BUCKETS and 4 * len(index) < len(self._buckets) :
+            self._resize(len(self._buckets) // 2)
+        return True
+
+
+    def _day_of(self, value) :
+        # the day of priority value, which is computed before adding it to the PQ, since it fails for a value
+        # that isn't finite (or is an int too large for a float)
+        try :
+            return int(value // self._width)
+        except OverflowError :
+            if abs(value) > _MAX_FLOAT :
+                raise ValueError("priority must be a finite number: " + repr(value)) from None
+        except ValueError :
+            raise ValueError("priority must be a finite number: " + repr(value)) from None
+        # value is so far from the current day width that its day doesn't fit in a float, so the
+        # calendar is rebuilt with days wide enough for it
+        self._rebuild(len(self._buckets), abs(value) / _MAX_DAYS)
+        return int(value // self._width)
+
+
+    def _insert(self, element, value, day) :
+        # inserts an entry for element, whose priority value falls on day, into its bucket, moving the
+        # current day back if it is later than that day
+        entry = (value, next(self._sequence), element)
+        self._index[element] = entry
+        buckets = self._buckets
+        insort(buckets[day & (len(buckets) - 1)], entry)
+        if day < self._day :
+            self._day = day
+
+
+    def _delete(self, entry) :
+        # deletes entry from its bucket
+        buckets = self._buckets
+        bucket = buckets[int(entry[0] // self._width) & (len(buckets) - 1)]
+        del bucket[bisect_left(bucket, entry)]
+
+
+    def _min_bucket(self) :
+        # moves the current day forward to the day of the minimum, and returns its bucket
+        if not self._index :
+            raise IndexError("peek_min or extract_min from an empty PQ")
+        buckets = self._buckets
+        mask = len(buckets) - 1
+        width = self._width
+        day = self._day
+        for i in range(len(buckets)) :
+            bucket = buckets[day & mask]
+            if bucket and bucket[0][0] // width <= day :
+                self._day = day
+                return bucket
+            day += 1
+        # a year without an element on its day, so search directly for the earliest element
+        bucket = min((b for b in buckets if b), key=itemgetter(0))
+        self._day = int(bucket[0][0] // width)
+        return bucket
+
+
+    def _resize(self, n) :
+        # redistributes the entries into n buckets, with a day width estimated from the entries at the front
+        entries = (entry for bucket in self._buckets for entry in bucket)
+        sample = [entry[0] for entry in nsmallest(_SAMPLE_SIZE, entries)]
+        separations = [b - a for a, b in zip(sample, sample[1:])]
+        width = None
+        if separations :
+            # separations more than twice the average are excluded as outliers
+            average = sum(separations) / len(separations)
+            separations = [s for s in separations if s <= 2 * average]
+            average = sum(separations) / len(separations)
+            if average > 0 :
+                width = 3 * average
+        self._rebuild(n, width)
+
+
+    def _rebuild(self, n, width) :
+        # redistributes the entries into n buckets of days of the given width, or of the current width
+        # if width is None, or is so small that a far off priority has no day that fits in a float
+        entries = [entry for bucket in self._buckets for entry in bucket]
+        days = None
+        if width is not None :
+            try :
+                days = [int(entry[0] // width) for entry in entries]
+            except OverflowError :
+                pass
+        if days is None :
+            width = self._width
+            days = [int(entry[0] // width) for entry in entries]
+        mask = n - 1
+        buckets = [[] for i in range(n)]
+        for entry, d in zip(entries, days) :
+            buckets[d & mask].append(entry)
+        for bucket in buckets :
+            bucket.sort()
+        self._width = width
+        self._buckets = buckets
+        self._day = min(days, default=0)
+
+
+_MIN_BUCKETS = 2
+_SAMPLE_SIZE = 25
+_MAX_FLOAT = sys.float_info.max
+# days of a width that a rebuild for a far off priority makes, between 0 and that priority
+_MAX_DAYS = 2.0 ** 64
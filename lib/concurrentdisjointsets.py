@@ -0,0 +1,184 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+from threading import Lock
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from disjointsets import IntDisjointSets
+
+
+class ConcurrentIntDisjointSets(IntDisjointSets) :
+    """Disjoint Set Forests over a dense integer universe that can be shared by multiple threads.
+
+    Disjoint sets of the integers in the range [0..size-1], with the same methods as IntDisjointSets,
+    where union, union_all, find_set, find_all, in_set and same_set_all may be called concurrently
+    from multiple threads without any external locking.
+
+    Finds take no locks.  Shortening a path during a find only ever points an element that is not a
+    root to one of its ancestors, so concurrent finds and unions never disagree about which sets
+    exist.  Unions use lock striping over roots: the roots of the two sets are found without locks,
+    then the locks of the stripes of the two roots are acquired (in a fixed order, to avoid deadlock),
+    and the two trees are linked only if both are still roots, retrying otherwise.  Unions of
+    unrelated sets thus rarely contend for the same lock.
+
+    Methods that examine the whole forest, such as to_labels and snapshot, should not be called while
+    other threads are performing unions.
+    """
+
+    __slots__ = ["_locks", "_unions"]
+
+    def __init__(self, size, find_strategy="compression", link_strategy="rank", stripes=64) :
+        """Initializes disjoint set forest of the integers in interval [0..size-1].
+
+        Keyword arguments:
+        size -- number of elements in disjoint set forest.
+        find_strategy -- how paths are shortened during finds: "compression" (the default), "halving",
+                or "splitting".  See DisjointSets for details.
+        link_strategy -- how the roots of two trees are linked during a union: "rank" (the default), "size",
+                or "random".  See DisjointSets for details.
+        stripes -- the number of locks, where the lock guarding a root r is the one with index r % stripes.
+        """
+
+        super().__init__(size, find_strategy, link_strategy)
+        self._locks = [Lock() for i in range(stripes)]
+        # number of unions performed while holding each stripe's lock, so that the
+        # count of sets can be maintained without a global lock
+        self._unions = [0] * stripes
+
+
+    def union(self, x, y) :
+        """Computes the union of the sets containing x and y.  Safe to call from multiple threads.
+
+        Keyword arguments:
+        x -- an element
+        y -- an element
+        """
+
+        find = self._find
+        parent = self._parent
+        locks = self._locks
+        stripes = len(locks)
+        while True :
+            rx = find(x)
+            ry = find(y)
+            if rx == ry :
+                return
+            first, second = sorted((rx % stripes, ry % stripes))
+            locks[first].acquire()
+            if second != first :
+                locks[second].acquire()
+            try :
+                if parent[rx] == rx and parent[ry] == ry :
+                    self._link(rx, ry)
+                    return
+            finally :
+                if second != first :
+                    locks[second].release()
+                locks[first].release()
+
+
+    def union_all(self, pairs) :
+        """Computes the union of the sets containing x and y, for each pair (x, y) in pairs.
+
+        Safe to call from multiple threads.
+
+        Keyword arguments:
+        pairs -- an iterable of 2-tuples (x, y) of elements
+        """
+
+        union = self.union
+        for x, y in pairs :
+            union(x, y)
+
+
+    def num_sets(self) :
+        """Returns the number of disjoint sets in the forest."""
+
+        return self._num_sets - sum(self._unions)
+
+
+    def _find_set(self, x) :
+        # full path compression, pointing only the elements on the path found by the first pass to the
+        # root, since another thread may concurrently have pointed some of them beyond that root
+        parent = self._parent
+        if not 0 <= x < len(parent) :
+            raise KeyError(x)
+        path = []
+        while parent[x] != x :
+            path.append(x)
+            x = parent[x]
+        for y in path :
+            parent[y] = x
+        return x
+
+    def _attach(self, child, root) :
+        # caller holds the locks of the stripes of both child and root
+        self._parent[child] = root
+        self._size[root] += self._size[child]
+        following = self._next
+        following[child], following[root] = following[root], following[child]
+        self._unions[root % len(self._unions)] += 1
+
+
+
+
+def parallel_union_all(size, pairs, workers=None, find_strategy="compression", link_strategy="rank") :
+    """Computes the disjoint sets of the integers in [0..size-1] formed by the unions of a list of pairs, in parallel.
+
+    Partitions the pairs into one chunk per worker process.  Each worker builds its own forest from
+    its chunk, and returns only the pairs that linked two of its trees, of which there are at most
+    size-1.  These are then merged into a single forest, which is returned.  Since a worker's forest
+    reaches the same partition as its whole chunk, the result is the same as from a single forest.
+
+    Keyword arguments:
+    size -- number of elements in the disjoint set forest.
+    pairs -- a list of 2-tuples (x, y) of elements.
+    workers -- number of worker processes.  Defaults to the number of processors.  If 1, no processes
+            are started.
+    find_strategy -- the find strategy of the resulting IntDisjointSets.
+    link_strategy -- the link strategy of the resulting IntDisjointSets.
+    """
+
+    forest = IntDisjointSets(size, find_strategy, link_strategy)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pairs) == 0 :
+        forest.union_all(pairs)
+        return forest
+    chunk = -(-len(pairs) // workers)
+    chunks = [(size, pairs[i:i+chunk]) for i in range(0, len(pairs), chunk)]
+    with ProcessPoolExecutor(workers) as executor :
+        for linked in executor.map(_spanning_pairs, chunks) :
+            forest.union_all(zip(linked[0::2], linked[1::2]))
+    return forest
+
+def _spanning_pairs(task) :
+    # worker for parallel_union_all: the pairs of a chunk that link two trees, flattened into an array
+    size, pairs = task
+    forest = IntDisjointSets(size)
+    find = forest._find
+    link = forest._link
+    linked = array(forest._parent.typecode)
+    for x, y in pairs :
+        rx = find(x)
+        ry = find(y)
+        if rx != ry :
+            link(rx, ry)
+            linked.append(x)
+            linked.append(y)
+    return linked
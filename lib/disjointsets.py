@@ -16,6 +16,11 @@
 ##  You should have received a copy of the GNU General Public License
 ##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+import pickle
+import struct
+import sys
+
 
 class DisjointSets :
     """Disjoint Set Forests: Representation of disjoint sets.
@@ -24,12 +29,22 @@ class DisjointSets :
     If any size>1 passed to initializer, then
     initialized to disjoint sets of integers in the range [0..size-1].
     This implementation uses both the union by rank heuristic, as well as
-    path compression.
+    path compression.  Finds are iterative, and the strategy used to shorten paths
+    during a find (full compression, path halving, or path splitting) can be chosen
+    when the forest is created, as can the heuristic used to link two trees during a
+    union (union by rank, union by size, or randomized linking by index).
+
+    The size of each set is maintained at its root, and the members of each set are
+    threaded on a circular linked list, so set_size and num_sets run in O(1) time
+    (plus the find), and members runs in time linear in the size of the set.
+
+    A lazy forest treats every element not yet in the forest as a singleton set, adding
+    it on first use, so that the universe need not be registered before unions begin.
     """
 
-    __slots__ = ["_nodes"]
+    __slots__ = ["_nodes", "_find", "_link", "_num_unions"]
 
-    def __init__(self, size=0) :
+    def __init__(self, size=0, find_strategy="compression", link_strategy="rank", lazy=False) :
         """Initializes disjoint set forest.
 
         If size is 0, initialized to empty forest.  Use make_set to add singleton sets to forest.
@@ -41,11 +56,25 @@ class DisjointSets :
         Keyword arguments:
         size -- number of elements in disjoint set forest.  If size>0, the elements are integers from 0 to size-1.
                 If size = 0, it is an empty forest to which you can add any hashable type.
+        find_strategy -- how paths are shortened during finds: "compression" (the default) resets every node
+                on the path to point directly to the root; "halving" resets every other node on the path to
+                point to its grandparent; "splitting" resets every node on the path to point to its grandparent.
+                Halving and splitting need only a single pass over the path.
+        link_strategy -- how the roots of two trees are linked during a union: "rank" (the default) makes the
+                root of lower rank a child of the other; "size" makes the root of the smaller set a child of
+                the other; "random" makes the root with the lower pseudorandom index (derived from the hash
+                of the element) a child of the other, needing no rank or size comparisons.
+        lazy -- if True, any element passed to union, find_set, or any other method taking elements, other than
+                in_forest, that is not yet in the forest is first added to the forest as a singleton set.
+                If False (the default), such elements raise a KeyError.
         """
 
-        self._nodes = {}
-        for i in range(size) :
-            self.make_set(i)
+        self._find = _strategy_method(self, _FIND_STRATEGIES, "find_strategy", find_strategy)
+        self._link = _strategy_method(self, _LINK_STRATEGIES, "link_strategy", link_strategy)
+        self._nodes = _LazyNodes() if lazy else {}
+        # number of sets is the number of elements less the number of unions that linked two trees
+        self._num_unions = 0
+        self.make_sets(range(size))
 
 
     def make_set(self,x) :
@@ -56,26 +85,37 @@ class DisjointSets :
         x -- an element of any hashable type
         """
 
-        n = _DJSetNode()
-        n.data = x
-        n.p = n
-        n.rank = 0
-        self._nodes[x] = n
+        self._nodes[x] = _singleton(x)
+
+
+    def make_sets(self, elements) :
+        """Creates a singleton set for each of a sequence of elements, adding the sets to forest.
+
+        Equivalent to calling make_set on each element in turn, but faster.
+
+        Keyword arguments:
+        elements -- an iterable of elements of any hashable type
+        """
+
+        nodes = self._nodes
+        singleton = _singleton
+        for x in elements :
+            nodes[x] = singleton(x)
         
 
     def union(self,x,y) :
         """Computes the union of the sets containing x and y.
 
-        Uses union by rank heuristic in computing union of sets containing x and y.
-        the "shorter" tree is added as child of "taller" tree.  Though heights are
-        approximate since ranks are upper bounds only.
+        Uses the forest's linking heuristic in computing union of sets containing x and y.
+        By default, this is union by rank, where the "shorter" tree is added as child of
+        "taller" tree.  Though heights are approximate since ranks are upper bounds only.
 
         Keyword arguments:
         x -- an element
         y -- an element
         """
 
-        self._link(self._find_set(self._nodes[x]), self._find_set(self._nodes[y]))
+        self._link(self._find(self._nodes[x]), self._find(self._nodes[y]))
 
 
     def find_set(self,x) :
@@ -94,7 +134,7 @@ class DisjointSets :
         x -- the element whose set we want to find
         """
         
-        return self._find_set(self._nodes[x]).data
+        return self._find(self._nodes[x]).data
 
 
 
@@ -116,29 +156,700 @@ class DisjointSets :
         s -- a representative member of the set we're checking.
         """
 
-        return self._find_set(self._nodes[x]) == self._find_set(self._nodes[s])
+        return self._find(self._nodes[x]) == self._find(self._nodes[s])
+
+
+    def union_all(self, pairs) :
+        """Computes the union of the sets containing x and y, for each pair (x, y) in pairs.
+
+        Equivalent to calling union on each pair in turn, but processes the pairs in a single pass.
+
+        Keyword arguments:
+        pairs -- an iterable of 2-tuples (x, y) of elements
+        """
+
+        nodes = self._nodes
+        find = self._find
+        link = self._link
+        for x, y in pairs :
+            link(find(nodes[x]), find(nodes[y]))
+
+
+    def find_all(self, elements) :
+        """Finds the set for each of a sequence of elements, performing path compression.
+
+        Returns a list of the representative members of the sets of the elements, in the same order
+        as the elements.  Equivalent to calling find_set on each element in turn.
+
+        Keyword arguments:
+        elements -- an iterable of elements
+        """
+
+        nodes = self._nodes
+        find = self._find
+        return [find(nodes[x]).data for x in elements]
+
+
+    def same_set_all(self, pairs) :
+        """Checks, for each pair (x, y) in pairs, whether x and y are in the same set.
+
+        Returns a list of booleans in the same order as the pairs.  Equivalent to calling
+        in_set on each pair in turn.
+
+        Keyword arguments:
+        pairs -- an iterable of 2-tuples (x, y) of elements
+        """
+
+        nodes = self._nodes
+        find = self._find
+        return [find(nodes[x]) is find(nodes[y]) for x, y in pairs]
+
+
+    def num_sets(self) :
+        """Returns the number of disjoint sets in the forest."""
+
+        return len(self._nodes) - self._num_unions
+
+
+    def set_size(self, x) :
+        """Returns the number of elements in the set containing x.
+
+        Keyword arguments:
+        x -- an element
+        """
+
+        return self._find(self._nodes[x]).size
+
+
+    def members(self, x) :
+        """Returns a list of the elements in the set containing x.
+
+        Runs in time linear in the size of the set, independent of the size of the forest.
+        The order of the list is unspecified, other than that x is first.
+
+        Keyword arguments:
+        x -- an element
+        """
+
+        start = self._nodes[x]
+        result = [x]
+        n = start.next
+        while n is not start :
+            result.append(n.data)
+            n = n.next
+        return result
+
+
+    def to_labels(self) :
+        """Returns a dict mapping every element of the forest to the id of its set.
+
+        Set ids are the integers from 0 to num_sets()-1, numbered in the order in which the first
+        element of each set was added to the forest.  Fully compresses every path in the forest,
+        regardless of the forest's find strategy.
+        """
+
+        find = self._find_set
+        first = {}
+        labels = {}
+        for x, n in self._nodes.items() :
+            root = find(n)
+            if root not in first :
+                first[root] = len(first)
+            labels[x] = first[root]
+        return labels
+
+
+    def snapshot(self, f) :
+        """Writes a binary snapshot of the forest to a file, from which it can be restored with restore.
+
+        The forest's structure, including its find and link strategies, is written as compact arrays
+        of integers, and the elements themselves are pickled.
+
+        Keyword arguments:
+        f -- a file object opened for writing in binary mode
+        """
+
+        nodes = self._nodes
+        index = {x : i for i, x in enumerate(nodes)}
+        typecode = _index_typecode(len(nodes))
+        parent = array(typecode, [index[n.p.data] for n in nodes.values()])
+        rank = array('B', [n.rank for n in nodes.values()])
+        size = array(typecode, [n.size for n in nodes.values()])
+        following = array(typecode, [index[n.next.data] for n in nodes.values()])
+        _write_snapshot(f, _SNAPSHOT_DISJOINT_SETS, self, isinstance(nodes, _LazyNodes), self.num_sets(), parent, rank, size, following)
+        pickle.dump(list(nodes), f, pickle.HIGHEST_PROTOCOL)
+
+
+    @classmethod
+    def restore(cls, f) :
+        """Reads a forest from a binary snapshot written by snapshot.
+
+        Since the elements are pickled, only restore snapshots from trusted sources.
+
+        Keyword arguments:
+        f -- a file object opened for reading in binary mode
+        """
+
+        find_strategy, link_strategy, lazy, num_sets, parent, rank, size, following = _read_snapshot(f, _SNAPSHOT_DISJOINT_SETS)
+        elements = pickle.load(f)
+        forest = cls()
+        forest._find = _strategy_method(forest, _FIND_STRATEGIES, "find_strategy", find_strategy)
+        forest._link = _strategy_method(forest, _LINK_STRATEGIES, "link_strategy", link_strategy)
+        if lazy :
+            forest._nodes = _LazyNodes()
+        new_node = _DJSetNode
+        created = [new_node() for x in elements]
+        nodes = forest._nodes
+        for i, x in enumerate(elements) :
+            n = created[i]
+            n.data = x
+            n.p = created[parent[i]]
+            n.rank = rank[i]
+            n.size = size[i]
+            n.next = created[following[i]]
+            nodes[x] = n
+        forest._num_unions = len(elements) - num_sets
+        return forest
         
 
     def _find_set(self, nx) :
-        # perform path compression during the find
-        if nx != nx.p :
-            nx.p = self._find_set(nx.p)
-        return nx.p
+        # full path compression: locate the root, then point every node on the path directly to it
+        root = nx
+        while root.p is not root :
+            root = root.p
+        while nx.p is not root :
+            nx.p, nx = root, nx.p
+        return root
+
+    def _find_set_halving(self, nx) :
+        # path halving: every other node on the path is pointed to its grandparent
+        while nx.p is not nx :
+            nx.p = nx.p.p
+            nx = nx.p
+        return nx
+
+    def _find_set_splitting(self, nx) :
+        # path splitting: every node on the path is pointed to its grandparent
+        while nx.p is not nx :
+            nx.p, nx = nx.p.p, nx.p
+        return nx
         
         
-    def _link(self, nx, ny) :
+    def _link_by_rank(self, nx, ny) :
         # union by rank heuristic: attach approximately "shorter" tree as child of approximately "taller" tree
+        if nx is ny :
+            return
         if nx.rank > ny.rank :
-            ny.p = nx
-        else :
-            nx.p = ny
-            if nx.rank == ny.rank :
-                ny.rank  = ny.rank  + 1
+            nx, ny = ny, nx
+        # rank is updated after attaching, so that _attach sees the root's prior rank
+        self._attach(nx, ny)
+        if nx.rank == ny.rank :
+            ny.rank  = ny.rank  + 1
+
+    def _link_by_size(self, nx, ny) :
+        # union by size heuristic: attach tree with fewer nodes as child of tree with more nodes
+        if nx is ny :
+            return
+        if nx.size > ny.size :
+            nx, ny = ny, nx
+        self._attach(nx, ny)
+
+    def _link_randomly(self, nx, ny) :
+        # randomized linking by index: attach root with lower pseudorandom index as child of the other
+        if nx is ny :
+            return
+        if _scramble(hash(nx.data)) > _scramble(hash(ny.data)) :
+            nx, ny = ny, nx
+        self._attach(nx, ny)
+
+    def _attach(self, child, root) :
+        child.p = root
+        root.size += child.size
+        # splice the two circular member lists together
+        child.next, root.next = root.next, child.next
+        self._num_unions += 1
 
 
 
 
 
 class _DJSetNode :
-    __slots__ = ['data','p','rank']
+    __slots__ = ['data','p','rank','size','next']
+
+
+class _LazyNodes(dict) :
+    # node dictionary of a lazy forest: looking up a missing element adds it as a singleton set
+    __slots__ = []
+
+    def __missing__(self, x) :
+        n = self[x] = _singleton(x)
+        return n
+
+
+
+
+class RollbackDisjointSets(DisjointSets) :
+    """Disjoint Set Forests with undo: Representation of disjoint sets whose unions can be rolled back.
+
+    Disjoint sets of any hashable type represented as disjoint set forest, with the same
+    methods as DisjointSets, plus checkpoint and rollback.  Every union that links two trees is
+    recorded in a change log, and rollback undoes unions in reverse order, each in O(1) time.
+    This supports offline dynamic connectivity and backtracking search without rebuilding the
+    forest.  To keep each union reversible, finds never perform path compression (nor halving or
+    splitting), so the forest relies on its linking heuristic alone (union by rank by default,
+    or union by size) to keep finds O(lg N).
+
+    Rollback undoes unions only.  Elements added with make_set, or added implicitly by a lazy
+    forest, remain in the forest as singleton sets once the unions involving them are undone.
+    """
+
+    __slots__ = ["_log"]
+
+    def __init__(self, size=0, link_strategy="rank", lazy=False) :
+        """Initializes disjoint set forest.
+
+        Keyword arguments:
+        size -- number of elements in disjoint set forest.  If size>0, the elements are integers from 0 to size-1.
+                If size = 0, it is an empty forest to which you can add any hashable type.
+        link_strategy -- how the roots of two trees are linked during a union: "rank" (the default), "size",
+                or "random".  See DisjointSets for details.
+        lazy -- if True, elements not yet in the forest are added as singleton sets on first use.
+                See DisjointSets for details.
+        """
+
+        super().__init__(size, "compression", link_strategy, lazy)
+        self._log = []
+
+
+    def checkpoint(self) :
+        """Returns a checkpoint, which can later be passed to rollback to undo all unions since this call."""
+
+        return len(self._log)
+
+
+    def rollback(self, to=0) :
+        """Undoes all unions since a checkpoint, restoring the sets as they were when the checkpoint was taken.
+
+        Runs in time linear in the number of unions undone.  Checkpoints taken after the given checkpoint
+        become invalid, but earlier checkpoints remain valid.
+
+        Keyword arguments:
+        to -- a checkpoint returned by the checkpoint method.  If 0 (the default), undoes every union.
+        """
+
+        log = self._log
+        if to < 0 or to > len(log) :
+            raise ValueError("invalid checkpoint: already rolled back beyond it")
+        while len(log) > to :
+            child, root, rank = log.pop()
+            child.p = child
+            root.size -= child.size
+            root.rank = rank
+            # splicing the two circular member lists again splits them
+            child.next, root.next = root.next, child.next
+            self._num_unions -= 1
+
+
+    def _find_set(self, nx) :
+        # no path compression, so that links can be undone
+        while nx.p is not nx :
+            nx = nx.p
+        return nx
+
+    _find_set_halving = _find_set_splitting = _find_set
+
+    def _attach(self, child, root) :
+        self._log.append((child, root, root.rank))
+        DisjointSets._attach(self, child, root)
+
+
+
+
+class IntDisjointSets :
+    """Disjoint Set Forests over a dense integer universe, backed by compact arrays.
+
+    Disjoint sets of the integers in the range [0..size-1] represented as a disjoint set forest.
+    Rather than allocating a node object and a dictionary entry per element, as DisjointSets does,
+    the parent of each element and the rank of each root are stored in typed arrays indexed by
+    element.  Construction is a bulk O(size) allocation, and memory use is a handful of bytes
+    per element.  This implementation uses both the union by rank heuristic, as well as
+    path compression, with the same choice of find and link strategies as DisjointSets.  As with
+    DisjointSets, set sizes, the number of sets, and the members of each set are maintained
+    incrementally by union.  As in DisjointSets, elements not in the forest, i.e., outside [0..size-1],
+    raise a KeyError.
+    """
 
+    __slots__ = ["_parent", "_rank", "_size", "_next", "_num_sets", "_find", "_link"]
+
+    def __init__(self, size, find_strategy="compression", link_strategy="rank") :
+        """Initializes disjoint set forest of the integers in interval [0..size-1].
+
+        Each integer from 0 to size - 1 is initially in a set by itself.
+
+        Keyword arguments:
+        size -- number of elements in disjoint set forest.
+        find_strategy -- how paths are shortened during finds: "compression" (the default), "halving",
+                or "splitting".  See DisjointSets for details.
+        link_strategy -- how the roots of two trees are linked during a union: "rank" (the default), "size",
+                or "random".  See DisjointSets for details.  Ranks are only stored for "rank".
+        """
+
+        self._find = _strategy_method(self, _FIND_STRATEGIES, "find_strategy", find_strategy)
+        self._link = _strategy_method(self, _LINK_STRATEGIES, "link_strategy", link_strategy)
+        typecode = _index_typecode(size)
+        self._parent = array(typecode, range(size))
+        # ranks are bounded by lg size, so a byte per element suffices
+        self._rank = array('B', bytes(size)) if link_strategy == "rank" else None
+        self._size = array(typecode, [1]) * size
+        # successor of each element on the circular list of members of its set
+        self._next = array(typecode, range(size))
+        self._num_sets = size
+
+
+    def size(self) :
+        """Number of elements in the forest."""
+
+        return len(self._parent)
+
+
+    def union(self,x,y) :
+        """Computes the union of the sets containing x and y.
+
+        Uses the forest's linking heuristic in computing union of sets containing x and y.
+        By default, this is union by rank, where the "shorter" tree is added as child of
+        "taller" tree.  Though heights are approximate since ranks are upper bounds only.
+
+        Keyword arguments:
+        x -- an element
+        y -- an element
+        """
+
+        self._link(self._find(x), self._find(y))
+
+
+    def find_set(self,x) :
+        """Finds the set for a given element, and performs path compression.
+
+        Returns a representative member of the set, namely the root of the set's tree.
+        Subsequent calls to the union method may change which element is root, but otherwise
+        no other method change the root elements.
+
+        Keyword arguments:
+        x -- the element whose set we want to find
+        """
+
+        return self._find(x)
+
+
+    def in_forest(self,x) :
+        """Checks if element is in the set forest.
+
+        Keyword arguments:
+        x -- the element we're checking for containment.
+        """
+
+        return 0 <= x < len(self._parent)
+
+
+    def in_set(self, x, s) :
+        """Checks if element x is in the set containing s.
+
+        Keyword arguments:
+        x -- the element we're checking for containment.
+        s -- a representative member of the set we're checking.
+        """
+
+        return self._find(x) == self._find(s)
+
+
+    def union_all(self, pairs) :
+        """Computes the union of the sets containing x and y, for each pair (x, y) in pairs.
+
+        Equivalent to calling union on each pair in turn, but processes the pairs in a single pass.
+
+        Keyword arguments:
+        pairs -- an iterable of 2-tuples (x, y) of elements
+        """
+
+        find = self._find
+        link = self._link
+        for x, y in pairs :
+            link(find(x), find(y))
+
+
+    def find_all(self, elements) :
+        """Finds the set for each of a sequence of elements, performing path compression.
+
+        Returns an array of the representative members of the sets of the elements, in the same order
+        as the elements.  Equivalent to calling find_set on each element in turn.
+
+        Keyword arguments:
+        elements -- an iterable of elements
+        """
+
+        return array(self._parent.typecode, map(self._find, elements))
+
+
+    def same_set_all(self, pairs) :
+        """Checks, for each pair (x, y) in pairs, whether x and y are in the same set.
+
+        Returns a list of booleans in the same order as the pairs.  Equivalent to calling
+        in_set on each pair in turn.
+
+        Keyword arguments:
+        pairs -- an iterable of 2-tuples (x, y) of elements
+        """
+
+        find = self._find
+        return [find(x) == find(y) for x, y in pairs]
+
+
+    def num_sets(self) :
+        """Returns the number of disjoint sets in the forest."""
+
+        return self._num_sets
+
+
+    def set_size(self, x) :
+        """Returns the number of elements in the set containing x.
+
+        Keyword arguments:
+        x -- an element
+        """
+
+        return self._size[self._find(x)]
+
+
+    def members(self, x) :
+        """Returns a list of the elements in the set containing x.
+
+        Runs in time linear in the size of the set, independent of the size of the forest.
+        The order of the list is unspecified, other than that x is first.
+
+        Keyword arguments:
+        x -- an element
+        """
+
+        following = self._next
+        if not 0 <= x < len(following) :
+            raise KeyError(x)
+        result = [x]
+        y = following[x]
+        while y != x :
+            result.append(y)
+            y = following[y]
+        return result
+
+
+    def to_labels(self) :
+        """Returns an array whose element x is the id of the set containing x.
+
+        Set ids are the integers from 0 to num_sets()-1, numbered in order of the smallest element
+        of each set.  Fully compresses every path in the forest in a single pass, regardless of the
+        forest's find strategy.
+        """
+
+        find = self._find_set
+        labels = array(self._parent.typecode, [-1]) * len(self._parent)
+        count = 0
+        for x in range(len(labels)) :
+            # the root's label doubles as the label of its set
+            root = find(x)
+            label = labels[root]
+            if label < 0 :
+                label = labels[root] = count
+                count += 1
+            labels[x] = label
+        return labels
+
+
+    def snapshot(self, f) :
+        """Writes a binary snapshot of the forest to a file, from which it can be restored with restore.
+
+        The forest's arrays are written directly, so a snapshot takes about as many bytes as the forest
+        takes in memory, and restoring it does not replay any unions.
+
+        Keyword arguments:
+        f -- a file object opened for writing in binary mode
+        """
+
+        _write_snapshot(f, _SNAPSHOT_INT_DISJOINT_SETS, self, False, self.num_sets(), self._parent, self._rank, self._size, self._next)
+
+
+    @classmethod
+    def restore(cls, f) :
+        """Reads a forest from a binary snapshot written by snapshot.
+
+        Keyword arguments:
+        f -- a file object opened for reading in binary mode
+        """
+
+        find_strategy, link_strategy, lazy, num_sets, parent, rank, size, following = _read_snapshot(f, _SNAPSHOT_INT_DISJOINT_SETS)
+        forest = cls(0, find_strategy, link_strategy)
+        forest._parent = parent
+        forest._rank = rank
+        forest._size = size
+        forest._next = following
+        forest._num_sets = num_sets
+        return forest
+
+
+    def _find_set(self, x) :
+        # locate the root, then perform path compression with a second pass
+        parent = self._parent
+        if not 0 <= x < len(parent) :
+            raise KeyError(x)
+        root = x
+        while parent[root] != root :
+            root = parent[root]
+        while parent[x] != root :
+            parent[x], x = root, parent[x]
+        return root
+
+    def _find_set_halving(self, x) :
+        # path halving: every other element on the path is pointed to its grandparent
+        parent = self._parent
+        if not 0 <= x < len(parent) :
+            raise KeyError(x)
+        while parent[x] != x :
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def _find_set_splitting(self, x) :
+        # path splitting: every element on the path is pointed to its grandparent
+        parent = self._parent
+        if not 0 <= x < len(parent) :
+            raise KeyError(x)
+        while parent[x] != x :
+            parent[x], x = parent[parent[x]], parent[x]
+        return x
+
+
+    def _link_by_rank(self, x, y) :
+        # union by rank heuristic: attach approximately "shorter" tree as child of approximately "taller" tree
+        if x == y :
+            return
+        rank = self._rank
+        if rank[x] > rank[y] :
+            x, y = y, x
+        elif rank[x] == rank[y] :
+            rank[y] = rank[y] + 1
+        self._attach(x, y)
+
+    def _link_by_size(self, x, y) :
+        # union by size heuristic: attach tree with fewer nodes as child of tree with more nodes
+        if x == y :
+            return
+        if self._size[x] > self._size[y] :
+            x, y = y, x
+        self._attach(x, y)
+
+    def _link_randomly(self, x, y) :
+        # randomized linking by index: attach root with lower pseudorandom index as child of the other
+        if x == y :
+            return
+        if _scramble(x) > _scramble(y) :
+            x, y = y, x
+        self._attach(x, y)
+
+    def _attach(self, child, root) :
+        self._parent[child] = root
+        self._size[root] += self._size[child]
+        # splice the two circular member lists together
+        following = self._next
+        following[child], following[root] = following[root], following[child]
+        self._num_sets -= 1
+
+
+
+_FIND_STRATEGIES = {
+    "compression" : "_find_set",
+    "halving" : "_find_set_halving",
+    "splitting" : "_find_set_splitting"
+}
+
+_LINK_STRATEGIES = {
+    "rank" : "_link_by_rank",
+    "size" : "_link_by_size",
+    "random" : "_link_randomly"
+}
+
+def _singleton(x) :
+    # a new node for element x, as the root of a tree by itself
+    n = _DJSetNode()
+    n.data = x
+    n.p = n
+    n.rank = 0
+    n.size = 1
+    n.next = n
+    return n
+
+def _strategy_method(forest, strategies, option, strategy) :
+    # the bound method of forest implementing the named strategy
+    if strategy not in strategies :
+        raise ValueError(option + " must be one of: " + ", ".join(strategies))
+    return getattr(forest, strategies[strategy])
+
+# Snapshot format: a header, then the parent, rank (if stored), size and next arrays
+# in native byte order, then (for DisjointSets only) the pickled list of elements.
+_SNAPSHOT_HEADER = struct.Struct("<4sBBBBBBBBqq")
+_SNAPSHOT_MAGIC = b"DJSF"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_DISJOINT_SETS = 0
+_SNAPSHOT_INT_DISJOINT_SETS = 1
+
+def _write_snapshot(f, kind, forest, lazy, num_sets, parent, rank, size, following) :
+    f.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, kind, parent.itemsize,
+                                  sys.byteorder == "big", rank is not None,
+                                  _strategy_index(_FIND_STRATEGIES, forest._find),
+                                  _strategy_index(_LINK_STRATEGIES, forest._link),
+                                  lazy, len(parent), num_sets))
+    for a in (parent, rank, size, following) :
+        if a is not None :
+            a.tofile(f)
+
+def _read_snapshot(f, kind) :
+    # returns the find strategy, link strategy, lazy flag, number of sets, and the four arrays
+    header = f.read(_SNAPSHOT_HEADER.size)
+    if len(header) != _SNAPSHOT_HEADER.size :
+        raise ValueError("not a disjoint sets snapshot")
+    magic, version, stored_kind, itemsize, big_endian, has_rank, find, link, lazy, n, num_sets = _SNAPSHOT_HEADER.unpack(header)
+    if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION :
+        raise ValueError("not a disjoint sets snapshot")
+    if stored_kind != kind :
+        raise ValueError("snapshot is of a different kind of disjoint sets")
+    typecode = [code for code in ('i', 'l', 'q') if array(code).itemsize == itemsize][0]
+    swap = bool(big_endian) != (sys.byteorder == "big")
+    arrays = []
+    for code, stored in ((typecode, True), ('B', has_rank), (typecode, True), (typecode, True)) :
+        a = None
+        if stored :
+            a = array(code)
+            a.fromfile(f, n)
+            if swap :
+                a.byteswap()
+        arrays.append(a)
+    return (list(_FIND_STRATEGIES)[find], list(_LINK_STRATEGIES)[link], bool(lazy), num_sets) + tuple(arrays)
+
+def _strategy_index(strategies, method) :
+    # position in strategies of the strategy implemented by a bound method
+    return list(strategies.values()).index(method.__name__)
+
+_MASK64 = (1 << 64) - 1
+
+def _scramble(h) :
+    # splitmix64 finalizer: a fixed pseudorandom permutation of 64-bit integers, used as the
+    # index of an element for randomized linking
+    h = (h + 0x9E3779B97F4A7C15) & _MASK64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return h ^ (h >> 31)
+
+def _index_typecode(size) :
+    # smallest signed array typecode able to hold every value in [0..size], which includes every
+    # index as well as every set size
+    for code in ('i', 'l', 'q') :
+        if size < 1 << (8 * array(code).itemsize - 1) :
+            return code
+    raise OverflowError("size too large for an array-backed forest")
@@ -0,0 +1,97 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from itertools import islice
+from operator import itemgetter
+from disjointsets import DisjointSets, IntDisjointSets
+
+# maximum number of edges passed to union_all at a time between checks for early termination
+_CHUNK_SIZE = 4096
+
+
+def connected_components(edges, n=None) :
+    """Computes the connected components of an undirected graph given as a list of edges.
+
+    If n is given, the vertices are the integers in [0..n-1], and the edges are processed
+    with an IntDisjointSets.  Edges stop being consumed as soon as the whole graph is known
+    to be connected.  The result is a 2-tuple (number of components, labels) where labels is
+    an array with labels[v] the component of vertex v.  Components are numbered from 0 in order
+    of their smallest vertex.
+
+    If n is not given, the vertices can be of any hashable type, and only vertices that appear
+    in at least one edge are included.  The result is a 2-tuple (number of components, labels)
+    where labels is a dict mapping each vertex to its component, numbered from 0 in the order
+    that the first vertex of each component first appeared in the edges.
+
+    Keyword arguments:
+    edges -- an iterable (such as a list or generator) of 2-tuples (u, v) of vertices.
+    n -- the number of vertices, if the vertices are the integers from 0 to n-1.
+    """
+
+    if n is None :
+        ds = DisjointSets(lazy=True)
+        ds.union_all(edges)
+        return ds.num_sets(), ds.to_labels()
+    ds = IntDisjointSets(n)
+    edges = iter(edges)
+    while ds.num_sets() > 1 :
+        # each edge joins at most two components, so a chunk of at most num_sets-1 edges can't
+        # overshoot the edge that connects the graph
+        chunk = list(islice(edges, min(_CHUNK_SIZE, ds.num_sets() - 1)))
+        if not chunk :
+            break
+        ds.union_all(chunk)
+    return ds.num_sets(), ds.to_labels()
+
+
+def kruskal_msf(weighted_edges, n=None, presorted=False) :
+    """Computes a minimum spanning forest of an undirected weighted graph using Kruskal's algorithm.
+
+    Returns a list of the (u, v, weight) edges in the minimum spanning forest, in nondecreasing
+    order of weight.  If n is given, the vertices are the integers in [0..n-1], and the algorithm
+    stops as soon as n-1 edges have been accepted, without consuming the rest of the edges.
+    Otherwise, the vertices can be of any hashable type.
+
+    If presorted is True, the edges must already be in nondecreasing order of weight, and are
+    consumed one at a time, such as from a generator, without first being collected in a list.
+    Otherwise, the edges are sorted by weight first.
+
+    Keyword arguments:
+    weighted_edges -- an iterable (such as a list or generator) of 3-tuples (u, v, weight).
+    n -- the number of vertices, if the vertices are the integers from 0 to n-1.
+    presorted -- True if the edges are already in nondecreasing order of weight.
+    """
+
+    if not presorted :
+        weighted_edges = sorted(weighted_edges, key=itemgetter(2))
+    ds = DisjointSets(lazy=True) if n is None else IntDisjointSets(n)
+    find = ds.find_set
+    union = ds.union
+    forest = []
+    target = n - 1 if n is not None else None
+    if target == 0 :
+        return forest
+    for e in weighted_edges :
+        ru = find(e[0])
+        rv = find(e[1])
+        if ru != rv :
+            union(ru, rv)
+            forest.append(e)
+            if len(forest) == target :
+                break
+    return forest
@@ -0,0 +1,328 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+class PairingPQ :
+    """A Priority Queue (PQ) implemented with a pairing heap.
+
+    A pairing heap is a heap-ordered multiway tree, restructured only by linking two trees, which makes
+    the root with the lesser priority the parent of the other.  Adding an element links it with the
+    root, and decreasing a priority cuts the element's subtree out of the tree and links it with the root,
+    both in O(1) time.  Extracting the min links the root's subtrees in pairs, and then links the resulting
+    trees together, in O(lg N) amortized time.  A python dictionary maps each element to its node
+    of the tree, to enable changing priorities, as well as removal of any element.
+
+    This makes PairingPQ a good fit for algorithms, such as Dijkstra's and Prim's, that decrease
+    priorities much more often than they extract elements.  Two PairingPQs can also be merged by linking
+    their roots, which is O(1), plus the work of combining their dictionaries.
+
+    Elements must be of a hashable type (due to use of Python dictionary).  However, be careful
+    when mutating state of an element that is already in the PQ, and don't change any element property
+    that is used in generating the hash or else you will break the PQ.
+
+    Assuming a PQ with N elements, the runtimes of the operations are as follows.
+
+    The following operations run in O(1) time: add, peek_min, contains, get_priority, size, is_empty,
+    and change_priority when it decreases the priority (amortized time of a decrease is conjectured O(1), and
+    proven O(2^(2 sqrt(lg lg N)))).
+
+    The following operations run in O(lg N) amortized time: extract_min, remove, and change_priority when
+    it increases the priority.
+
+    The following operations run in O(N) time: __init__ to initialize PQ with a list of N (element, value) pairs.
+
+    The add_all method runs in O(k) time where k is the number of new elements.  The merge method runs in O(min(N,k))
+    time where N is the current size of this PQ, and k is the size of the other, excluding the O(lg N) amortized time
+    to remove each element the two PQs have in common.
+    """
+
+    __slots__ = ['_root', '_index']
+
+    def __init__(self, pairs=[]) :
+        """Initialize a PQ.
+
+        PQ is empty is pairs is an empty list.  Otherwise, intialized to a heap consisting of the
+        (element, value) pairs in the list.
+
+        Keyword arguments:
+        pairs -- List of 2-tuples of the form (element, value) where value is the priority of element.
+        """
+        
+        self._root = None
+        self._index = {}
+        for el,val in pairs :
+            self.add(el,val)
+
+
+    def size(self) :
+        """Size of the PQ."""
+        
+        return len(self._index)
+    
+
+    def is_empty(self) :
+        """Returns True if PQ is empty and False otherwise."""
+        
+        return self._root is None
+
+
+    def add(self, element, value) :
+        """Adds an element to the PQ with a specified priority.
+
+        Adds the element to the PQ provided PQ doesn't already contain it.
+        Does nothing if the PQ already contains the element.
+
+        Returns True if element added and False if already present.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The priority of the element.
+        """
+
+        index = self._index
+        if element in index :
+            return False
+        node = _PairingNode()
+        node.element = element
+        node.value = value
+        node.child = node.sibling = node.prev = None
+        index[element] = node
+        root = self._root
+        self._root = node if root is None else _link(root, node)
+        return True
+
+
+    def add_all(self, pairs) :
+        """Adds a a list of (element, value) pairs to the PQ.
+
+        Adds the (element, value) pairs from the list pairs to the PQ.  Only the
+        pairs for which element is not already in the PQ are added.
+
+        Keyword arguments:
+        pairs -- A list of 2-tuples of the form (element, value) where value is the priority of element.
+        """
+
+        add = self.add
+        for el,val in pairs :
+            add(el,val)
+                
+
+    def merge(self, q) :
+        """Merges a PairingPQ into this PQ.
+
+        Adds all (element, value) pairs from a given PairingPQ to this PQ, by linking the roots of their
+        heaps.  The elements of q that are already in this PQ are excluded, keeping their priorities in this PQ.
+        Since the nodes of q become part of this PQ, q is left empty.
+
+        Keyword arguments:
+        q -- A PairingPQ to merge with this one.  q is emptied.
+        """
+
+        if q is self or q._root is None :
+            return
+        other = q._root
+        otherIndex = q._index
+        q._root = None
+        q._index = {}
+        if self._root is None :
+            self._root = other
+            self._index = otherIndex
+            return
+        # the smaller dictionary is added into the larger one, and the elements in common are removed
+        # from q's heap, keeping their priorities in this PQ
+        index = self._index
+        if len(index) < len(otherIndex) :
+            for e, node in index.items() :
+                duplicate = otherIndex.get(e)
+                if duplicate is not None :
+                    other = _cut(other, duplicate)
+                otherIndex[e] = node
+            index = otherIndex
+        else :
+            for e, node in otherIndex.items() :
+                if e in index :
+                    other = _cut(other, node)
+                else :
+                    index[e] = node
+        self._index = index
+        if other is not None :
+            self._root = _link(self._root, other)
+
+        
+    def peek_min(self) :
+        """Returns, but does not remove, the element with the minimum priority value.
+
+        Raises IndexError if the PQ is empty, as PQ does.
+        """
+        
+        if self._root is None :
+            raise IndexError("peek_min from an empty PQ")
+        return self._root.element
+
+    
+    def extract_min(self) :
+        """Removes and returns the element with minimum priority value.
+
+        Raises IndexError if the PQ is empty, as PQ does.
+        """
+        
+        root = self._root
+        if root is None :
+            raise IndexError("extract_min from an empty PQ")
+        del self._index[root.element]
+        self._root = None if root.child is None else _combine(root.child)
+        return root.element
+    
+
+    def contains(self, element) :
+        """Returns True if element is in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element
+        """
+        
+        return element in self._index
+    
+
+    def get_priority(self, element) :
+        """Gets the current priority of the specified element.
+
+        Keyword arguments:
+        element -- The element
+        """
+        
+        return self._index[element].value
+    
+
+    def change_priority(self, element, value) :
+        """Changes the priority of an element in the PQ.
+
+        Changes the priority of an element that is in the PQ.
+        Does nothing if the PQ doesn't contains the element.
+
+        Returns True if element is present in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The new priority for the element.
+        """
+        
+        node = self._index.get(element)
+        if node is None :
+            return False
+        old = node.value
+        node.value = value
+        if value < old :
+            if node is not self._root :
+                _detach(node)
+                self._root = _link(self._root, node)
+        elif old < value :
+            # the children of node may now have lesser priorities, so are split off and combined first
+            if node.child is not None :
+                subtree = _combine(node.child)
+                node.child = None
+            else :
+                subtree = None
+            if node is self._root :
+                root = node
+            else :
+                _detach(node)
+                root = _link(self._root, node)
+            self._root = root if subtree is None else _link(root, subtree)
+        return True
+
+
+    def remove(self, element) :
+        """Removes a specified element from the PQ.
+
+        Removes a specified element from the PQ, if it is present.
+        Returns True if element removed, and False if not present in PQ.
+
+        Keyword arguments:
+        element -- The element to remove.
+        """
+
+        node = self._index.pop(element, None)
+        if node is None :
+            return False
+        self._root = _cut(self._root, node)
+        return True
+
+
+
+class _PairingNode :
+    # prev is the parent of a leftmost child, and the left sibling of any other child
+    __slots__ = ['element','value','child','sibling','prev']
+
+
+def _link(a, b) :
+    # links the trees rooted at a and b, returning the new root
+    if b.value < a.value :
+        a, b = b, a
+    child = a.child
+    b.sibling = child
+    if child is not None :
+        child.prev = b
+    b.prev = a
+    a.child = b
+    return a
+
+
+def _detach(node) :
+    # removes the subtree rooted at node, which isn't the root, from the tree
+    prev = node.prev
+    sibling = node.sibling
+    if prev.child is node :
+        prev.child = sibling
+    else :
+        prev.sibling = sibling
+    if sibling is not None :
+        sibling.prev = prev
+    node.prev = node.sibling = None
+
+
+def _cut(root, node) :
+    # removes node from the tree rooted at root, returning the new root, which is None if the tree is now empty
+    if node is not root :
+        _detach(node)
+    subtree = None if node.child is None else _combine(node.child)
+    node.child = None
+    if node is root :
+        return subtree
+    return root if subtree is None else _link(root, subtree)
+
+
+def _combine(first) :
+    # combines the list of sibling trees starting with first into one tree, returning its root:
+    # links the trees in pairs from left to right, and then links the results from right to left
+    paired = []
+    node = first
+    while node is not None :
+        second = node.sibling
+        node.prev = node.sibling = None
+        if second is None :
+            paired.append(node)
+            break
+        following = second.sibling
+        second.prev = second.sibling = None
+        paired.append(_link(node, second))
+        node = following
+    root = paired.pop()
+    while paired :
+        root = _link(paired.pop(), root)
+    return root
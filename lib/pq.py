@@ -16,8 +16,12 @@
 ##  You should have received a copy of the GNU General Public License
 ##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from array import array
+from operator import itemgetter, lt
+from itertools import islice
+
 class PQ :
-    """A Priority Queue (PQ) implemented with a binary heap.
+    """A Priority Queue (PQ) implemented with a binary heap, or optionally a d-ary heap.
 
     A binary min heap is used to implement a PQ.  A python dictionary, i.e., associative array,
     is used to enable changing priorities, as well as removal of any element, in O(lg N) time.
@@ -36,37 +40,98 @@ class PQ :
 
     The add_all and merge methods run in O(min(N+k, k lg (N+k))) time where N is the current size of the PQ, and k is the number
     of new elements.
+
+    The extract_many and extract_while methods run in O(min(N, k lg N)) time, and nsmallest in O(k lg k) time,
+    where k is the number of elements returned.  Likewise, generating k pairs with drain takes O(k lg N) time,
+    and with sorted_items O(k lg k) time.  The change_priorities and remove_all methods run in O(min(N, k lg N))
+    time, where k is the number of elements changed or removed.
+
+    Percolating an element up the heap, as in add, decreasing a priority with change_priority, and remove,
+    uses O(lg N) comparisons of priorities by default.  Alternatively, a binary search over the ancestors of the element
+    can be used to find its new position, which uses only O(lg lg N) comparisons, although it always uses that
+    many, even when the element moves only a level or two.  This pays off when priorities are expensive to compare.
+
+    A d-ary heap, where each node has up to d children, can be used instead of a binary heap.  Its height is only
+    log_d N, so percolating up, as in add and decreasing priorities, is faster, while percolating down, as in extract_min
+    and increasing priorities, compares each element with up to d children per level.  Larger arities thus suit
+    workloads in which priority decreases outnumber extractions, such as Dijkstra's algorithm.
+
+    A PQ can be bounded to a maximum capacity, such as to keep the best K elements of a stream.  When a bounded
+    PQ is full, adding an element evicts the element at the root, i.e., the element that would be extracted
+    next, unless the new element would itself be extracted first, in which case it is rejected.  A bounded
+    PQ thus keeps the elements with the K greatest priorities (and a bounded MaxPQ those with the K least).
+    The offer method rejects such elements in O(1) time.  A bounded PQ adds the pairs given to __init__ and add_all
+    one at a time, so it can take the best K of a stream of any length in O(K) space.
+
+    Priorities may be of any totally ordered type, and are only compared with the < operator.
+
+    A PQ can optionally delete lazily, for workloads where most elements removed, or whose priorities
+    are increased, are far from the root.  Rather than percolating the last element of the heap into the slot of
+    a removed element, remove marks the slot as stale, in O(1) time, leaving it in the heap until it reaches the
+    root, where it is discarded.  Increasing a priority likewise marks the element's slot as stale, and adds the
+    element with its new priority at the end of the heap, from which it usually percolates up only a level or two,
+    rather than percolating down from its old slot.  The heap is compacted, in O(N) time, when more than half of
+    its slots are stale.  Removals and increases are then cheaper, but the stale slots make the heap larger
+    for the extractions that follow, so lazy deletion is off by default.
     """
 
-    __slots__ = ['_heap', '_index']
+    # whether elements are extracted in decreasing order of priority, as in MaxPQ
+    _descending = False
+    # True if priority a is extracted before priority b
+    _before = staticmethod(lt)
+
+    __slots__ = ['_heap', '_index', '_arity', '_capacity', '_lazy', '_stale', '_sift_up', '_sift_down']
 
-    def __init__(self, pairs=[]) :
+    def __init__(self, pairs=[], sift_up="linear", arity=2, capacity=None, lazy_deletion=False) :
         """Initialize a PQ.
 
-        PQ is empty is pairs is an empty list.  Otherwise, intialized to a heap consisting of the
-        (element, value) pairs in pairs.
+        PQ is empty is pairs is empty.  Otherwise, intialized to a heap consisting of the
+        (element, value) pairs in pairs, excluding all but the first pair for each element.
 
         Keyword arguments:
-        pairs -- List of 2-tuples of the form (element, value) where value is the priority of element.
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
+        sift_up -- How an element percolates up the heap: "linear" (the default) compares it to its parent,
+                grandparent, and so on, until its position is found; "binary" binary searches its ancestors.
+        arity -- The number of children of each node of the heap, which must be at least 2 (the default).
+        capacity -- The maximum number of elements in the PQ, which must be at least 1, or None (the default) for
+                an unbounded PQ.  If pairs has more elements, only the capacity elements that would be extracted
+                last are kept.
+        lazy_deletion -- If True, remove and increases of priorities mark the element's slot in the heap as stale,
+                rather than restoring the heap immediately.
         """
         
+        if sift_up not in _SIFT_UP_STRATEGIES :
+            raise ValueError("sift_up must be one of: " + ", ".join(_SIFT_UP_STRATEGIES))
+        if arity < 2 :
+            raise ValueError("arity must be at least 2")
+        if capacity is not None and capacity < 1 :
+            raise ValueError("capacity must be at least 1")
+        self._arity = arity
+        self._capacity = capacity
+        self._lazy = lazy_deletion
+        self._stale = 0
+        if lazy_deletion :
+            self._sift_up = getattr(self, _LAZY_SIFT_UP_STRATEGIES[sift_up])
+            self._sift_down = self._percolate_down_discarding_stale
+        else :
+            self._sift_up = getattr(self, _SIFT_UP_STRATEGIES[sift_up])
+            self._sift_down = self._percolate_down if arity == 2 else self._percolate_down_dary
         self._heap = []
         self._index = {}
-        if len(pairs) > 0 :
-            for p in pairs :
-                self._heap.append(p)
-            self._heapify()
+        self.add_all(pairs)
 
 
     def size(self) :
         """Size of the PQ."""
         
-        return len(self._heap)
+        return len(self._heap) - self._stale
     
 
     def is_empty(self) :
         """Returns True if PQ is empty and False otherwise."""
         
+        # the root of the heap is never stale
         return len(self._heap) == 0
 
 
@@ -78,37 +143,102 @@ class PQ :
 
         Returns True if element added and False if already present.
 
+        If the PQ is bounded, returns instead the (element, value) pair evicted to make room for the element,
+        which is the pair being added if it would be extracted before all others, or None if the element was
+        added without evicting a pair, because the PQ wasn't full.  As for an unbounded PQ, returns False if the
+        PQ already contains the element.
+
         Keyword arguments:
         element -- The element to add.
         value -- The priority of the element.
         """
 
+        if self._capacity is not None :
+            return self._add_bounded(element, value)
         if element in self._index :
             return False
         position = len(self._heap)
         self._heap.append((element, value))
-        self._percolate_up(position)
+        self._sift_up(position)
+        return True
+
+
+    def offer(self, element, value) :
+        """Adds an element to the PQ with a specified priority, if it makes the cut of a bounded PQ.
+
+        Adds the element to the PQ provided PQ doesn't already contain it, and, if the PQ is full,
+        the element wouldn't be extracted before all others, in which case it is rejected in O(1) time.
+        A bounded PQ evicts the element at its root to make room for the element.
+
+        Returns True if element added and False otherwise.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The priority of the element.
+        """
+
+        heap = self._heap
+        if len(heap) - self._stale == self._capacity and not self._before(heap[0][1], value) :
+            return False
+        if element in self._index :
+            return False
+        self.add(element, value)
         return True
 
 
     def add_all(self, pairs) :
-        """Adds a a list of (element, value) pairs to the PQ.
+        """Adds (element, value) pairs to the PQ.
 
-        Adds the (element, value) pairs from the list pairs to the PQ.  Only the
+        Adds the (element, value) pairs from pairs to the PQ.  Only the
         pairs for which element is not already in the PQ are added.
 
+        The pairs are appended to the heap in bulk, without a temporary list, so pairs may be a generator
+        of any number of pairs.  If at least as many pairs are added as the PQ already contains, the heap is then
+        rebuilt in O(N+k) time, and otherwise each new pair percolates up.  If iterating over pairs raises an
+        exception, none of the pairs are added.
+
         Keyword arguments:
-        pairs -- A list of 2-tuples of the form (element, value) where value is the priority of element.
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
         """
 
-        if len(pairs) >= len(self._heap) :
-            for p in pairs :
-                if p[0] not in self._index :
-                    self._heap.append(p)
+        if self._capacity is not None :
+            add = self._add_bounded
+            for el,val in pairs :
+                add(el,val)
+            return
+        heap = self._heap
+        index = self._index
+        start = len(heap)
+        try :
+            heap.extend(pairs)
+        except BaseException :
+            # pairs raised an exception partway, e.g., a generator, so the PQ is left as it was
+            del heap[start:]
+            raise
+        if start == 0 :
+            # indexes the pairs in bulk, in which any repeated element shows up as an index smaller than the heap,
+            # and if there are none, the heap is built, updating the positions in the index
+            index.update(zip(map(itemgetter(0), heap), range(len(heap))))
+            if len(index) == len(heap) :
+                self._heapify()
+                return
+            index.clear()
+        # compacts the new pairs, excluding those whose elements are already in the PQ, or repeated
+        end = start
+        for i in range(start, len(heap)) :
+            p = heap[i]
+            if p[0] not in index :
+                index[p[0]] = end
+                heap[end] = p
+                end += 1
+        del heap[end:]
+        if end - start >= start :
             self._heapify()
         else :
-            for el,val in pairs :
-                self.add(el,val)
+            sift_up = self._sift_up
+            for i in range(start, end) :
+                sift_up(i)
 
                 
 
@@ -122,7 +252,10 @@ class PQ :
         q -- A PQ to merge with this one.  q is not changed.
         """
 
-        self.add_all(q._heap)
+        if q._stale > 0 :
+            self.add_all(p for p in q._heap if p[0] is not _STALE)
+        else :
+            self.add_all(q._heap)
         
 
         
@@ -136,11 +269,12 @@ class PQ :
     def extract_min(self) :
         """Removes and returns the element with minimum priority value."""
         
-        minElement = self._heap[0][0]
-        oldLast = self._heap.pop()
-        if len(self._heap) > 0 :
-            self._heap[0] = oldLast
-            self._percolate_down(0)
+        heap = self._heap
+        minElement = heap[0][0]
+        oldLast = heap.pop()
+        if len(heap) > 0 :
+            heap[0] = oldLast
+            self._sift_down(0)
         del self._index[minElement]
         return minElement
     
@@ -181,15 +315,24 @@ class PQ :
         value -- The new priority for the element.
         """
         
-        if not self.contains(element) :
+        position = self._index.get(element)
+        if position is None :
             return False
-        position = self._index[element]
-        if self._heap[position][1] > value :
-            self._heap[position] = (element, value)
-            self._percolate_up(position)
-        elif self._heap[position][1] < value :
+        old = self._heap[position][1]
+        if self._before(value, old) :
             self._heap[position] = (element, value)
-            self._percolate_down(position)
+            self._sift_up(position)
+        elif self._before(old, value) :
+            if self._lazy and position > 0 :
+                heap = self._heap
+                heap[position] = (_STALE, old)
+                self._stale += 1
+                heap.append((element, value))
+                self._sift_up(len(heap) - 1)
+                self._compact_if_stale()
+            else :
+                self._heap[position] = (element, value)
+                self._sift_down(position)
         return True
 
 
@@ -203,115 +346,598 @@ class PQ :
         element -- The element to remove.
         """
 
-        if not self.contains(element) :
+        position = self._index.pop(element, None)
+        if position is None :
             return False
-        position = self._index[element]
-        del self._index[element]
-        if len(self._heap) == 1 or position == len(self._heap)-1 :
-            self._heap.pop()
-        else :
-            self._heap[position] = self._heap.pop()
-            if position > 0 and self._heap[position][1] <= self._heap[PQ._parent(position)][1] :
-                self._percolate_up(position)
+        heap = self._heap
+        if self._lazy and position > 0 :
+            heap[position] = (_STALE, heap[position][1])
+            self._stale += 1
+            self._compact_if_stale()
+            return True
+        last = heap.pop()
+        if position < len(heap) :
+            heap[position] = last
+            if position > 0 and self._before(last[1], heap[(position-1)//self._arity][1]) :
+                self._sift_up(position)
             else :
-                self._percolate_down(position)
+                self._sift_down(position)
         return True
-        
-   
 
-    def _left(i) :
-        return 2*i+1
 
-    def _right(i) :
-        return 2*i+2
+    def change_priorities(self, pairs) :
+        """Changes the priorities of a list of elements in the PQ.
+
+        Changes the priorities of the elements that are in the PQ, ignoring the others.  When the list is large
+        relative to the size of the PQ, the new priorities are all written to the heap, which is then
+        rebuilt once in O(N) time, rather than by a call to change_priority per element.
 
-    def _parent(i) :
-        return (i-1)//2
+        Returns the number of elements whose priorities were changed.
 
-    def _ancestor(i,a) :
-        # a=0 is itself, a=1 is parent, a=2 is grandparent, etc
-        po2 = 1 << a
-        return (i-po2+1)//po2
+        Keyword arguments:
+        pairs -- A list of 2-tuples of the form (element, value) where value is the new priority of element.
+        """
+
+        heap = self._heap
+        index = self._index
+        changed = 0
+        if len(pairs) * _CHANGE_REBUILD_FACTOR >= len(heap) :
+            for el,val in pairs :
+                position = index.get(el)
+                if position is not None :
+                    heap[position] = (el,val)
+                    changed += 1
+            if changed > 0 :
+                self._heapify()
+        else :
+            change_priority = self.change_priority
+            for el,val in pairs :
+                if change_priority(el,val) :
+                    changed += 1
+        return changed
+
+
+    def remove_all(self, elements) :
+        """Removes a list of elements from the PQ.
+
+        Removes the elements that are in the PQ, ignoring the others.  When the list is large relative to the
+        size of the PQ, the elements are all removed from the heap, which is then rebuilt once in O(N)
+        time, rather than by a call to remove per element.
+
+        Returns the number of elements removed.
+
+        Keyword arguments:
+        elements -- A list of the elements to remove.
+        """
+
+        heap = self._heap
+        index = self._index
+        removed = 0
+        if len(elements) * _REMOVE_REBUILD_FACTOR >= len(heap) :
+            for e in elements :
+                position = index.pop(e, None)
+                if position is not None :
+                    heap[position] = None
+                    removed += 1
+            if removed > 0 :
+                heap[:] = [p for p in heap if p is not None]
+                self._heapify()
+        else :
+            remove = self.remove
+            for e in elements :
+                if remove(e) :
+                    removed += 1
+        return removed
+
+
+    def extract_many(self, k, with_priorities=False) :
+        """Removes and returns the k elements with minimum priority values, in priority order.
+
+        Returns a list of the k elements, or of all of the elements if the PQ has fewer than k.  When k is
+        large relative to the size of the PQ, the elements are removed all at once, with the heap rebuilt
+        in O(N) time, rather than by k calls to extract_min.
+
+        Keyword arguments:
+        k -- The number of elements to extract.
+        with_priorities -- If True, returns a list of (element, value) pairs rather than only the elements.
+        """
+
+        heap = self._heap
+        size = len(heap) - self._stale
+        if k * _REBUILD_FACTOR < size :
+            pairs = self._extract_pairs(k)
+        elif k >= size :
+            if self._stale > 0 :
+                pairs = sorted((p for p in heap if p[0] is not _STALE), key=itemgetter(1), reverse=self._descending)
+                self._stale = 0
+            else :
+                pairs = sorted(heap, key=itemgetter(1), reverse=self._descending)
+            heap.clear()
+            self._index.clear()
+        else :
+            pairs = self._remove_positions(self._smallest_positions(k))
+        if with_priorities :
+            return pairs
+        return [p[0] for p in pairs]
+
+
+    def extract_while(self, condition, with_priorities=False) :
+        """Removes and returns the elements whose priorities satisfy a condition, in priority order.
+
+        The condition is either a threshold, in which case the elements with priority values
+        less than or equal to the threshold are extracted, or a predicate, which is called with priority
+        values.  A predicate must be monotone, i.e., if it is true for a priority value, it must be true for all
+        lesser priority values, such as the priorities of the jobs due before a deadline.  Only the
+        elements that are extracted, and their children in the heap, are examined.
+
+        Keyword arguments:
+        condition -- A threshold priority value, or a predicate taking a priority value.
+        with_priorities -- If True, returns a list of (element, value) pairs rather than only the elements.
+        """
+
+        if callable(condition) :
+            positions = self._positions_while(condition)
+        else :
+            positions = self._positions_while(lambda value : not self._before(condition, value))
+        if len(positions) * _REBUILD_FACTOR < self.size() :
+            pairs = self._extract_pairs(len(positions))
+        else :
+            pairs = self._remove_positions(positions)
+        if with_priorities :
+            return pairs
+        return [p[0] for p in pairs]
+
+
+    def drain(self) :
+        """Generates the (element, value) pairs of the PQ in priority order, removing each as it is generated.
+
+        Elements are extracted lazily, one per pair generated, so a consumer can stop after the first few
+        pairs, leaving the rest of the PQ intact.  The PQ may be changed between pairs, e.g., an element
+        added with a priority less than the last one generated is generated next.
+        """
 
-    def _tree_level(i) :
-        return (i+1).bit_length()-1
+        heap = self._heap
+        index = self._index
+        while len(heap) > 0 :
+            pair = heap[0]
+            del index[pair[0]]
+            last = heap.pop()
+            if len(heap) > 0 :
+                heap[0] = last
+                self._sift_down(0)
+            yield pair
+
+
+    def sorted_items(self) :
+        """Generates the (element, value) pairs of the PQ in priority order, without changing the PQ.
+
+        The heap is walked lazily from the root with an auxiliary heap of the positions of the children
+        of the pairs generated so far, so generating the first k pairs takes O(k lg k) time, regardless
+        of the size of the PQ.  The PQ must not be changed while iterating.
+        """
+
+        heap = self._heap
+        for i in self._ordered_positions() :
+            yield heap[i]
+
+
+    def nsmallest(self, k, with_priorities=False) :
+        """Returns, but does not remove, the k elements with minimum priority values, in priority order.
+
+        Returns a list of the k elements, or of all of the elements if the PQ has fewer than k.  The heap is
+        walked from the root with an auxiliary heap of the children of the elements found so far,
+        in O(k lg k) time.
+
+        Keyword arguments:
+        k -- The number of elements.
+        with_priorities -- If True, returns a list of (element, value) pairs rather than only the elements.
+        """
+
+        heap = self._heap
+        if with_priorities :
+            return [heap[i] for i in self._smallest_positions(k)]
+        return [heap[i][0] for i in self._smallest_positions(k)]
+        
+   
 
     def _heapify(self) :
-        start = len(self._heap) // 2 - 1
+        if self._stale > 0 :
+            # rebuilding the heap compacts it, discarding its stale slots
+            self._heap[:] = [p for p in self._heap if p[0] is not _STALE]
+            self._stale = 0
+        # start from the parent of the last element
+        start = (len(self._heap) - 2) // self._arity
+        if self._arity == 2 :
+            percolate_down = self._percolate_down_no_index
+        else :
+            percolate_down = self._percolate_down_no_index_dary
         for i in range(start, -1, -1) :
-            self._percolate_down_no_index(i)
-        for i, p in enumerate(self._heap) :
-            self._index[p[0]] = i
+            percolate_down(i)
+        heap = self._heap
+        self._index.update(zip(map(itemgetter(0), heap), range(len(heap))))
 
-    def _percolate_up(self, position) :
-        current = self._heap[position]
-        p = PQ._parent(position)
-        while p >= 0 and self._heap[p][1] > current[1] :
-            self._heap[position] = self._heap[p]
-            self._index[self._heap[position][0]] = position 
+    def _add_bounded(self, element, value) :
+        index = self._index
+        if element in index :
+            return False
+        heap = self._heap
+        if len(heap) - self._stale < self._capacity :
+            position = len(heap)
+            heap.append((element, value))
+            self._sift_up(position)
+            return None
+        if not self._before(heap[0][1], value) :
+            return (element, value)
+        evicted = heap[0]
+        del index[evicted[0]]
+        heap[0] = (element, value)
+        self._sift_down(0)
+        return evicted
+
+    def _smallest_positions(self, k) :
+        # positions of the k least priorities in the heap, in priority order
+        if k <= 0 :
+            return []
+        return list(islice(self._ordered_positions(), k))
+
+    def _ordered_positions(self) :
+        # generates the positions of the heap in priority order, by walking the heap from the
+        # root with a frontier, which is a binary heap of the positions of the children of the
+        # positions generated so far
+        heap = self._heap
+        arity = self._arity
+        size = len(heap)
+        frontier = [0] if size > 0 else []
+        while frontier :
+            i = frontier[0]
+            if heap[i][0] is not _STALE :
+                yield i
+            # the first child of i, if any, replaces i at the root of the frontier, or otherwise
+            # the frontier's last position does, and then percolates down
+            first = arity * i + 1
+            last = min(first + arity, size)
+            if first < last :
+                current = first
+                first += 1
+            else :
+                current = frontier.pop()
+            n = len(frontier)
+            if n > 0 :
+                value = heap[current][1]
+                position = 0
+                child = 1
+                while child < n :
+                    if child + 1 < n and heap[frontier[child + 1]][1] < heap[frontier[child]][1] :
+                        child += 1
+                    if heap[frontier[child]][1] < value :
+                        frontier[position] = frontier[child]
+                        position = child
+                        child = 2 * position + 1
+                    else :
+                        break
+                frontier[position] = current
+            # the other children of i are added to the frontier, percolating up
+            for c in range(first, last) :
+                value = heap[c][1]
+                position = len(frontier)
+                frontier.append(c)
+                while position > 0 :
+                    p = (position - 1) >> 1
+                    if value < heap[frontier[p]][1] :
+                        frontier[position] = frontier[p]
+                        position = p
+                    else :
+                        break
+                frontier[position] = c
+
+    def _positions_while(self, test) :
+        # positions of the priorities satisfying a monotone test, in priority order
+        heap = self._heap
+        arity = self._arity
+        size = len(heap)
+        positions = []
+        stack = [0] if size > 0 else []
+        while stack :
+            i = stack.pop()
+            if test(heap[i][1]) :
+                if heap[i][0] is not _STALE :
+                    positions.append(i)
+                child = arity * i + 1
+                stack.extend(range(child, min(child + arity, size)))
+        positions.sort(key=lambda i : heap[i][1], reverse=self._descending)
+        return positions
+
+    def _extract_pairs(self, k) :
+        # extracts the k pairs with least priorities, where k is less than N, one at a time
+        heap = self._heap
+        index = self._index
+        sift_down = self._sift_down
+        pairs = []
+        for j in range(k) :
+            pairs.append(heap[0])
+            del index[heap[0][0]]
+            heap[0] = heap.pop()
+            sift_down(0)
+        return pairs
+
+    def _remove_positions(self, positions) :
+        # removes the pairs at the given positions, which are the first in priority order,
+        # all at once, and then rebuilds the heap
+        heap = self._heap
+        index = self._index
+        pairs = [heap[i] for i in positions]
+        for i in positions :
+            heap[i] = None
+        heap[:] = [p for p in heap if p is not None]
+        for p in pairs :
+            del index[p[0]]
+        self._heapify()
+        return pairs
+
+    def _compact_if_stale(self) :
+        # compacts the heap of a lazily deleting PQ if more than half of its slots are stale
+        if self._stale * 2 > len(self._heap) :
+            self._heapify()
+
+    def _percolate_down_discarding_stale(self, position) :
+        # percolates down, and then if position is the root, discards stale slots from the
+        # root until it is an element that is in the PQ
+        self._percolate_down_lazy(position)
+        if position == 0 :
+            heap = self._heap
+            while len(heap) > 0 and heap[0][0] is _STALE :
+                self._stale -= 1
+                last = heap.pop()
+                if len(heap) > 0 :
+                    heap[0] = last
+                    self._percolate_down_lazy(0)
+
+    # The lazy percolate methods, used by a lazily deleting PQ, move stale slots like any other, but
+    # only write the positions of elements in the PQ to the index, so the index has no entries for
+    # stale slots.
+
+    def _percolate_up_lazy(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        current = heap[position]
+        value = current[1]
+        while position > 0 :
+            p = (position - 1) // arity
+            parent = heap[p]
+            if value < parent[1] :
+                heap[position] = parent
+                if parent[0] is not _STALE :
+                    index[parent[0]] = position
+                position = p
+            else :
+                break
+        heap[position] = current
+        index[current[0]] = position
+
+    def _percolate_up_bin_search_lazy(self, position) :
+        new_position = self._get_ancestor_insertion_index(position)
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        current = heap[position]
+        while position != new_position :
+            p = (position - 1) // arity
+            parent = heap[p]
+            heap[position] = parent
+            if parent[0] is not _STALE :
+                index[parent[0]] = position
             position = p
-            p = PQ._parent(position)
-        self._heap[position] = current
-        self._index[self._heap[position][0]] = position
+        heap[position] = current
+        index[current[0]] = position
+
+    def _percolate_down_lazy(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = arity * position + 1
+        while child < size :
+            minChild = heap[child]
+            last = child + arity
+            if last > size :
+                last = size
+            for c in range(child + 1, last) :
+                if heap[c][1] < minChild[1] :
+                    child = c
+                    minChild = heap[c]
+            if minChild[1] < value :
+                heap[position] = minChild
+                if minChild[0] is not _STALE :
+                    index[minChild[0]] = position
+                position = child
+                child = arity * position + 1
+            else :
+                break
+        heap[position] = current
+        if current[0] is not _STALE :
+            index[current[0]] = position
+
+    # The percolate methods below compute the positions of parents and children from the heap's arity,
+    # and keep the heap, index and moving pair in locals.  Each pair that moves is written to the heap
+    # and the index once per level, and the percolating pair only once at its final position.  Percolating
+    # down has a version specialized to binary heaps, and a d-ary version.  MaxPQ overrides the methods
+    # that compare priorities in loops with versions that reverse each comparison.
+
+    def _percolate_up(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        current = heap[position]
+        value = current[1]
+        while position > 0 :
+            p = (position - 1) // arity
+            parent = heap[p]
+            if value < parent[1] :
+                heap[position] = parent
+                index[parent[0]] = position
+                position = p
+            else :
+                break
+        heap[position] = current
+        index[current[0]] = position
 
     def _percolate_up_bin_search(self, position) :
-        current_level = PQ._tree_level(position)
-        new_position = self._get_ancestor_insertion_index(position, current_level, 0, current_level)
-        current = self._heap[position]
+        new_position = self._get_ancestor_insertion_index(position)
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        current = heap[position]
         while position != new_position :
-            p = PQ._parent(position)
-            self._heap[position] = self._heap[p]
-            self._index[self._heap[position][0]] = position 
+            p = (position - 1) // arity
+            parent = heap[p]
+            heap[position] = parent
+            index[parent[0]] = position
             position = p
-        self._heap[position] = current
-        self._index[self._heap[position][0]] = position
-
-    def _get_ancestor_insertion_index(self, position, treeLevel, minTreeLevel, maxTreeLevel) :
-        if minTreeLevel >= maxTreeLevel :
-            return PQ._ancestor(position,treeLevel-maxTreeLevel)
-        midTreeLevel = (minTreeLevel + maxTreeLevel) // 2
-        if self._heap[position][1] < self._heap[PQ._ancestor(position,treeLevel-midTreeLevel)][1] :
-            return self._get_ancestor_insertion_index(position, treeLevel, minTreeLevel, midTreeLevel)
-        else :
-            return self._get_ancestor_insertion_index(position, treeLevel, midTreeLevel+1, maxTreeLevel)
+        heap[position] = current
+        index[current[0]] = position
+
+    def _get_ancestor_insertion_index(self, position) :
+        # binary search for the shallowest tree level whose ancestor of position has a
+        # priority greater than that of position, since priorities along the path are sorted
+        # (in a binary heap, the ancestor a levels above position is ((position + 1) >> a) - 1)
+        heap = self._heap
+        value = heap[position][1]
+        if self._arity != 2 :
+            return self._get_ancestor_insertion_index_dary(position, value)
+        oneBased = position + 1
+        treeLevel = oneBased.bit_length() - 1
+        minTreeLevel = 0
+        maxTreeLevel = treeLevel
+        while minTreeLevel < maxTreeLevel :
+            midTreeLevel = (minTreeLevel + maxTreeLevel) // 2
+            if value < heap[(oneBased >> (treeLevel-midTreeLevel)) - 1][1] :
+                maxTreeLevel = midTreeLevel
+            else :
+                minTreeLevel = midTreeLevel + 1
+        return (oneBased >> (treeLevel-maxTreeLevel)) - 1
+
+    def _get_ancestor_insertion_index_dary(self, position, value) :
+        # ancestors[k] is the ancestor k+1 levels above position, and those with priorities greater than
+        # value are a prefix of ancestors, whose length is found by binary search
+        heap = self._heap
+        arity = self._arity
+        ancestors = []
+        p = position
+        while p > 0 :
+            p = (p - 1) // arity
+            ancestors.append(p)
+        low = 0
+        high = len(ancestors)
+        while low < high :
+            mid = (low + high) // 2
+            if value < heap[ancestors[mid]][1] :
+                low = mid + 1
+            else :
+                high = mid
+        return ancestors[low-1] if low > 0 else position
         
 
     def _percolate_down(self, position) :
-        minChildPos = PQ._left(position)
-        current = self._heap[position]
-        while minChildPos < len(self._heap) :
-            if minChildPos + 1 < len(self._heap) and self._heap[minChildPos + 1][1] < self._heap[minChildPos][1] :
-                minChildPos = minChildPos + 1
-            if self._heap[minChildPos][1] < current[1] :
-                self._heap[position] = self._heap[minChildPos]
-                self._index[self._heap[position][0]] = position
-                position = minChildPos
-                minChildPos = PQ._left(position)
+        heap = self._heap
+        index = self._index
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = 2 * position + 1
+        while child < size :
+            minChild = heap[child]
+            if child + 1 < size and heap[child + 1][1] < minChild[1] :
+                child = child + 1
+                minChild = heap[child]
+            if minChild[1] < value :
+                heap[position] = minChild
+                index[minChild[0]] = position
+                position = child
+                child = 2 * position + 1
             else :        
                  break
-        self._heap[position] = current
-        self._index[self._heap[position][0]] = position
+        heap[position] = current
+        index[current[0]] = position
 
     def _percolate_down_no_index(self, position) :
-        minChildPos = PQ._left(position)
-        current = self._heap[position]
-        while minChildPos < len(self._heap) :
-            if minChildPos + 1 < len(self._heap) and self._heap[minChildPos + 1][1] < self._heap[minChildPos][1] :
-                minChildPos = minChildPos + 1
-            if self._heap[minChildPos][1] < current[1] :
-                self._heap[position] = self._heap[minChildPos]
-                position = minChildPos
-                minChildPos = PQ._left(position)
+        heap = self._heap
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = 2 * position + 1
+        while child < size :
+            minChild = heap[child]
+            if child + 1 < size and heap[child + 1][1] < minChild[1] :
+                child = child + 1
+                minChild = heap[child]
+            if minChild[1] < value :
+                heap[position] = minChild
+                position = child
+                child = 2 * position + 1
             else :        
                  break
-        self._heap[position] = current
+        heap[position] = current
+
+    def _percolate_down_dary(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = arity * position + 1
+        while child < size :
+            minChild = heap[child]
+            last = child + arity
+            if last > size :
+                last = size
+            for c in range(child + 1, last) :
+                if heap[c][1] < minChild[1] :
+                    child = c
+                    minChild = heap[c]
+            if minChild[1] < value :
+                heap[position] = minChild
+                index[minChild[0]] = position
+                position = child
+                child = arity * position + 1
+            else :
+                break
+        heap[position] = current
+        index[current[0]] = position
+
+    def _percolate_down_no_index_dary(self, position) :
+        heap = self._heap
+        arity = self._arity
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = arity * position + 1
+        while child < size :
+            minChild = heap[child]
+            last = child + arity
+            if last > size :
+                last = size
+            for c in range(child + 1, last) :
+                if heap[c][1] < minChild[1] :
+                    child = c
+                    minChild = heap[c]
+            if minChild[1] < value :
+                heap[position] = minChild
+                position = child
+                child = arity * position + 1
+            else :
+                break
+        heap[position] = current
 
 
 
 
 
 class MaxPQ(PQ) :
-    """A Priority Queue (PQ), with elements extracted max first, implemented with a binary heap.
+    """A Priority Queue (PQ), with elements extracted max first, implemented with a binary heap, or optionally a d-ary heap.
 
     A binary max heap is used to implement MaxPQ.  A python dictionary, i.e., associative array,
     is used to enable changing priorities, as well as removal of any element, in O(lg N) time.
@@ -330,37 +956,23 @@ class MaxPQ(PQ) :
 
     The add_all and merge methods run in O(min(N+k, k lg (N+k))) time where N is the current size of the PQ, and k is the number
     of new elements.
-    """
 
-    def __init__(self, pairs=[]) :    
-        super().__init__()
-        if len(pairs) > 0 :
-            for el,val in pairs :
-                self._heap.append((el,-val))
-            self._heapify()
-            
-    def add(self, element, value) :
-        return super().add(element, -value)
+    MaxPQ supports the same options as PQ, including a bounded capacity, in which case the elements with the greatest
+    priorities are evicted, keeping those with the least priorities.  The methods shared with PQ order elements by
+    maximum priority first, e.g., extract_many extracts the k elements with maximum priority values, extract_while
+    with a threshold extracts the elements with priority values greater than or equal to it, and drain and sorted_items
+    generate pairs in max priority order.
 
-    def add_all(self, pairs) :
-        if len(pairs) >= len(self._heap) :
-            for el,val in pairs :
-                if el not in self._index :
-                    self._heap.append((el,-val))
-            self._heapify()
-        else :
-            for el,val in pairs :
-                self.add(el,val)
+    MaxPQ doesn't negate priorities, so they may be of any totally ordered type, such as strings or tuples.  Rather,
+    it overrides the methods of PQ that compare priorities in loops, i.e., percolating up and down the heap, with
+    versions that reverse each comparison, so MaxPQ runs as fast as PQ.
+    """
 
-    def merge(self, q) :
-        if len(q._heap) >= len(self._heap) :
-            for el,val in q._heap :
-                if el not in self._index :
-                    self._heap.append((el,val))
-            self._heapify()
-        else :
-            for el,val in q._heap :
-                super().add(el,val)
+    _descending = True
+
+    @staticmethod
+    def _before(a, b) :
+        return b < a
 
     def peek_min(self) :
         """peek_min is not supported in a MaxPQ."""
@@ -375,16 +987,595 @@ class MaxPQ(PQ) :
     def peek_max(self) :
         """Returns, but does not remove, the element with the maximum priority value."""
         
-        return super().peek_min()
+        return self._heap[0][0]
 
     def extract_max(self) :
         """Removes and returns the element with maximum priority value."""
         
         return super().extract_min()
 
+    def nsmallest(self, k, with_priorities=False) :
+        """nsmallest is not supported in a MaxPQ."""
+        
+        raise NotImplementedError("nsmallest is not supported in a MaxPQ.")
+
+    def nlargest(self, k, with_priorities=False) :
+        """Returns, but does not remove, the k elements with maximum priority values, in priority order.
+
+        Keyword arguments:
+        k -- The number of elements.
+        with_priorities -- If True, returns a list of (element, value) pairs rather than only the elements.
+        """
+
+        return super().nsmallest(k, with_priorities)
+
+    # The methods below are those of PQ that compare priorities in loops, with each comparison
+    # of priorities a < b reversed to b < a, so that the heap is a max heap.
+
+    def _ordered_positions(self) :
+        # generates the positions of the heap in priority order, by walking the heap from the
+        # root with a frontier, which is a binary heap of the positions of the children of the
+        # positions generated so far
+        heap = self._heap
+        arity = self._arity
+        size = len(heap)
+        frontier = [0] if size > 0 else []
+        while frontier :
+            i = frontier[0]
+            if heap[i][0] is not _STALE :
+                yield i
+            # the first child of i, if any, replaces i at the root of the frontier, or otherwise
+            # the frontier's last position does, and then percolates down
+            first = arity * i + 1
+            last = min(first + arity, size)
+            if first < last :
+                current = first
+                first += 1
+            else :
+                current = frontier.pop()
+            n = len(frontier)
+            if n > 0 :
+                value = heap[current][1]
+                position = 0
+                child = 1
+                while child < n :
+                    if child + 1 < n and heap[frontier[child]][1] < heap[frontier[child + 1]][1] :
+                        child += 1
+                    if value < heap[frontier[child]][1] :
+                        frontier[position] = frontier[child]
+                        position = child
+                        child = 2 * position + 1
+                    else :
+                        break
+                frontier[position] = current
+            # the other children of i are added to the frontier, percolating up
+            for c in range(first, last) :
+                value = heap[c][1]
+                position = len(frontier)
+                frontier.append(c)
+                while position > 0 :
+                    p = (position - 1) >> 1
+                    if heap[frontier[p]][1] < value :
+                        frontier[position] = frontier[p]
+                        position = p
+                    else :
+                        break
+                frontier[position] = c
+
+    def _percolate_up(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        current = heap[position]
+        value = current[1]
+        while position > 0 :
+            p = (position - 1) // arity
+            parent = heap[p]
+            if parent[1] < value :
+                heap[position] = parent
+                index[parent[0]] = position
+                position = p
+            else :
+                break
+        heap[position] = current
+        index[current[0]] = position
+
+    def _get_ancestor_insertion_index(self, position) :
+        # binary search for the shallowest tree level whose ancestor of position has a
+        # priority less than that of position, since priorities along the path are sorted
+        # (in a binary heap, the ancestor a levels above position is ((position + 1) >> a) - 1)
+        heap = self._heap
+        value = heap[position][1]
+        if self._arity != 2 :
+            return self._get_ancestor_insertion_index_dary(position, value)
+        oneBased = position + 1
+        treeLevel = oneBased.bit_length() - 1
+        minTreeLevel = 0
+        maxTreeLevel = treeLevel
+        while minTreeLevel < maxTreeLevel :
+            midTreeLevel = (minTreeLevel + maxTreeLevel) // 2
+            if heap[(oneBased >> (treeLevel-midTreeLevel)) - 1][1] < value :
+                maxTreeLevel = midTreeLevel
+            else :
+                minTreeLevel = midTreeLevel + 1
+        return (oneBased >> (treeLevel-maxTreeLevel)) - 1
+
+    def _get_ancestor_insertion_index_dary(self, position, value) :
+        # ancestors[k] is the ancestor k+1 levels above position, and those with priorities less than
+        # value are a prefix of ancestors, whose length is found by binary search
+        heap = self._heap
+        arity = self._arity
+        ancestors = []
+        p = position
+        while p > 0 :
+            p = (p - 1) // arity
+            ancestors.append(p)
+        low = 0
+        high = len(ancestors)
+        while low < high :
+            mid = (low + high) // 2
+            if heap[ancestors[mid]][1] < value :
+                low = mid + 1
+            else :
+                high = mid
+        return ancestors[low-1] if low > 0 else position
+        
+
+    def _percolate_down(self, position) :
+        heap = self._heap
+        index = self._index
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = 2 * position + 1
+        while child < size :
+            maxChild = heap[child]
+            if child + 1 < size and maxChild[1] < heap[child + 1][1] :
+                child = child + 1
+                maxChild = heap[child]
+            if value < maxChild[1] :
+                heap[position] = maxChild
+                index[maxChild[0]] = position
+                position = child
+                child = 2 * position + 1
+            else :        
+                 break
+        heap[position] = current
+        index[current[0]] = position
+
+    def _percolate_down_no_index(self, position) :
+        heap = self._heap
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = 2 * position + 1
+        while child < size :
+            maxChild = heap[child]
+            if child + 1 < size and maxChild[1] < heap[child + 1][1] :
+                child = child + 1
+                maxChild = heap[child]
+            if value < maxChild[1] :
+                heap[position] = maxChild
+                position = child
+                child = 2 * position + 1
+            else :        
+                 break
+        heap[position] = current
+
+    def _percolate_down_dary(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = arity * position + 1
+        while child < size :
+            maxChild = heap[child]
+            last = child + arity
+            if last > size :
+                last = size
+            for c in range(child + 1, last) :
+                if maxChild[1] < heap[c][1] :
+                    child = c
+                    maxChild = heap[c]
+            if value < maxChild[1] :
+                heap[position] = maxChild
+                index[maxChild[0]] = position
+                position = child
+                child = arity * position + 1
+            else :
+                break
+        heap[position] = current
+        index[current[0]] = position
+
+    def _percolate_down_no_index_dary(self, position) :
+        heap = self._heap
+        arity = self._arity
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = arity * position + 1
+        while child < size :
+            maxChild = heap[child]
+            last = child + arity
+            if last > size :
+                last = size
+            for c in range(child + 1, last) :
+                if maxChild[1] < heap[c][1] :
+                    child = c
+                    maxChild = heap[c]
+            if value < maxChild[1] :
+                heap[position] = maxChild
+                position = child
+                child = arity * position + 1
+            else :
+                break
+        heap[position] = current
+
+    def _percolate_up_lazy(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        current = heap[position]
+        value = current[1]
+        while position > 0 :
+            p = (position - 1) // arity
+            parent = heap[p]
+            if parent[1] < value :
+                heap[position] = parent
+                if parent[0] is not _STALE :
+                    index[parent[0]] = position
+                position = p
+            else :
+                break
+        heap[position] = current
+        index[current[0]] = position
+
+    def _percolate_down_lazy(self, position) :
+        heap = self._heap
+        index = self._index
+        arity = self._arity
+        size = len(heap)
+        current = heap[position]
+        value = current[1]
+        child = arity * position + 1
+        while child < size :
+            maxChild = heap[child]
+            last = child + arity
+            if last > size :
+                last = size
+            for c in range(child + 1, last) :
+                if maxChild[1] < heap[c][1] :
+                    child = c
+                    maxChild = heap[c]
+            if value < maxChild[1] :
+                heap[position] = maxChild
+                if maxChild[0] is not _STALE :
+                    index[maxChild[0]] = position
+                position = child
+                child = arity * position + 1
+            else :
+                break
+        heap[position] = current
+        if current[0] is not _STALE :
+            index[current[0]] = position
+
+
+
+
+class IntPQ :
+    """A Priority Queue (PQ) of the integers [0..size-1] with float priorities, implemented with a binary heap of arrays.
+
+    Whereas PQ stores a tuple (element, value) per element in its heap, and a python dictionary to find
+    each element's position in the heap, IntPQ stores its heap as two parallel typed arrays, one of elements
+    and one of their priorities, and the position of each element in an array indexed by element.  Changing a
+    priority thus allocates no objects, comparisons read priorities directly from an array, and memory use is
+    a couple dozen bytes per element.  This suits graph algorithms whose elements are the vertices 0..n-1.
+
+    Priorities are stored as floats, so get_priority returns a float even if an int priority was given.
+
+    Elements outside [0..size-1] raise a KeyError in every method but contains, which returns False for them.
+
+    Assuming a PQ with N elements, the runtimes of the operations are as follows.
+
+    The following operations run in O(lg N) time: add, extract_min, change_priority, remove.
+
+    The following operations run in O(1) time: peek_min, contains, get_priority, size, is_empty.
+
+    The following operations run in O(N) time: __init__ to initialize PQ with a list of N (element, value) pairs,
+    aside from the O(size) allocation of the array of positions.
+
+    The add_all and merge methods run in O(min(N+k, k lg (N+k))) time where N is the current size of the PQ, and k is the number
+    of new elements.
+    """
+
+    __slots__ = ['_heap', '_keys', '_position']
+
+    def __init__(self, size, pairs=[]) :
+        """Initialize a PQ of the integers in interval [0..size-1].
+
+        PQ is empty is pairs is empty.  Otherwise, intialized to a heap consisting of the
+        (element, value) pairs in pairs, excluding all but the first pair for each element.
+
+        Keyword arguments:
+        size -- The elements of the PQ must be in the interval [0..size-1].
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
+        """
+
+        typecode = 'i' if size <= 1 << 31 else 'q'
+        self._heap = array(typecode)
+        self._keys = array('d')
+        # position of each element in the heap, or -1 if not in the PQ
+        self._position = array(typecode, [-1]) * size
+        self.add_all(pairs)
+
+
+    def size(self) :
+        """Size of the PQ."""
+        
+        return len(self._heap)
+    
+
+    def is_empty(self) :
+        """Returns True if PQ is empty and False otherwise."""
+        
+        return len(self._heap) == 0
+
+
+    def add(self, element, value) :
+        """Adds an element to the PQ with a specified priority.
+
+        Adds the element to the PQ provided PQ doesn't already contain it.
+        Does nothing if the PQ already contains the element.
+
+        Returns True if element added and False if already present.
+
+        Keyword arguments:
+        element -- The element to add, an integer in [0..size-1].
+        value -- The priority of the element.
+        """
+
+        if not 0 <= element < len(self._position) :
+            raise KeyError(element)
+        if self._position[element] >= 0 :
+            return False
+        position = len(self._heap)
+        # the key goes first, since a value that isn't a float fails to append
+        self._keys.append(value)
+        self._heap.append(element)
+        self._percolate_up(position)
+        return True
+
+
+    def add_all(self, pairs) :
+        """Adds (element, value) pairs to the PQ.
+
+        Adds the (element, value) pairs from pairs to the PQ.  Only the
+        pairs for which element is not already in the PQ are added.
+
+        Keyword arguments:
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element.
+        """
+
+        heap = self._heap
+        keys = self._keys
+        position = self._position
+        start = len(heap)
+        try :
+            for el,val in pairs :
+                if not 0 <= el < len(position) :
+                    raise KeyError(el)
+                if position[el] < 0 :
+                    keys.append(val)
+                    position[el] = len(heap)
+                    heap.append(el)
+        finally :
+            # the pairs appended before any error, such as a KeyError or a value that isn't a float,
+            # are kept, so the heap is restored either way
+            if len(heap) - start >= start :
+                self._heapify()
+            else :
+                for i in range(start, len(heap)) :
+                    self._percolate_up(i)
+
+
+    def merge(self, q) :
+        """Merges an IntPQ into this PQ.
+
+        Adds all (element, value) pairs from a given IntPQ to this PQ.  Only the
+        pairs for which element is not already in this PQ are added (duplicates are exluded).
+
+        Keyword arguments:
+        q -- An IntPQ to merge with this one.  q is not changed.
+        """
+
+        self.add_all(zip(q._heap, q._keys))
+
+
+    def peek_min(self) :
+        """Returns, but does not remove, the element with the minimum priority value."""
+        
+        return self._heap[0]
+
+
+    def extract_min(self) :
+        """Removes and returns the element with minimum priority value."""
+        
+        heap = self._heap
+        keys = self._keys
+        minElement = heap[0]
+        last = heap.pop()
+        lastKey = keys.pop()
+        self._position[minElement] = -1
+        if len(heap) > 0 :
+            heap[0] = last
+            keys[0] = lastKey
+            self._percolate_down(0)
+        return minElement
+
+
+    def contains(self, element) :
+        """Returns True if element is in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element
+        """
+        
+        return 0 <= element < len(self._position) and self._position[element] >= 0
+
+
     def get_priority(self, element) :
-        return -super().get_priority(element)
+        """Gets the current priority of the specified element.
+
+        Raises KeyError if the element is not in the PQ.
+
+        Keyword arguments:
+        element -- The element
+        """
+        
+        if not 0 <= element < len(self._position) :
+            raise KeyError(element)
+        position = self._position[element]
+        if position < 0 :
+            raise KeyError(element)
+        return self._keys[position]
+
 
     def change_priority(self, element, value) :
-        return super().change_priority(element, -value)
+        """Changes the priority of an element in the PQ.
+
+        Changes the priority of an element that is in the PQ.
+        Does nothing if the PQ doesn't contains the element.
+
+        Returns True if element is present in the PQ and False otherwise.
 
+        Keyword arguments:
+        element -- The element to add.
+        value -- The new priority for the element.
+        """
+        
+        if not 0 <= element < len(self._position) :
+            raise KeyError(element)
+        position = self._position[element]
+        if position < 0 :
+            return False
+        keys = self._keys
+        old = keys[position]
+        if value < old :
+            keys[position] = value
+            self._percolate_up(position)
+        elif old < value :
+            keys[position] = value
+            self._percolate_down(position)
+        return True
+
+
+    def remove(self, element) :
+        """Removes a specified element from the PQ.
+
+        Removes a specified element from the PQ, if it is present.
+        Returns True if element removed, and False if not present in PQ.
+
+        Keyword arguments:
+        element -- The element to remove.
+        """
+
+        if not 0 <= element < len(self._position) :
+            raise KeyError(element)
+        position = self._position[element]
+        if position < 0 :
+            return False
+        self._position[element] = -1
+        heap = self._heap
+        keys = self._keys
+        last = heap.pop()
+        lastKey = keys.pop()
+        if position < len(heap) :
+            heap[position] = last
+            keys[position] = lastKey
+            if position > 0 and lastKey < keys[(position-1) >> 1] :
+                self._percolate_up(position)
+            else :
+                self._percolate_down(position)
+        return True
+
+
+    def _heapify(self) :
+        for i in range(len(self._heap) // 2 - 1, -1, -1) :
+            self._percolate_down(i)
+
+    # As in PQ, the percolate methods write each element that moves, and its priority and position,
+    # once per level, and the percolating element only once at its final position.
+
+    def _percolate_up(self, position) :
+        heap = self._heap
+        keys = self._keys
+        index = self._position
+        element = heap[position]
+        key = keys[position]
+        while position > 0 :
+            p = (position - 1) >> 1
+            parentKey = keys[p]
+            if key < parentKey :
+                parent = heap[p]
+                heap[position] = parent
+                keys[position] = parentKey
+                index[parent] = position
+                position = p
+            else :
+                break
+        heap[position] = element
+        keys[position] = key
+        index[element] = position
+
+    def _percolate_down(self, position) :
+        heap = self._heap
+        keys = self._keys
+        index = self._position
+        size = len(heap)
+        element = heap[position]
+        key = keys[position]
+        child = 2 * position + 1
+        while child < size :
+            childKey = keys[child]
+            right = child + 1
+            if right < size and keys[right] < childKey :
+                child = right
+                childKey = keys[right]
+            if childKey < key :
+                minChild = heap[child]
+                heap[position] = minChild
+                keys[position] = childKey
+                index[minChild] = position
+                position = child
+                child = 2 * position + 1
+            else :
+                break
+        heap[position] = element
+        keys[position] = key
+        index[element] = position
+
+
+# The batch methods rebuild the heap, rather than operating on one element at a time, when the
+# batch is at least 1/_REBUILD_FACTOR of the heap for extract_many and extract_while, and likewise
+# for change_priorities and remove_all.  Random changes and removals move elements only a level or
+# two on average, so those need larger batches before rebuilding pays off.
+_REBUILD_FACTOR = 16
+_CHANGE_REBUILD_FACTOR = 2
+_REMOVE_REBUILD_FACTOR = 3
+
+_SIFT_UP_STRATEGIES = {
+    "linear" : "_percolate_up",
+    "binary" : "_percolate_up_bin_search"
+}
+
+_LAZY_SIFT_UP_STRATEGIES = {
+    "linear" : "_percolate_up_lazy",
+    "binary" : "_percolate_up_bin_search_lazy"
+}
+
+# marks a stale slot of the heap of a lazily deleting PQ, in place of its element
+_STALE = object()
@@ -0,0 +1,243 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+
+class RadixPQ :
+    """A Priority Queue (PQ) of non-negative integer priorities, for monotone use, implemented with a radix heap.
+
+    A radix heap relies on the priorities extracted from it never decreasing, as in Dijkstra's algorithm
+    with non-negative integer edge weights.  It keeps the priority last of the most recently extracted
+    element, and puts each element in one of a list of buckets, according to the highest bit in which its
+    priority differs from last:  bucket 0 holds the elements whose priority equals last, and bucket i holds
+    those whose priorities differ from last first in bit i-1.  Extracting from an empty bucket 0 finds the
+    first non-empty bucket, makes its minimum priority the new last, and redistributes its elements into
+    lower buckets.  Since an element only ever moves to a lower bucket, each element moves at most lg C times,
+    where C is the largest priority.  Each bucket is a python dictionary from element to priority, and another
+    python dictionary maps each element to its bucket, so that there are no comparisons of priorities, other
+    than to find the minimum of a bucket when it is redistributed.
+
+    Priorities must be integers no less than the priority of the last element extracted (or peeked at, since
+    peek_min also redistributes a bucket), which is 0 for a new PQ.  Adding an element, or changing a priority,
+    to a lesser value raises a ValueError.  Priorities may otherwise be increased as well as decreased.
+
+    Elements must be of a hashable type (due to use of Python dictionary).  However, be careful
+    when mutating state of an element that is already in the PQ, and don't change any element property
+    that is used in generating the hash or else you will break the PQ.
+
+    Assuming a PQ with N elements, and largest priority C, the runtimes of the operations are as follows.
+
+    The following operations run in O(1) time: add, change_priority, remove, contains, get_priority, size,
+    is_empty.
+
+    The following operations run in O(lg C) amortized time: extract_min, peek_min.
+
+    The following operations run in O(N) time: __init__ to initialize PQ with a list of N (element, value) pairs.
+
+    The add_all method runs in O(k) time where k is the number of new elements.
+    """
+
+    __slots__ = ['_buckets', '_index', '_last']
+
+    def __init__(self, pairs=[]) :
+        """Initialize a PQ.
+
+        PQ is empty is pairs is empty.  Otherwise, intialized to a radix heap consisting of the
+        (element, value) pairs in pairs, excluding all but the first pair for each element.
+
+        Keyword arguments:
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element, a non-negative integer.
+        """
+
+        self._buckets = [{}]
+        # bucket of each element
+        self._index = {}
+        self._last = 0
+        self.add_all(pairs)
+
+
+    def size(self) :
+        """Size of the PQ."""
+
+        return len(self._index)
+
+
+    def is_empty(self) :
+        """Returns True if PQ is empty and False otherwise."""
+
+        return not self._index
+
+
+    def add(self, element, value) :
+        """Adds an element to the PQ with a specified priority.
+
+        Adds the element to the PQ provided PQ doesn't already contain it.
+        Does nothing if the PQ already contains the element.
+
+        Returns True if element added and False if already present.
+
+        Raises a ValueError if value is less than the priority of the last element extracted.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The priority of the element, an integer.
+        """
+
+        index = self._index
+        if element in index :
+            return False
+        i = self._bucket(value)
+        self._buckets[i][element] = value
+        index[element] = i
+        return True
+
+
+    def add_all(self, pairs) :
+        """Adds (element, value) pairs to the PQ.
+
+        Adds the (element, value) pairs from pairs to the PQ.  Only the
+        pairs for which element is not already in the PQ are added, and for each element
+        only its first pair.
+
+        Keyword arguments:
+        pairs -- An iterable, such as a list or generator, of 2-tuples of the form (element, value)
+                where value is the priority of element, an integer.
+        """
+
+        add = self.add
+        for el,val in pairs :
+            add(el,val)
+
+
+    def peek_min(self) :
+        """Returns, but does not remove, the element with the minimum priority value."""
+
+        bucket = self._buckets[0]
+        if not bucket :
+            bucket = self._redistribute()
+        return next(reversed(bucket))
+
+
+    def extract_min(self) :
+        """Removes and returns the element with minimum priority value."""
+
+        bucket = self._buckets[0]
+        if not bucket :
+            bucket = self._redistribute()
+        element = bucket.popitem()[0]
+        del self._index[element]
+        return element
+
+
+    def contains(self, element) :
+        """Returns True if element is in the PQ and False otherwise.
+
+        Keyword arguments:
+        element -- The element
+        """
+
+        return element in self._index
+
+
+    def get_priority(self, element) :
+        """Gets the current priority of the specified element.
+
+        Keyword arguments:
+        element -- The element
+        """
+
+        return self._buckets[self._index[element]][element]
+
+
+    def change_priority(self, element, value) :
+        """Changes the priority of an element in the PQ.
+
+        Changes the priority of an element that is in the PQ.
+        Does nothing if the PQ doesn't contains the element.
+
+        Returns True if element is present in the PQ and False otherwise.
+
+        Raises a ValueError if value is less than the priority of the last element extracted.
+
+        Keyword arguments:
+        element -- The element to add.
+        value -- The new priority for the element, an integer.
+        """
+
+        index = self._index
+        old = index.get(element)
+        if old is None :
+            return False
+        i = self._bucket(value)
+        buckets = self._buckets
+        if i == old :
+            buckets[i][element] = value
+        else :
+            del buckets[old][element]
+            buckets[i][element] = value
+            index[element] = i
+        return True
+
+
+    def remove(self, element) :
+        """Removes a specified element from the PQ.
+
+        Removes a specified element from the PQ, if it is present.
+        Returns True if element removed, and False if not present in PQ.
+
+        Keyword arguments:
+        element -- The element to remove.
+        """
+
+        i = self._index.pop(element, None)
+        if i is None :
+            return False
+        del self._buckets[i][element]
+        return True
+
+
+    def _bucket(self, value) :
+        # the bucket for priority value, adding buckets as needed
+        last = self._last
+        if value < last :
+            raise ValueError("priority " + str(value) + " is less than the last extracted priority " + str(last))
+        i = (value ^ last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= i :
+            buckets.append({})
+        return i
+
+
+    def _redistribute(self) :
+        # moves the elements of the first non-empty bucket into lower buckets, relative to
+        # their minimum priority, which becomes last, and returns bucket 0, which is now non-empty
+        buckets = self._buckets
+        i = 1
+        while not buckets[i] :
+            i += 1
+        bucket = buckets[i]
+        last = min(bucket.values())
+        self._last = last
+        index = self._index
+        for e, v in bucket.items() :
+            j = (v ^ last).bit_length()
+            buckets[j][e] = v
+            index[e] = j
+        bucket.clear()
+        return buckets[0]
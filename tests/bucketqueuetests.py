@@ -0,0 +1,84 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+sys.path.append('../lib')
+
+import unittest
+from bucketqueue import BucketPQ
+from pqtests import check_random_operations, extract_all
+from random import shuffle, seed
+
+class TestBucketPQ(unittest.TestCase) :
+
+    def test_empty(self) :
+        q = BucketPQ(10)
+        self.assertTrue(q.is_empty())
+        self.assertEqual(q.size(), 0)
+        self.assertFalse(q.contains(1))
+        self.assertFalse(q.remove(1))
+        self.assertFalse(q.change_priority(1, 5))
+        self.assertRaises(ValueError, BucketPQ, 0)
+
+    def test_init_and_add(self) :
+        pairs = [(i, i % 7) for i in range(50)]
+        shuffle(pairs)
+        q = BucketPQ(8, pairs)
+        self.assertEqual(q.size(), 50)
+        self.assertFalse(q.add(3, 0))
+        self.assertEqual(q.get_priority(3), 3)
+        self.assertTrue(q.add(50, 7))
+        values = [v for e, v in extract_all(self, q)]
+        self.assertEqual(values, sorted(i % 7 for i in range(50)) + [7])
+
+    def test_add_all_and_merge(self) :
+        q = BucketPQ(10, [(1, 5), (2, 3)])
+        q.add_all(iter([(2, 0), (3, 4), (4, 1), (4, 9)]))
+        r = BucketPQ(10, [(3, 0), (5, 2), (6, 9)])
+        q.merge(r)
+        q.merge(q)
+        self.assertEqual(r.size(), 3)
+        self.assertEqual(extract_all(self, q), [(4, 1), (5, 2), (2, 3), (3, 4), (1, 5), (6, 9)])
+
+    def test_out_of_range(self) :
+        q = BucketPQ(4, [(1, 2)])
+        for value in (-1, 4) :
+            self.assertRaises(ValueError, q.add, 2, value)
+            self.assertRaises(ValueError, q.change_priority, 1, value)
+        self.assertFalse(q.contains(2))
+        self.assertEqual(q.get_priority(1), 2)
+
+    def test_cursor_moves_back(self) :
+        q = BucketPQ(10, [(i, i) for i in range(5, 10)])
+        self.assertEqual(q.extract_min(), 5)
+        self.assertTrue(q.add(1, 1))
+        self.assertTrue(q.change_priority(9, 0))
+        self.assertTrue(q.remove(6))
+        self.assertEqual(extract_all(self, q), [(9, 0), (1, 1), (7, 7), (8, 8)])
+        q.add(2, 3)
+        self.assertEqual(q.extract_min(), 2)
+
+    def test_random_operations(self) :
+        seed(24)
+        for steps in (10, 100, 5000) :
+            check_random_operations(self, BucketPQ(1000), steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+sys.path.append('../lib')
+
+import unittest
+from calendarqueue import CalendarPQ
+from pqtests import check_random_operations, extract_all
+from random import random, expovariate, shuffle, seed
+
+class TestCalendarPQ(unittest.TestCase) :
+
+    def test_empty(self) :
+        q = CalendarPQ()
+        self.assertTrue(q.is_empty())
+        self.assertEqual(q.size(), 0)
+        self.assertFalse(q.contains(1))
+        self.assertFalse(q.remove(1))
+        self.assertFalse(q.change_priority(1, 5))
+        self.assertRaises(IndexError, q.peek_min)
+        self.assertRaises(IndexError, q.extract_min)
+        q.add(1, 5)
+        q.extract_min()
+        self.assertRaises(IndexError, q.extract_min)
+
+    def test_init_and_add(self) :
+        pairs = [(i, i % 7) for i in range(50)]
+        shuffle(pairs)
+        q = CalendarPQ(pairs)
+        self.assertEqual(q.size(), 50)
+        self.assertFalse(q.add(3, -1))
+        self.assertEqual(q.get_priority(3), 3)
+        self.assertTrue(q.add(50, -1.5))
+        self.assertEqual(q.peek_min(), 50)
+        self.assertEqual(q.extract_min(), 50)
+        values = [v for e, v in extract_all(self, q)]
+        self.assertEqual(values, sorted(i % 7 for i in range(50)))
+
+    def test_add_all_and_merge(self) :
+        q = CalendarPQ([(1, 5), (2, 3)])
+        q.add_all(iter([(2, 0), (3, 4), (4, 1), (4, 9)]))
+        r = CalendarPQ([(3, 0), (5, 2), (6, 90)])
+        q.merge(r)
+        q.merge(q)
+        self.assertEqual(r.size(), 3)
+        self.assertEqual(extract_all(self, q), [(4, 1), (5, 2), (2, 3), (3, 4), (1, 5), (6, 90)])
+
+    def test_equal_priorities_in_order_added(self) :
+        q = CalendarPQ([(i, 2.5) for i in range(10)])
+        self.assertTrue(q.change_priority(3, 2.5))
+        q.add(10, 2.5)
+        self.assertEqual([e for e, v in extract_all(self, q)], [0, 1, 2, 4, 5, 6, 7, 8, 9, 3, 10])
+
+    def test_change_priority_and_remove(self) :
+        q = CalendarPQ([(i, i) for i in range(20)])
+        self.assertEqual(q.extract_min(), 0)
+        self.assertTrue(q.change_priority(15, -1))
+        self.assertTrue(q.change_priority(1, 30))
+        self.assertTrue(q.change_priority(7, 7))
+        for e in (19, 10, 4) :
+            self.assertTrue(q.remove(e))
+            self.assertFalse(q.contains(e))
+        self.assertFalse(q.remove(4))
+        expected = [(15, -1)] + [(i, i) for i in range(2, 19) if i not in (4, 10, 15)] + [(1, 30)]
+        self.assertEqual(extract_all(self, q), expected)
+
+    def test_sparse_priorities(self) :
+        # priorities far apart, and an add before the current day after extractions
+        values = [1e9, -1e9, 0.001, 0.002, 12345.6, 1e-12, 7e6]
+        q = CalendarPQ(enumerate(values))
+        self.assertEqual(q.extract_min(), 1)
+        self.assertEqual(q.extract_min(), 5)
+        q.add(7, -5e8)
+        self.assertEqual(q.peek_min(), 7)
+        self.assertEqual([v for e, v in extract_all(self, q)], [-5e8, 0.001, 0.002, 12345.6, 7e6, 1e9])
+
+    def test_priorities_not_finite(self) :
+        q = CalendarPQ([(0, 1.0), (1, 2.0)])
+        for value in (float('inf'), float('-inf'), float('nan')) :
+            self.assertRaises(ValueError, q.add, 2, value)
+            self.assertRaises(ValueError, q.change_priority, 1, value)
+            self.assertFalse(q.contains(2))
+            self.assertEqual(q.size(), 2)
+            self.assertEqual(q.get_priority(1), 2.0)
+        self.assertRaises(TypeError, q.add, 2, "x")
+        self.assertEqual(extract_all(self, q), [(0, 1.0), (1, 2.0)])
+
+    def test_far_apart_priorities(self) :
+        # the priorities at the front are so close together that a day width from them would leave
+        # the last priority without a day that fits in a float
+        q = CalendarPQ((i, i * 1e-300) for i in range(10))
+        q.add(10, 1e10)
+        q.add_all((i, i * 1e-300) for i in range(11, 40))
+        self.assertEqual([e for e, v in extract_all(self, q)], list(range(10)) + list(range(11, 40)) + [10])
+
+    def test_grow_and_shrink(self) :
+        seed(25)
+        n = 3000
+        q = CalendarPQ()
+        values = [random() * 100 for i in range(n)]
+        for i, v in enumerate(values) :
+            q.add(i, v)
+        for i in range(0, n, 2) :
+            self.assertTrue(q.remove(i))
+        self.assertEqual(q.size(), n // 2)
+        expected = sorted(values[1::2])
+        for v in expected[:n // 2 - 10] :
+            self.assertEqual(q.get_priority(q.peek_min()), v)
+            q.extract_min()
+        self.assertEqual(q.size(), 10)
+        self.assertEqual([v for e, v in extract_all(self, q)], expected[n // 2 - 10:])
+
+    def test_hold_model(self) :
+        seed(25)
+        for mean in (1.0, 0.001, 1000.0) :
+            q = CalendarPQ((i, expovariate(1 / mean)) for i in range(1000))
+            now = float('-inf')
+            for i in range(5000) :
+                e = q.peek_min()
+                t = q.get_priority(e)
+                self.assertEqual(q.extract_min(), e)
+                self.assertLessEqual(now, t)
+                now = t
+                q.add(e, now + expovariate(1 / mean))
+                self.assertEqual(q.size(), 1000)
+
+    def test_random_operations(self) :
+        seed(25)
+        for steps in (10, 100, 5000) :
+            check_random_operations(self, CalendarPQ(), steps)
+
+
+if __name__ == '__main__':
+    unittest.main()
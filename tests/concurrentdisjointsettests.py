@@ -0,0 +1,139 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+sys.path.append('../lib')
+
+import unittest
+from threading import Thread
+from random import randrange, seed
+from io import BytesIO
+from disjointsets import DisjointSets, IntDisjointSets
+from concurrentdisjointsets import ConcurrentIntDisjointSets, parallel_union_all
+
+def random_pairs(n, m) :
+    return [(randrange(n), randrange(n)) for i in range(m)]
+
+class TestConcurrentIntDisjointSets(unittest.TestCase) :
+
+    def setUp(self) :
+        # switch threads very frequently, to make interleavings within union and find likely
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self) :
+        sys.setswitchinterval(self.interval)
+
+    def check_same(self, ds, reference, n) :
+        self.assertEqual(ds.num_sets(), reference.num_sets())
+        self.assertEqual(list(ds.to_labels()), list(reference.to_labels()))
+        for i in range(n) :
+            self.assertEqual(ds.set_size(i), reference.set_size(i))
+            self.assertEqual(sorted(ds.members(i)), sorted(reference.members(i)))
+
+    def test_single_thread(self) :
+        n = 200
+        seed(31)
+        pairs = random_pairs(n, 150)
+        ds = ConcurrentIntDisjointSets(n, stripes=4)
+        reference = IntDisjointSets(n)
+        for x, y in pairs :
+            ds.union(x, y)
+            reference.union(x, y)
+        self.check_same(ds, reference, n)
+        self.assertEqual(ds.same_set_all(pairs), [True] * len(pairs))
+
+    def test_elements_outside_forest(self) :
+        ds = ConcurrentIntDisjointSets(5)
+        for x in (-1, 5) :
+            self.assertRaises(KeyError, ds.union, x, 0)
+            self.assertRaises(KeyError, ds.find_set, x)
+        self.assertEqual(ds.num_sets(), 5)
+        self.assertEqual(ds.members(4), [4])
+
+    def test_threads(self) :
+        n = 600
+        for link in ("rank", "size", "random") :
+            for find in ("compression", "halving", "splitting") :
+                seed(37)
+                pairs = random_pairs(n, 540)
+                ds = ConcurrentIntDisjointSets(n, find, link, stripes=8)
+                threads = [Thread(target=ds.union_all, args=(pairs[i::4],)) for i in range(4)]
+                threads += [Thread(target=ds.find_all, args=(range(n),)) for i in range(2)]
+                for t in threads :
+                    t.start()
+                for t in threads :
+                    t.join()
+                reference = IntDisjointSets(n)
+                reference.union_all(pairs)
+                self.check_same(ds, reference, n)
+
+    def test_one_stripe(self) :
+        n = 500
+        seed(41)
+        pairs = random_pairs(n, 400)
+        ds = ConcurrentIntDisjointSets(n, stripes=1)
+        threads = [Thread(target=ds.union_all, args=(pairs[i::3],)) for i in range(3)]
+        for t in threads :
+            t.start()
+        for t in threads :
+            t.join()
+        reference = IntDisjointSets(n)
+        reference.union_all(pairs)
+        self.check_same(ds, reference, n)
+
+    def test_snapshot(self) :
+        n = 100
+        seed(43)
+        ds = ConcurrentIntDisjointSets(n)
+        ds.union_all(random_pairs(n, 60))
+        f = BytesIO()
+        ds.snapshot(f)
+        f.seek(0)
+        restored = ConcurrentIntDisjointSets.restore(f)
+        self.assertEqual(restored.num_sets(), ds.num_sets())
+        self.assertEqual(list(restored.to_labels()), list(ds.to_labels()))
+        f.seek(0)
+        self.assertEqual(IntDisjointSets.restore(f).num_sets(), ds.num_sets())
+
+
+class TestParallelUnionAll(unittest.TestCase) :
+
+    def test_parallel(self) :
+        n = 1000
+        seed(47)
+        pairs = random_pairs(n, 900)
+        reference = DisjointSets(n)
+        reference.union_all(pairs)
+        for workers in (1, 2, 3) :
+            ds = parallel_union_all(n, pairs, workers)
+            self.assertEqual(ds.num_sets(), reference.num_sets())
+            self.assertEqual(list(ds.to_labels()), [reference.to_labels()[i] for i in range(n)])
+            for i in range(0, n, 7) :
+                self.assertEqual(sorted(ds.members(i)), sorted(reference.members(i)))
+
+    def test_empty(self) :
+        ds = parallel_union_all(5, [], 2)
+        self.assertEqual(ds.num_sets(), 5)
+        ds = parallel_union_all(5, [(0, 1)], 4, "halving", "size")
+        self.assertEqual(ds.num_sets(), 4)
+        self.assertEqual(ds._find.__name__, "_find_set_halving")
+
+
+if __name__ == '__main__':
+    unittest.main()
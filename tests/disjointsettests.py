@@ -21,6 +21,12 @@ sys.path.append('../lib')
 
 import unittest
 from disjointsets import DisjointSets
+from disjointsets import IntDisjointSets
+from disjointsets import RollbackDisjointSets
+from disjointsets import _index_typecode
+from array import array
+from random import randrange, seed
+from io import BytesIO
 
 def init_ds(size) :
     ds = DisjointSets()
@@ -148,6 +154,573 @@ class TestDisjointSets(unittest.TestCase) :
     
         
 
+class TestIntDisjointSets(unittest.TestCase) :
+
+    def test_one(self):
+        ds = IntDisjointSets(1)
+        self.assertEqual(ds.find_set(0),0)
+        self.assertEqual(ds.size(),1)
+        self.assertTrue(ds.in_forest(0))
+        self.assertFalse(ds.in_forest(1))
+        self.assertFalse(ds.in_forest(-1))
+
+    def test_empty(self):
+        ds = IntDisjointSets(0)
+        self.assertEqual(ds.size(),0)
+        self.assertFalse(ds.in_forest(0))
+
+    def test_two(self):
+        ds = IntDisjointSets(2)
+        self.assertEqual(ds.find_set(0),0)
+        self.assertEqual(ds.find_set(1),1)
+        self.assertFalse(ds.in_set(0,1))
+        ds.union(0,1)
+        self.assertEqual(ds.find_set(0),ds.find_set(1))
+        self.assertTrue(ds.in_set(0,1))
+        ds.union(1,0)
+        self.assertTrue(ds.in_set(1,0))
+
+    def test_one_at_a_time(self) :
+        for to in range(1,16) :
+            ds = IntDisjointSets(16)
+            for i in range(1,to+1) :
+                self.assertFalse(ds.in_set(i,0))
+                ds.union(0,i)
+                self.assertTrue(ds.in_set(i,0))
+            for i in range(16) :
+                self.assertTrue(ds.in_forest(i))
+                if i <= to :
+                    self.assertEqual(ds.find_set(0),ds.find_set(i))
+                else :
+                    self.assertEqual(ds.find_set(i),i)
+
+    def test_two_at_a_time(self) :
+        ds = IntDisjointSets(16)
+        for i in range(0,16,2) :
+            ds.union(i,i+1)
+        for i in range(0,16,4) :
+            ds.union(i,i+2)
+        for i in range(15) :
+            for j in range(i+1,16) :
+                if i//4 == j//4 :
+                    self.assertEqual(ds.find_set(i),ds.find_set(j))
+                else :
+                    self.assertNotEqual(ds.find_set(i),ds.find_set(j))
+
+    def test_elements_outside_forest(self) :
+        for strategy in ("compression", "halving", "splitting") :
+            for ds in (DisjointSets(5, strategy), IntDisjointSets(5, strategy)) :
+                for x in (-1, 5) :
+                    self.assertRaises(KeyError, ds.union, x, 0)
+                    self.assertRaises(KeyError, ds.union, 0, x)
+                    self.assertRaises(KeyError, ds.find_set, x)
+                    self.assertRaises(KeyError, ds.in_set, x, 0)
+                    self.assertRaises(KeyError, ds.set_size, x)
+                    self.assertRaises(KeyError, ds.members, x)
+                    self.assertRaises(KeyError, ds.union_all, [(0, 1), (x, 2)])
+                self.assertEqual(ds.num_sets(), 4)
+                self.assertEqual(ds.members(4), [4])
+
+    def test_size_typecode(self) :
+        # set sizes reach size itself, so the arrays must hold values up to size inclusive
+        for code in ('i', 'q') :
+            bits = 8 * array(code).itemsize - 1
+            self.assertEqual(array(_index_typecode((1 << bits) - 1)).itemsize, array(code).itemsize)
+        self.assertGreater(array(_index_typecode(1 << 31)).itemsize, 4)
+
+    def test_same_partition_as_disjointsets(self) :
+        seed(42)
+        n = 200
+        ids = IntDisjointSets(n)
+        ds = DisjointSets(n)
+        for k in range(150) :
+            x, y = randrange(n), randrange(n)
+            ids.union(x,y)
+            ds.union(x,y)
+        for i in range(n) :
+            for j in range(i, n, 7) :
+                self.assertEqual(ids.in_set(i,j), ds.in_set(i,j))
+
+class TestFindStrategies(unittest.TestCase) :
+
+    strategies = ["compression", "halving", "splitting"]
+
+    def test_invalid_strategy(self) :
+        self.assertRaises(ValueError, DisjointSets, 4, "bogus")
+        self.assertRaises(ValueError, IntDisjointSets, 4, "bogus")
+
+    def test_long_chain(self) :
+        # chains this long are not reachable via union by rank, so build one directly
+        n = 5 * sys.getrecursionlimit()
+        for strategy in self.strategies :
+            ds = DisjointSets(n, strategy)
+            for i in range(n-1) :
+                ds._nodes[i].p = ds._nodes[i+1]
+            self.assertEqual(ds.find_set(0), n-1)
+            self.assertEqual(ds.find_set(n//2), n-1)
+            self.assertTrue(ds.in_set(0, n-1))
+            ids = IntDisjointSets(n, strategy)
+            for i in range(n-1) :
+                ids._parent[i] = i+1
+            self.assertEqual(ids.find_set(0), n-1)
+            self.assertEqual(ids.find_set(n//2), n-1)
+            self.assertTrue(ids.in_set(0, n-1))
+
+    def test_path_shortened(self) :
+        n = 9
+        expected = {
+            "compression" : [8, 8, 8, 8, 8, 8, 8, 8, 8],
+            "halving" : [2, 2, 4, 4, 6, 6, 8, 8, 8],
+            "splitting" : [2, 3, 4, 5, 6, 7, 8, 8, 8]
+        }
+        for strategy in self.strategies :
+            ds = DisjointSets(n, strategy)
+            for i in range(n-1) :
+                ds._nodes[i].p = ds._nodes[i+1]
+            ds.find_set(0)
+            self.assertEqual([ds._nodes[i].p.data for i in range(n)], expected[strategy])
+            ids = IntDisjointSets(n, strategy)
+            for i in range(n-1) :
+                ids._parent[i] = i+1
+            ids.find_set(0)
+            self.assertEqual(list(ids._parent), expected[strategy])
+
+    def test_same_partition(self) :
+        n = 300
+        for strategy in self.strategies :
+            seed(7)
+            ds = DisjointSets(n, strategy)
+            ids = IntDisjointSets(n, strategy)
+            reference = DisjointSets(n)
+            for k in range(250) :
+                x, y = randrange(n), randrange(n)
+                ds.union(x,y)
+                ids.union(x,y)
+                reference.union(x,y)
+            for i in range(n) :
+                for j in range(i, n, 11) :
+                    self.assertEqual(ds.in_set(i,j), reference.in_set(i,j))
+                    self.assertEqual(ids.in_set(i,j), reference.in_set(i,j))
+
+class TestBatchOperations(unittest.TestCase) :
+
+    def test_union_all(self) :
+        pairs = [(i, i+1) for i in range(0,16,2)] + [(i, i+2) for i in range(0,16,4)]
+        for ds in (DisjointSets(16), IntDisjointSets(16)) :
+            ds.union_all(pairs)
+            for i in range(16) :
+                for j in range(16) :
+                    self.assertEqual(ds.in_set(i,j), i//4 == j//4)
+        for ds in (DisjointSets(16), IntDisjointSets(16)) :
+            ds.union_all(iter(pairs))
+            self.assertTrue(ds.in_set(0,3))
+            self.assertFalse(ds.in_set(0,4))
+        for ds in (DisjointSets(4), IntDisjointSets(4)) :
+            ds.union_all([])
+            self.assertFalse(ds.in_set(0,1))
+
+    def test_find_all(self) :
+        for ds in (DisjointSets(10), IntDisjointSets(10)) :
+            self.assertEqual(list(ds.find_all(range(10))), list(range(10)))
+            ds.union_all([(0,1), (1,2), (5,6)])
+            expected = [ds.find_set(x) for x in range(10)]
+            self.assertEqual(list(ds.find_all(range(10))), expected)
+            self.assertEqual(list(ds.find_all(x for x in [6, 2, 9])), [expected[6], expected[2], 9])
+            self.assertEqual(list(ds.find_all([])), [])
+        ds = DisjointSets()
+        for x in "abcd" :
+            ds.make_set(x)
+        ds.union("a", "d")
+        self.assertEqual(ds.find_all("abcd"), [ds.find_set("a"), "b", "c", ds.find_set("a")])
+
+    def test_same_set_all(self) :
+        for ds in (DisjointSets(10), IntDisjointSets(10)) :
+            ds.union_all([(0,1), (1,2), (5,6)])
+            queries = [(0,2), (2,0), (0,5), (5,6), (9,9), (3,4)]
+            self.assertEqual(ds.same_set_all(queries), [True, True, False, True, True, False])
+            self.assertEqual(ds.same_set_all(queries), [ds.in_set(x,y) for x, y in queries])
+
+    def test_missing_element(self) :
+        ds = DisjointSets(4)
+        self.assertRaises(KeyError, ds.union_all, [(0,1), (2,7)])
+        self.assertRaises(KeyError, ds.find_all, [0, 7])
+
+class TestSetSizesAndMembers(unittest.TestCase) :
+
+    def test_singletons(self) :
+        for ds in (DisjointSets(5), IntDisjointSets(5)) :
+            self.assertEqual(ds.num_sets(), 5)
+            for i in range(5) :
+                self.assertEqual(ds.set_size(i), 1)
+                self.assertEqual(ds.members(i), [i])
+        ds = DisjointSets()
+        self.assertEqual(ds.num_sets(), 0)
+        ds.make_set("a")
+        ds.make_set("b")
+        self.assertEqual(ds.num_sets(), 2)
+        ds.union("a", "b")
+        self.assertEqual(ds.num_sets(), 1)
+        self.assertEqual(ds.set_size("b"), 2)
+        self.assertEqual(sorted(ds.members("b")), ["a", "b"])
+        self.assertEqual(ds.members("b")[0], "b")
+
+    def test_union_same_set(self) :
+        for ds in (DisjointSets(4), IntDisjointSets(4)) :
+            ds.union(0,1)
+            ds.union(1,0)
+            ds.union(2,2)
+            self.assertEqual(ds.num_sets(), 3)
+            self.assertEqual(ds.set_size(0), 2)
+            self.assertEqual(sorted(ds.members(1)), [0, 1])
+            self.assertEqual(ds.members(2), [2])
+
+    def test_random_unions(self) :
+        n = 200
+        for strategy in ("compression", "halving", "splitting") :
+            seed(3)
+            for ds in (DisjointSets(n, strategy), IntDisjointSets(n, strategy)) :
+                for k in range(180) :
+                    ds.union(randrange(n), randrange(n))
+                    if k % 20 == 0 :
+                        self.check_consistent(ds, n)
+                self.check_consistent(ds, n)
+
+    def check_consistent(self, ds, n) :
+        groups = {}
+        for i in range(n) :
+            groups.setdefault(ds.find_set(i), []).append(i)
+        self.assertEqual(ds.num_sets(), len(groups))
+        for i in range(n) :
+            group = groups[ds.find_set(i)]
+            self.assertEqual(ds.set_size(i), len(group))
+            members = ds.members(i)
+            self.assertEqual(members[0], i)
+            self.assertEqual(sorted(members), group)
+
+class TestLinkStrategies(unittest.TestCase) :
+
+    strategies = ["rank", "size", "random"]
+
+    def test_invalid_strategy(self) :
+        self.assertRaises(ValueError, DisjointSets, 4, "compression", "bogus")
+        self.assertRaises(ValueError, IntDisjointSets, 4, "compression", "bogus")
+
+    def test_union_by_size(self) :
+        for ds in (DisjointSets(8, link_strategy="size"), IntDisjointSets(8, link_strategy="size")) :
+            ds.union(0,1)
+            ds.union(0,2)
+            root = ds.find_set(0)
+            ds.union(3,0)
+            self.assertEqual(ds.find_set(3), root)
+            ds.union(4,5)
+            ds.union(4,6)
+            ds.union(4,7)
+            root = ds.find_set(4)
+            # equal sizes, so either root may survive, but the larger set must absorb a smaller one
+            ds.union(0,4)
+            self.assertTrue(ds.find_set(0) in [root, ds.find_set(3)])
+            self.assertEqual(ds.set_size(0), 8)
+
+    def test_no_ranks_stored(self) :
+        self.assertIsNone(IntDisjointSets(8, link_strategy="size")._rank)
+        self.assertIsNone(IntDisjointSets(8, link_strategy="random")._rank)
+        self.assertIsNotNone(IntDisjointSets(8)._rank)
+
+    def test_same_partition(self) :
+        n = 300
+        for link in self.strategies :
+            for find in ("compression", "halving", "splitting") :
+                seed(11)
+                ds = DisjointSets(n, find, link)
+                ids = IntDisjointSets(n, find, link)
+                reference = DisjointSets(n)
+                for k in range(250) :
+                    x, y = randrange(n), randrange(n)
+                    ds.union(x,y)
+                    ids.union(x,y)
+                    reference.union(x,y)
+                self.assertEqual(ds.num_sets(), reference.num_sets())
+                self.assertEqual(ids.num_sets(), reference.num_sets())
+                for i in range(n) :
+                    self.assertEqual(ds.set_size(i), reference.set_size(i))
+                    self.assertEqual(ids.set_size(i), reference.set_size(i))
+                    self.assertEqual(sorted(ds.members(i)), sorted(reference.members(i)))
+                    self.assertEqual(sorted(ids.members(i)), sorted(reference.members(i)))
+                    for j in range(i, n, 13) :
+                        self.assertEqual(ds.in_set(i,j), reference.in_set(i,j))
+                        self.assertEqual(ids.in_set(i,j), reference.in_set(i,j))
+
+    def test_random_linking_hashable(self) :
+        ds = DisjointSets(link_strategy="random")
+        words = ["w" + str(i) for i in range(50)]
+        for w in words :
+            ds.make_set(w)
+        for i in range(1, 50) :
+            ds.union(words[i-1], words[i])
+        self.assertEqual(ds.num_sets(), 1)
+        self.assertEqual(sorted(ds.members("w0")), sorted(words))
+
+class TestBulkAndLazyCreation(unittest.TestCase) :
+
+    def test_make_sets(self) :
+        ds = DisjointSets()
+        ds.make_sets("abc")
+        ds.make_sets(x for x in [1, 2])
+        ds.make_sets([])
+        self.assertEqual(ds.num_sets(), 5)
+        for x in ["a", "b", "c", 1, 2] :
+            self.assertTrue(ds.in_forest(x))
+            self.assertEqual(ds.find_set(x), x)
+            self.assertEqual(ds.set_size(x), 1)
+        self.assertFalse(ds.in_forest("d"))
+        ds.union("a", 2)
+        self.assertEqual(ds.num_sets(), 4)
+        self.assertTrue(ds.in_set(2, "a"))
+        ds.make_sets(range(3, 6))
+        self.assertEqual(ds.num_sets(), 7)
+        self.assertRaises(KeyError, ds.find_set, "d")
+
+    def test_lazy(self) :
+        ds = DisjointSets(lazy=True)
+        self.assertEqual(ds.num_sets(), 0)
+        self.assertFalse(ds.in_forest("a"))
+        self.assertEqual(ds.find_set("a"), "a")
+        self.assertTrue(ds.in_forest("a"))
+        self.assertEqual(ds.num_sets(), 1)
+        ds.union("b", "c")
+        self.assertEqual(ds.num_sets(), 2)
+        self.assertTrue(ds.in_set("c", "b"))
+        self.assertFalse(ds.in_set("a", "b"))
+        self.assertFalse(ds.in_set("d", "e"))
+        self.assertEqual(ds.num_sets(), 4)
+        self.assertEqual(ds.set_size("f"), 1)
+        self.assertEqual(ds.members("g"), ["g"])
+        self.assertEqual(ds.num_sets(), 6)
+        ds.union_all([("h", "i"), ("i", "a"), ("b", "b")])
+        self.assertEqual(ds.num_sets(), 6)
+        self.assertEqual(sorted(ds.members("h")), ["a", "h", "i"])
+        self.assertEqual(ds.find_all(["j", "h"]), ["j", ds.find_set("a")])
+        self.assertEqual(ds.same_set_all([("k", "l"), ("a", "i")]), [False, True])
+        self.assertEqual(ds.num_sets(), 9)
+
+    def test_lazy_with_size(self) :
+        ds = DisjointSets(4, lazy=True)
+        self.assertEqual(ds.num_sets(), 4)
+        ds.union(0, 10)
+        self.assertEqual(ds.num_sets(), 4)
+        self.assertEqual(ds.set_size(10), 2)
+        self.assertTrue(ds.in_forest(10))
+        self.assertFalse(ds.in_forest(9))
+
+    def test_lazy_same_partition(self) :
+        n = 200
+        seed(5)
+        ds = DisjointSets(lazy=True)
+        reference = DisjointSets(n)
+        for k in range(150) :
+            x, y = randrange(n), randrange(n)
+            ds.union(x, y)
+            reference.union(x, y)
+        for i in range(n) :
+            self.assertEqual(sorted(ds.members(i)), sorted(reference.members(i)))
+        self.assertEqual(ds.num_sets(), reference.num_sets())
+
+class TestLabelsAndSnapshots(unittest.TestCase) :
+
+    def test_to_labels(self) :
+        ds = IntDisjointSets(8)
+        self.assertEqual(list(ds.to_labels()), list(range(8)))
+        ds.union_all([(7,1), (2,6), (6,3), (4,0)])
+        labels = ds.to_labels()
+        self.assertEqual(labels.typecode, ds._parent.typecode)
+        self.assertEqual(list(labels), [0, 1, 2, 2, 0, 3, 2, 1])
+        self.assertEqual(list(ds._parent), [ds.find_set(x) for x in range(8)])
+        self.assertEqual(len(IntDisjointSets(0).to_labels()), 0)
+        ds = DisjointSets()
+        self.assertEqual(ds.to_labels(), {})
+        ds.make_sets("abcdef")
+        ds.union_all([("f","b"), ("c","e"), ("a","e")])
+        self.assertEqual(ds.to_labels(), {"a" : 0, "b" : 1, "c" : 0, "d" : 2, "e" : 0, "f" : 1})
+
+    def test_to_labels_random(self) :
+        n = 300
+        for find in ("compression", "halving", "splitting") :
+            seed(13)
+            ds = DisjointSets(n, find)
+            ids = IntDisjointSets(n, find, "random")
+            for k in range(200) :
+                x, y = randrange(n), randrange(n)
+                ds.union(x, y)
+                ids.union(x, y)
+            labels = ds.to_labels()
+            self.assertEqual(list(ids.to_labels()), [labels[x] for x in range(n)])
+            self.assertEqual(max(labels.values()) + 1, ds.num_sets())
+            for x in range(n) :
+                for y in range(0, n, 17) :
+                    self.assertEqual(labels[x] == labels[y], ds.in_set(x, y))
+
+    def test_int_snapshot(self) :
+        n = 500
+        for link in ("rank", "size", "random") :
+            for find in ("compression", "halving", "splitting") :
+                seed(19)
+                ds = IntDisjointSets(n, find, link)
+                ds.union_all((randrange(n), randrange(n)) for k in range(300))
+                f = BytesIO()
+                ds.snapshot(f)
+                f.seek(0)
+                restored = IntDisjointSets.restore(f)
+                self.assertEqual(restored._find.__name__, ds._find.__name__)
+                self.assertEqual(restored._link.__name__, ds._link.__name__)
+                self.assertEqual(restored.size(), n)
+                self.assertEqual(restored.num_sets(), ds.num_sets())
+                self.assertEqual(list(restored.to_labels()), list(ds.to_labels()))
+                for x in range(n) :
+                    self.assertEqual(sorted(restored.members(x)), sorted(ds.members(x)))
+                    self.assertEqual(restored.set_size(x), ds.set_size(x))
+                for k in range(300) :
+                    x, y = randrange(n), randrange(n)
+                    ds.union(x, y)
+                    restored.union(x, y)
+                self.assertEqual(list(restored.to_labels()), list(ds.to_labels()))
+                self.assertEqual(restored.num_sets(), ds.num_sets())
+
+    def test_snapshot(self) :
+        ds = DisjointSets(link_strategy="size", find_strategy="halving", lazy=True)
+        ds.union_all([("a", 1), ((2, 3), "b"), (1, None), ("c", "c")])
+        f = BytesIO()
+        ds.snapshot(f)
+        f.seek(0)
+        restored = DisjointSets.restore(f)
+        self.assertEqual(restored._find.__name__, ds._find.__name__)
+        self.assertEqual(restored._link.__name__, ds._link.__name__)
+        self.assertEqual(restored.to_labels(), ds.to_labels())
+        self.assertEqual(restored.num_sets(), 3)
+        self.assertEqual(sorted(map(str, restored.members(None))), ["1", "None", "a"])
+        self.assertEqual(restored.find_set("z"), "z")
+        self.assertEqual(restored.num_sets(), 4)
+        ds = DisjointSets(4)
+        ds.union(0, 1)
+        f = BytesIO()
+        ds.snapshot(f)
+        f.seek(0)
+        restored = DisjointSets.restore(f)
+        self.assertTrue(restored.in_set(1, 0))
+        self.assertRaises(KeyError, restored.find_set, 4)
+
+    def test_bad_snapshot(self) :
+        f = BytesIO()
+        IntDisjointSets(4).snapshot(f)
+        f.seek(0)
+        self.assertRaises(ValueError, DisjointSets.restore, f)
+        self.assertRaises(ValueError, IntDisjointSets.restore, BytesIO(b"not a snapshot of anything"))
+        self.assertRaises(ValueError, IntDisjointSets.restore, BytesIO(b""))
+
+class TestRollbackDisjointSets(unittest.TestCase) :
+
+    def test_basic(self) :
+        ds = RollbackDisjointSets(6)
+        c0 = ds.checkpoint()
+        self.assertEqual(c0, 0)
+        ds.union(0, 1)
+        ds.union(2, 3)
+        c1 = ds.checkpoint()
+        ds.union(1, 3)
+        ds.union(0, 2)
+        self.assertEqual(ds.checkpoint(), 3)
+        self.assertTrue(ds.in_set(0, 3))
+        self.assertEqual(ds.num_sets(), 3)
+        self.assertEqual(ds.set_size(2), 4)
+        ds.rollback(c1)
+        self.assertFalse(ds.in_set(0, 3))
+        self.assertTrue(ds.in_set(0, 1))
+        self.assertTrue(ds.in_set(2, 3))
+        self.assertEqual(ds.num_sets(), 4)
+        self.assertEqual(ds.set_size(2), 2)
+        self.assertEqual(sorted(ds.members(0)), [0, 1])
+        ds.rollback(c1)
+        self.assertEqual(ds.num_sets(), 4)
+        ds.rollback()
+        self.assertEqual(ds.num_sets(), 6)
+        for i in range(6) :
+            self.assertEqual(ds.find_set(i), i)
+            self.assertEqual(ds.members(i), [i])
+        self.assertRaises(ValueError, ds.rollback, c1)
+
+    def test_no_compression(self) :
+        ds = RollbackDisjointSets(8)
+        ds.union_all([(0,1), (2,3), (0,2), (4,5), (6,7), (4,6), (0,4)])
+        parents = [ds._nodes[i].p.data for i in range(8)]
+        ds.find_all(range(8))
+        ds.to_labels()
+        self.assertEqual([ds._nodes[i].p.data for i in range(8)], parents)
+
+    def test_random_against_replay(self) :
+        n = 100
+        for link in ("rank", "size", "random") :
+            seed(29)
+            ds = RollbackDisjointSets(n, link)
+            history = []
+            checkpoints = []
+            for step in range(400) :
+                if randrange(4) == 0 and checkpoints :
+                    k = randrange(len(checkpoints))
+                    c, length = checkpoints[k]
+                    del checkpoints[k:]
+                    ds.rollback(c)
+                    del history[length:]
+                elif randrange(5) == 0 :
+                    checkpoints.append((ds.checkpoint(), len(history)))
+                else :
+                    x, y = randrange(n), randrange(n)
+                    ds.union(x, y)
+                    history.append((x, y))
+                if step % 25 == 0 :
+                    reference = DisjointSets(n)
+                    reference.union_all(history)
+                    self.assertEqual(ds.to_labels(), reference.to_labels())
+                    self.assertEqual(ds.num_sets(), reference.num_sets())
+                    for i in range(n) :
+                        self.assertEqual(ds.set_size(i), reference.set_size(i))
+                        self.assertEqual(sorted(ds.members(i)), sorted(reference.members(i)))
+
+    def test_ranks_restored(self) :
+        ds = RollbackDisjointSets(4)
+        ds.union(0, 1)
+        root = ds.find_set(0)
+        self.assertEqual(ds._nodes[root].rank, 1)
+        c = ds.checkpoint()
+        ds.union(2, 3)
+        ds.union(0, 2)
+        ds.rollback(c)
+        self.assertEqual([ds._nodes[i].rank for i in range(4)], [1 if i == root else 0 for i in range(4)])
+
+    def test_lazy(self) :
+        ds = RollbackDisjointSets(lazy=True)
+        ds.union("a", "b")
+        c = ds.checkpoint()
+        ds.union("b", "c")
+        self.assertEqual(ds.set_size("a"), 3)
+        ds.rollback(c)
+        self.assertEqual(ds.num_sets(), 2)
+        self.assertTrue(ds.in_forest("c"))
+        self.assertFalse(ds.in_set("a", "c"))
+
+    def test_snapshot(self) :
+        ds = RollbackDisjointSets(6, "size")
+        ds.union_all([(0,1), (2,3), (1,3)])
+        f = BytesIO()
+        ds.snapshot(f)
+        f.seek(0)
+        restored = RollbackDisjointSets.restore(f)
+        self.assertEqual(restored.to_labels(), ds.to_labels())
+        self.assertEqual(restored.checkpoint(), 0)
+        c = restored.checkpoint()
+        restored.union(4, 0)
+        restored.rollback(c)
+        self.assertEqual(restored.to_labels(), ds.to_labels())
+        self.assertEqual(restored._link.__name__, "_link_by_size")
+
 
 if __name__ == '__main__':
     unittest.main()    
@@ -0,0 +1,166 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+sys.path.append('../lib')
+
+import unittest
+from graphs import connected_components, kruskal_msf
+from random import randrange, seed
+
+def bfs_components(n, edges) :
+    adj = [[] for v in range(n)]
+    for u, v in edges :
+        adj[u].append(v)
+        adj[v].append(u)
+    labels = [-1] * n
+    count = 0
+    for s in range(n) :
+        if labels[s] < 0 :
+            labels[s] = count
+            frontier = [s]
+            while frontier :
+                u = frontier.pop()
+                for v in adj[u] :
+                    if labels[v] < 0 :
+                        labels[v] = count
+                        frontier.append(v)
+            count += 1
+    return count, labels
+
+def prim_weight(n, weighted_edges) :
+    # weight of minimum spanning tree of a connected graph, via a simple O(n^2) Prim's algorithm
+    inf = float("inf")
+    w = [[inf] * n for v in range(n)]
+    for u, v, c in weighted_edges :
+        if c < w[u][v] :
+            w[u][v] = w[v][u] = c
+    dist = [inf] * n
+    dist[0] = 0
+    done = [False] * n
+    total = 0
+    for k in range(n) :
+        u = min((v for v in range(n) if not done[v]), key=lambda v : dist[v])
+        done[u] = True
+        total += dist[u]
+        for v in range(n) :
+            if not done[v] and w[u][v] < dist[v] :
+                dist[v] = w[u][v]
+    return total
+
+def limited(edges, limit) :
+    # generator that fails the test if more than limit edges are consumed
+    for i, e in enumerate(edges) :
+        if i >= limit :
+            raise AssertionError("consumed too many edges")
+        yield e
+
+class TestConnectedComponents(unittest.TestCase) :
+
+    def test_no_edges(self) :
+        count, labels = connected_components([], 4)
+        self.assertEqual(count, 4)
+        self.assertEqual(list(labels), [0, 1, 2, 3])
+        count, labels = connected_components([])
+        self.assertEqual(count, 0)
+        self.assertEqual(labels, {})
+
+    def test_small(self) :
+        count, labels = connected_components([(0,1), (3,4), (4,0)], 6)
+        self.assertEqual(count, 3)
+        self.assertEqual(list(labels), [0, 0, 1, 0, 0, 2])
+        count, labels = connected_components([("a","b"), ("c","d"), ("b","e")])
+        self.assertEqual(count, 2)
+        self.assertEqual(labels, {"a" : 0, "b" : 0, "c" : 1, "d" : 1, "e" : 0})
+
+    def test_random(self) :
+        seed(17)
+        for n in [1, 2, 10, 50, 200] :
+            for m in [0, n//2, n, 2*n] :
+                edges = [(randrange(n), randrange(n)) for i in range(m)]
+                expected = bfs_components(n, edges)
+                count, labels = connected_components(edges, n)
+                self.assertEqual((count, list(labels)), expected)
+                count, labels = connected_components(e for e in edges)
+                self.assertEqual(count, len({expected[1][v] for e in edges for v in e}))
+                for u, v in edges :
+                    self.assertEqual(labels[u], labels[v])
+                    self.assertEqual(labels[u] == labels[v], expected[1][u] == expected[1][v])
+
+    def test_early_termination(self) :
+        n = 10000
+        edges = [(i, i+1) for i in range(n-1)] + [(i, (i+2) % n) for i in range(n)]
+        count, labels = connected_components(limited(edges, n + 5000), n)
+        self.assertEqual(count, 1)
+        self.assertEqual(set(labels), {0})
+
+    def test_stops_at_connecting_edge(self) :
+        # edges after the one connecting the graph aren't consumed, even within a chunk
+        edges = iter([(0, 1), (1, 2), (2, 3)] + [(0, 3)] * 10)
+        self.assertEqual(connected_components(edges, 4)[0], 1)
+        self.assertEqual(len(list(edges)), 10)
+        edges = iter([(i, i + 1) for i in range(99)] + [(0, 1)] * 10)
+        self.assertEqual(connected_components(edges, 100)[0], 1)
+        self.assertEqual(len(list(edges)), 10)
+
+
+class TestKruskal(unittest.TestCase) :
+
+    def test_empty(self) :
+        self.assertEqual(kruskal_msf([]), [])
+        self.assertEqual(kruskal_msf([], 1), [])
+        self.assertEqual(kruskal_msf([], 3), [])
+
+    def test_small(self) :
+        edges = [(0,1,5), (1,2,1), (0,2,2), (2,3,7), (1,3,9)]
+        self.assertEqual(kruskal_msf(edges, 4), [(1,2,1), (0,2,2), (2,3,7)])
+        named = [("a","b",5), ("b","c",1), ("a","c",2), ("c","d",7), ("b","d",9)]
+        self.assertEqual(kruskal_msf(named), [("b","c",1), ("a","c",2), ("c","d",7)])
+
+    def test_forest(self) :
+        edges = [(0,1,3), (2,3,1), (3,4,2), (2,4,1)]
+        forest = kruskal_msf(edges, 6)
+        self.assertEqual(len(forest), 3)
+        self.assertEqual(sum(e[2] for e in forest), 5)
+
+    def test_random(self) :
+        seed(23)
+        for n in [2, 5, 20, 60] :
+            edges = [(i, randrange(i), randrange(100)) for i in range(1, n)]
+            edges += [(randrange(n), randrange(n), randrange(100)) for i in range(3*n)]
+            expected = prim_weight(n, edges)
+            forest = kruskal_msf(edges, n)
+            self.assertEqual(len(forest), n-1)
+            self.assertEqual(sum(e[2] for e in forest), expected)
+            forest = kruskal_msf(e for e in edges)
+            self.assertEqual(sum(e[2] for e in forest), expected)
+            presorted = sorted(edges, key=lambda e : e[2])
+            forest = kruskal_msf(iter(presorted), n, presorted=True)
+            self.assertEqual(sum(e[2] for e in forest), expected)
+            self.assertEqual(len(connected_components([e[:2] for e in forest], n)[1]), n)
+            self.assertEqual(connected_components([e[:2] for e in forest], n)[0], 1)
+
+    def test_early_termination(self) :
+        n = 1000
+        edges = [(i, i+1, i) for i in range(n-1)] + [(i, (i+2) % n, n + i) for i in range(n)]
+        forest = kruskal_msf(limited(edges, n-1), n, presorted=True)
+        self.assertEqual(forest, edges[:n-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
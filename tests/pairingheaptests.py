@@ -0,0 +1,117 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import sys
+sys.path.append('../lib')
+
+import unittest
+from pairingheap import PairingPQ
+from pqtests import check_random_operations, extract_all
+from random import randrange, shuffle, seed
+
+class TestPairingPQ(unittest.TestCase) :
+
+    def test_empty(self) :
+        q = PairingPQ()
+        self.assertTrue(q.is_empty())
+        self.assertEqual(q.size(), 0)
+        self.assertFalse(q.contains(1))
+        self.assertFalse(q.remove(1))
+        self.assertFalse(q.change_priority(1, 5))
+        self.assertRaises(IndexError, q.peek_min)
+        self.assertRaises(IndexError, q.extract_min)
+
+    def test_init_and_add(self) :
+        pairs = [(i, i % 7) for i in range(50)]
+        shuffle(pairs)
+        q = PairingPQ(pairs)
+        self.assertEqual(q.size(), 50)
+        self.assertFalse(q.add(3, -1))
+        self.assertEqual(q.get_priority(3), 3)
+        self.assertTrue(q.add(50, -1))
+        self.assertEqual(q.peek_min(), 50)
+        self.assertEqual(q.extract_min(), 50)
+        values = [v for e, v in extract_all(self, q)]
+        self.assertEqual(values, sorted(i % 7 for i in range(50)))
+
+    def test_add_all(self) :
+        q = PairingPQ([(1, 5), (2, 3)])
+        q.add_all([(2, 0), (3, 4), (4, 1)])
+        self.assertEqual(extract_all(self, q), [(4, 1), (2, 3), (3, 4), (1, 5)])
+
+    def test_change_priority(self) :
+        q = PairingPQ([(i, i) for i in range(20)])
+        self.assertEqual(q.extract_min(), 0)
+        self.assertTrue(q.change_priority(15, -1))
+        self.assertTrue(q.change_priority(1, 30))
+        self.assertTrue(q.change_priority(15, 40))
+        self.assertTrue(q.change_priority(7, 7))
+        self.assertEqual(q.peek_min(), 2)
+        expected = [(i, i) for i in range(2, 20) if i != 15] + [(1, 30), (15, 40)]
+        self.assertEqual(extract_all(self, q), expected)
+
+    def test_remove(self) :
+        q = PairingPQ([(i, i) for i in range(20)])
+        self.assertEqual(q.extract_min(), 0)
+        for e in (1, 19, 10, 4) :
+            self.assertTrue(q.remove(e))
+            self.assertFalse(q.contains(e))
+        self.assertFalse(q.remove(4))
+        self.assertEqual(extract_all(self, q), [(i, i) for i in range(2, 19) if i not in (4, 10)])
+
+    def test_random_operations(self) :
+        seed(14)
+        for steps in (10, 100, 5000) :
+            check_random_operations(self, PairingPQ(), steps)
+
+    def test_merge(self) :
+        for n, k in ((0, 5), (5, 0), (3, 10), (10, 3), (8, 8)) :
+            for common in range(0, min(n, k) + 1) :
+                a = PairingPQ([(i, randrange(10)) for i in range(n)])
+                # the last common elements of a are also in b, with other priorities
+                b = PairingPQ([(i, randrange(10)) for i in range(n - common, n - common + k)])
+                if n > 2 :
+                    a.extract_min()
+                expected = {e : a.get_priority(e) for e in range(n) if a.contains(e)}
+                for e in range(n - common, n - common + k) :
+                    expected.setdefault(e, b.get_priority(e))
+                a.merge(b)
+                self.assertTrue(b.is_empty())
+                self.assertEqual(b.size(), 0)
+                self.assertEqual(a.size(), len(expected))
+                for e, v in expected.items() :
+                    self.assertEqual(a.get_priority(e), v)
+                values = [v for e, v in extract_all(self, a)]
+                self.assertEqual(values, sorted(expected.values()))
+                # b remains usable after the merge
+                b.add(1, 1)
+                self.assertEqual(b.extract_min(), 1)
+
+    def test_merge_then_operations(self) :
+        a = PairingPQ([(i, i) for i in range(0, 20, 2)])
+        b = PairingPQ([(i, i) for i in range(1, 20, 2)])
+        a.merge(b)
+        a.merge(a)
+        self.assertTrue(a.change_priority(19, -1))
+        self.assertTrue(a.remove(18))
+        self.assertEqual(a.extract_min(), 19)
+        self.assertEqual([e for e, v in extract_all(self, a)], list(range(18)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,9 +20,72 @@ import sys
 sys.path.append('../lib')
 
 import unittest
+import pq
 from pq import PQ
 from pq import MaxPQ
-from random import randrange, shuffle
+from pq import IntPQ
+from random import randrange, shuffle, seed
+from itertools import islice
+
+def check_random_operations(test, q, steps, maximize=False) :
+    # applies a random mix of operations to q, checking each result against a dict of priorities
+    model = {}
+    for step in range(steps) :
+        op = randrange(6)
+        e = randrange(steps // 2 + 1)
+        if op <= 1 :
+            value = randrange(1000)
+            test.assertEqual(q.add(e, value), e not in model)
+            model.setdefault(e, value)
+        elif op == 2 :
+            value = randrange(1000)
+            test.assertEqual(q.change_priority(e, value), e in model)
+            if e in model :
+                model[e] = value
+        elif op == 3 :
+            test.assertEqual(q.remove(e), e in model)
+            model.pop(e, None)
+        elif op == 4 and model :
+            best = (max if maximize else min)(model.values())
+            extracted = q.extract_max() if maximize else q.extract_min()
+            test.assertEqual(model.pop(extracted), best)
+        test.assertEqual(q.size(), len(model))
+        test.assertEqual(q.contains(e), e in model)
+        if e in model :
+            test.assertEqual(q.get_priority(e), model[e])
+    while model :
+        best = (max if maximize else min)(model.values())
+        extracted = q.extract_max() if maximize else q.extract_min()
+        test.assertEqual(model.pop(extracted), best)
+    test.assertTrue(q.is_empty())
+
+def extract_all(test, q) :
+    # extracts every element of q, checking each against peek_min, and returns their (element, value) pairs in order
+    pairs = []
+    while not q.is_empty() :
+        e = q.peek_min()
+        pairs.append((e, q.get_priority(e)))
+        test.assertEqual(q.extract_min(), e)
+    test.assertEqual(q.size(), 0)
+    return pairs
+
+class Counted :
+    # a priority that counts how many times it is compared
+    comparisons = 0
+
+    def __init__(self, value) :
+        self.value = value
+
+    def __lt__(self, other) :
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other) :
+        Counted.comparisons += 1
+        return self.value > other.value
+
+    def __neg__(self) :
+        return Counted(-self.value)
 
 class TestPQMethods(unittest.TestCase) :
 
@@ -1222,5 +1285,685 @@ class TestMaxPQMethods(unittest.TestCase) :
         q.extract_min()
 
 
+class TestSiftUpStrategies(unittest.TestCase) :
+
+    def test_invalid(self) :
+        self.assertRaises(ValueError, PQ, [], "bogus")
+        self.assertRaises(ValueError, MaxPQ, [], "bogus")
+
+    def test_random_operations(self) :
+        for sift_up in ("linear", "binary") :
+            seed(1)
+            check_random_operations(self, PQ(sift_up=sift_up), 2000)
+            check_random_operations(self, MaxPQ(sift_up=sift_up), 2000, True)
+
+    def test_insertion_index(self) :
+        for n in range(1, 70) :
+            for value in range(-1, 2*n+1) :
+                q = PQ([(i, 2*i) for i in range(n)], "binary")
+                q.add("x", value)
+                expected = PQ([(i, 2*i) for i in range(n)])
+                expected.add("x", value)
+                self.assertEqual(q._heap, expected._heap)
+                self.assertEqual(q._index, expected._index)
+
+    def test_fewer_comparisons(self) :
+        n = 1 << 12
+        counts = {}
+        for sift_up in ("linear", "binary") :
+            q = PQ(sift_up=sift_up)
+            Counted.comparisons = 0
+            for i in range(n) :
+                q.add(i, Counted(-i))
+            counts[sift_up] = Counted.comparisons
+            for i in range(n) :
+                self.assertEqual(q.extract_min(), n-1-i)
+        # every add percolates to the root, which takes about lg N comparisons linearly
+        # but about lg lg N by binary search
+        self.assertLess(counts["binary"] * 2, counts["linear"])
+
+
+class TestArity(unittest.TestCase) :
+
+    def test_invalid(self) :
+        self.assertRaises(ValueError, PQ, [], "linear", 1)
+        self.assertRaises(ValueError, MaxPQ, [], "linear", 0)
+
+    def check_heap(self, q) :
+        d = q._arity
+        for i in range(1, len(q._heap)) :
+            self.assertLessEqual(q._heap[(i-1)//d][1], q._heap[i][1])
+        for i, p in enumerate(q._heap) :
+            self.assertEqual(q._index[p[0]], i)
+        self.assertEqual(len(q._index), len(q._heap))
+
+    def test_random_operations(self) :
+        for arity in (2, 3, 4, 8) :
+            for sift_up in ("linear", "binary") :
+                seed(arity)
+                check_random_operations(self, PQ(sift_up=sift_up, arity=arity), 2000)
+                check_random_operations(self, MaxPQ(sift_up=sift_up, arity=arity), 2000, True)
+
+    def test_init_and_add_all(self) :
+        for arity in (2, 3, 5) :
+            for n in range(0, 40) :
+                pairs = [(i, randrange(20)) for i in range(n)]
+                q = PQ(pairs, arity=arity)
+                self.check_heap(q)
+                q.add_all([(i, randrange(20)) for i in range(n, n + n//3)])
+                self.check_heap(q)
+                q.add_all([(i, randrange(20)) for i in range(2*n, 4*n)])
+                self.check_heap(q)
+                for i in range(0, 4*n, 3) :
+                    q.remove(i)
+                    self.check_heap(q)
+                previous = None
+                while not q.is_empty() :
+                    value = q.get_priority(q.peek_min())
+                    if previous is not None :
+                        self.assertLessEqual(previous, value)
+                    previous = value
+                    q.extract_min()
+                    self.check_heap(q)
+
+    def test_insertion_index(self) :
+        for arity in (3, 4) :
+            for n in range(1, 70) :
+                for value in range(-1, 2*n+1) :
+                    q = PQ([(i, 2*i) for i in range(n)], "binary", arity)
+                    q.add("x", value)
+                    expected = PQ([(i, 2*i) for i in range(n)], "linear", arity)
+                    expected.add("x", value)
+                    self.assertEqual(q._heap, expected._heap)
+
+
+class TestIntPQ(unittest.TestCase) :
+
+    def check_heap(self, q) :
+        for i in range(1, q.size()) :
+            self.assertLessEqual(q._keys[(i-1)//2], q._keys[i])
+        for e in range(len(q._position)) :
+            if q._position[e] >= 0 :
+                self.assertEqual(q._heap[q._position[e]], e)
+        self.assertEqual(sum(1 for p in q._position if p >= 0), q.size())
+
+    def test_empty(self) :
+        q = IntPQ(10)
+        self.assertTrue(q.is_empty())
+        self.assertEqual(q.size(), 0)
+        for e in (-1, 0, 9, 10) :
+            self.assertFalse(q.contains(e))
+        self.assertFalse(q.remove(3))
+        self.assertFalse(q.change_priority(3, 1.0))
+        self.assertRaises(KeyError, q.get_priority, 3)
+
+    def test_elements_outside_range(self) :
+        q = IntPQ(5, [(0, 2.0), (1, 1.0)])
+        for e in (-1, 5) :
+            self.assertRaises(KeyError, q.add, e, 3.0)
+            self.assertRaises(KeyError, q.change_priority, e, 3.0)
+            self.assertRaises(KeyError, q.remove, e)
+            self.assertRaises(KeyError, q.get_priority, e)
+            self.assertFalse(q.contains(e))
+        self.assertFalse(q.contains(4))
+        self.assertTrue(q.add(4, 1.5))
+        # the pairs before an element outside the range are added
+        self.assertRaises(KeyError, q.add_all, [(3, 0.5), (2, 4.0), (-1, 0.0), (0, 5.0)])
+        self.check_heap(q)
+        self.assertEqual(q.size(), 5)
+        self.assertEqual([q.extract_min() for i in range(5)], [3, 1, 4, 0, 2])
+
+    def test_values_not_floats(self) :
+        q = IntPQ(5, [(0, 2.0)])
+        self.assertRaises(TypeError, q.add, 1, "x")
+        self.assertRaises(OverflowError, q.add, 1, 10 ** 400)
+        self.assertRaises(TypeError, q.add_all, [(3, 0.5), (1, "x"), (2, 1.0)])
+        self.check_heap(q)
+        self.assertFalse(q.contains(1))
+        self.assertTrue(q.add(2, 3.0))
+        self.assertEqual([q.extract_min() for i in range(3)], [3, 0, 2])
+        self.assertTrue(q.is_empty())
+
+    def test_init(self) :
+        for n in range(0, 30) :
+            pairs = [(i, randrange(10)) for i in range(n)] + [(0, -5)]
+            shuffle(pairs)
+            q = IntPQ(n + 1, pairs)
+            self.check_heap(q)
+            self.assertEqual(q.size(), max(n, 1))
+            values = []
+            while not q.is_empty() :
+                e = q.peek_min()
+                values.append(q.get_priority(e))
+                self.assertEqual(q.extract_min(), e)
+                self.check_heap(q)
+            self.assertEqual(values, sorted(values))
+
+    def test_add_all_and_merge(self) :
+        q = IntPQ(20, [(i, 20 - i) for i in range(0, 20, 3)])
+        q.add_all([(i, i) for i in range(0, 20, 2)])
+        self.check_heap(q)
+        self.assertEqual(q.get_priority(0), 20.0)
+        self.assertEqual(q.get_priority(2), 2.0)
+        other = IntPQ(20, [(i, -i) for i in range(19, 10, -1)])
+        q.merge(other)
+        self.check_heap(q)
+        self.assertEqual(other.size(), 9)
+        self.assertEqual(q.get_priority(12), 8.0)
+        self.assertEqual(q.get_priority(11), -11.0)
+        self.assertEqual(q.peek_min(), 19)
+        q.add_all([(1, 0.5)])
+        self.check_heap(q)
+        self.assertEqual(q.get_priority(1), 0.5)
+
+    def test_float_priorities(self) :
+        q = IntPQ(3, [(0, 0.25), (1, float("inf")), (2, -0.5)])
+        self.assertEqual(q.extract_min(), 2)
+        self.assertTrue(q.change_priority(1, 0.125))
+        self.assertEqual(q.extract_min(), 1)
+        self.assertEqual(q.get_priority(0), 0.25)
+
+    def test_random_operations(self) :
+        seed(15)
+        for steps in (10, 100, 5000) :
+            check_random_operations(self, IntPQ(steps // 2 + 1), steps)
+
+
+class TestBatchExtraction(unittest.TestCase) :
+
+    def check_index(self, q) :
+        for i, p in enumerate(q._heap) :
+            self.assertEqual(q._index[p[0]], i)
+        self.assertEqual(len(q._index), len(q._heap))
+
+    def test_extract_many(self) :
+        seed(16)
+        for arity in (2, 3) :
+            for n in (0, 1, 10, 100, 1000) :
+                for k in (0, 1, 5, n // 20, n // 4, max(n - 1, 0), n, n + 3) :
+                    pairs = [(i, randrange(n + 1)) for i in range(n)]
+                    q = PQ(pairs, arity=arity)
+                    extracted = q.extract_many(k, True)
+                    expected = sorted(v for e, v in pairs)
+                    self.assertEqual([v for e, v in extracted], expected[:k])
+                    for e, v in extracted :
+                        self.assertEqual(pairs[e][1], v)
+                        self.assertFalse(q.contains(e))
+                    self.assertEqual(q.size(), max(n - k, 0))
+                    self.check_index(q)
+                    rest = [q.get_priority(q.peek_min())] if not q.is_empty() else []
+                    self.assertEqual(rest, expected[k:k+1])
+                    size = q.size()
+                    self.assertEqual(len(q.extract_many(k)), min(k, size))
+                    self.check_index(q)
+
+    def test_extract_while(self) :
+        seed(17)
+        for n in (0, 1, 10, 100, 1000) :
+            for threshold in (-1, 0, n // 20, n // 2, n) :
+                pairs = [(i, randrange(n + 1)) for i in range(n)]
+                q = PQ(pairs)
+                extracted = q.extract_while(threshold, True)
+                expected = sorted(v for e, v in pairs if v <= threshold)
+                self.assertEqual([v for e, v in extracted], expected)
+                self.assertEqual(q.size(), n - len(expected))
+                self.check_index(q)
+                q = PQ(pairs)
+                elements = q.extract_while(lambda v : v < threshold)
+                self.assertEqual(sorted(elements), sorted(e for e, v in pairs if v < threshold))
+                self.assertEqual(q.size(), n - len(elements))
+                self.check_index(q)
+
+    def test_nsmallest(self) :
+        seed(18)
+        for arity in (2, 4) :
+            pairs = [(i, randrange(50)) for i in range(200)]
+            q = PQ(pairs, arity=arity)
+            before = list(q._heap)
+            for k in (0, 1, 7, 199, 200, 250) :
+                smallest = q.nsmallest(k, True)
+                self.assertEqual([v for e, v in smallest], sorted(v for e, v in pairs)[:k])
+                self.assertEqual(q.nsmallest(k), [e for e, v in smallest])
+            self.assertEqual(q._heap, before)
+        self.assertEqual(PQ().nsmallest(3), [])
+
+    def test_max(self) :
+        pairs = [(i, i % 10) for i in range(100)]
+        q = MaxPQ(pairs)
+        self.assertRaises(NotImplementedError, q.nsmallest, 3)
+        self.assertEqual([v for e, v in q.nlargest(15, True)], [9] * 10 + [8] * 5)
+        self.assertEqual(len(q.nlargest(15)), 15)
+        self.assertEqual([v for e, v in q.extract_many(5, True)], [9] * 5)
+        extracted = q.extract_while(8, True)
+        self.assertEqual([v for e, v in extracted], [9] * 5 + [8] * 10)
+        self.assertEqual(q.get_priority(q.peek_max()), 7)
+        self.assertEqual(len(q.extract_while(lambda v : v > 5)), 20)
+        self.assertEqual(q.size(), 60)
+
+
+class TestBulkUpdates(unittest.TestCase) :
+
+    def check_heap(self, q) :
+        d = q._arity
+        for i in range(1, len(q._heap)) :
+            self.assertLessEqual(q._heap[(i-1)//d][1], q._heap[i][1])
+        for i, p in enumerate(q._heap) :
+            self.assertEqual(q._index[p[0]], i)
+        self.assertEqual(len(q._index), len(q._heap))
+
+    def test_change_priorities(self) :
+        seed(19)
+        for arity in (2, 3) :
+            for n in (0, 1, 10, 100, 500) :
+                for k in (0, 1, n // 10, n // 2, n, 2 * n) :
+                    pairs = [(i, randrange(100)) for i in range(n)]
+                    q = PQ(pairs, arity=arity)
+                    model = dict(pairs)
+                    changes = [(randrange(n + 10), randrange(100)) for i in range(k)]
+                    expected = 0
+                    for e, v in changes :
+                        if e in model :
+                            model[e] = v
+                            expected += 1
+                    self.assertEqual(q.change_priorities(changes), expected)
+                    self.check_heap(q)
+                    for e, v in model.items() :
+                        self.assertEqual(q.get_priority(e), v)
+                    self.assertEqual(q.size(), n)
+
+    def test_remove_all(self) :
+        seed(20)
+        for arity in (2, 4) :
+            for n in (0, 1, 10, 100, 500) :
+                for k in (0, 1, n // 10, n // 2, n, 2 * n) :
+                    q = PQ([(i, randrange(100)) for i in range(n)], arity=arity)
+                    elements = [randrange(n + 10) for i in range(k)]
+                    removed = {e for e in elements if e < n}
+                    self.assertEqual(q.remove_all(elements), len(removed))
+                    self.check_heap(q)
+                    self.assertEqual(q.size(), n - len(removed))
+                    for e in range(n + 10) :
+                        self.assertEqual(q.contains(e), e < n and e not in removed)
+
+    def test_max(self) :
+        q = MaxPQ([(i, i) for i in range(10)])
+        self.assertEqual(q.change_priorities([(3, 20), (4, -1), (30, 5)]), 2)
+        self.assertEqual(q.get_priority(3), 20)
+        self.assertEqual(q.remove_all([9, 8, 3, 3, 11]), 3)
+        self.assertEqual([q.extract_max() for i in range(q.size())], [7, 6, 5, 2, 1, 0, 4])
+
+
+class TestOrderedIteration(unittest.TestCase) :
+
+    def test_drain(self) :
+        seed(21)
+        for arity in (2, 3) :
+            pairs = [(i, randrange(50)) for i in range(300)]
+            q = PQ(pairs, arity=arity)
+            drained = list(q.drain())
+            self.assertTrue(q.is_empty())
+            self.assertEqual(len(q._index), 0)
+            self.assertEqual([v for e, v in drained], sorted(v for e, v in pairs))
+            self.assertEqual(sorted(drained), pairs)
+        self.assertEqual(list(PQ().drain()), [])
+
+    def test_drain_partially(self) :
+        q = PQ([(i, i) for i in range(100)])
+        self.assertEqual(list(islice(q.drain(), 10)), [(i, i) for i in range(10)])
+        self.assertEqual(q.size(), 90)
+        self.assertEqual(q.peek_min(), 10)
+        self.assertFalse(q.contains(9))
+        drained = []
+        for e, v in q.drain() :
+            drained.append(e)
+            if e == 10 :
+                q.add(-1, 0)
+                q.remove(20)
+            if e == 30 :
+                break
+        self.assertEqual(drained, [10, -1] + list(range(11, 20)) + list(range(21, 31)))
+        self.assertEqual(q.size(), 69)
+
+    def test_sorted_items(self) :
+        seed(22)
+        for arity in (2, 5) :
+            pairs = [(i, randrange(50)) for i in range(300)]
+            q = PQ(pairs, arity=arity)
+            before = list(q._heap)
+            items = list(q.sorted_items())
+            self.assertEqual([v for e, v in items], sorted(v for e, v in pairs))
+            self.assertEqual(sorted(items), pairs)
+            self.assertEqual(q._heap, before)
+            self.assertEqual(list(islice(q.sorted_items(), 5)), items[:5])
+        self.assertEqual(list(PQ().sorted_items()), [])
+
+    def test_max(self) :
+        pairs = [(i, i % 7) for i in range(50)]
+        q = MaxPQ(pairs)
+        items = list(q.sorted_items())
+        self.assertEqual([v for e, v in items], sorted((v for e, v in pairs), reverse=True))
+        self.assertEqual(q.size(), 50)
+        drained = list(q.drain())
+        self.assertEqual([v for e, v in drained], [v for e, v in items])
+        self.assertTrue(q.is_empty())
+
+
+class TestBounded(unittest.TestCase) :
+
+    def test_invalid(self) :
+        self.assertRaises(ValueError, PQ, [], "linear", 2, 0)
+        self.assertRaises(ValueError, MaxPQ, capacity=-1)
+
+    def test_top_k(self) :
+        seed(23)
+        for arity in (2, 3) :
+            for k in (1, 5, 50) :
+                stream = [(i, randrange(1000)) for i in range(500)]
+                q = PQ(arity=arity, capacity=k)
+                kept = {}
+                for e, v in stream :
+                    evicted = q.add(e, v)
+                    kept[e] = v
+                    if evicted is not None :
+                        self.assertEqual(kept.pop(evicted[0]), evicted[1])
+                        self.assertTrue(all(evicted[1] <= x for x in kept.values()))
+                    self.assertEqual(q.size(), min(e + 1, k))
+                self.assertEqual(sorted(v for e, v in q.sorted_items()), sorted(v for e, v in stream)[-k:])
+                for e, v in q.sorted_items() :
+                    self.assertEqual(kept[e], v)
+                m = MaxPQ(arity=arity, capacity=k)
+                for e, v in stream :
+                    m.add(e, v)
+                self.assertEqual(sorted(v for e, v in m.sorted_items()), sorted(v for e, v in stream)[:k])
+
+    def test_add_when_full(self) :
+        q = PQ([(1, 10), (2, 20), (3, 30)], capacity=3)
+        self.assertEqual(q.add(4, 5), (4, 5))
+        self.assertEqual(q.add(4, 10), (4, 10))
+        self.assertIs(q.add(2, 100), False)
+        self.assertEqual(q.get_priority(2), 20)
+        self.assertEqual(q.add(4, 15), (1, 10))
+        self.assertEqual(q.size(), 3)
+        self.assertFalse(q.contains(1))
+        self.assertEqual(q.extract_min(), 4)
+        self.assertIsNone(q.add(5, 0))
+        self.assertEqual(q.peek_min(), 5)
+        self.assertIs(q.add(5, 1), False)
+        r = PQ(capacity=3)
+        self.assertIsNone(r.add(1, 10))
+        self.assertIs(r.add(1, 5), False)
+        self.assertEqual(r.size(), 1)
+        m = MaxPQ([(1, 10), (2, 20)], capacity=2)
+        self.assertEqual(m.add(3, 15), (2, 20))
+        self.assertEqual(m.add(4, 25), (4, 25))
+        self.assertEqual(m.peek_max(), 3)
+
+    def test_offer(self) :
+        q = PQ(capacity=2)
+        self.assertTrue(q.offer(1, 10))
+        self.assertFalse(q.offer(1, 20))
+        self.assertTrue(q.offer(2, 5))
+        self.assertFalse(q.offer(3, 5))
+        self.assertFalse(q.offer(3, 1))
+        self.assertTrue(q.offer(3, 7))
+        self.assertFalse(q.contains(2))
+        self.assertEqual(q.size(), 2)
+        m = MaxPQ(capacity=2)
+        self.assertTrue(m.offer(1, 10))
+        self.assertTrue(m.offer(2, 5))
+        self.assertFalse(m.offer(3, 10))
+        self.assertTrue(m.offer(3, 7))
+        self.assertEqual(m.extract_max(), 3)
+        self.assertEqual(m.get_priority(2), 5)
+        u = PQ()
+        self.assertTrue(u.offer(1, 1))
+        self.assertFalse(u.offer(1, 2))
+
+    def test_init_and_add_all(self) :
+        seed(24)
+        for arity in (2, 4) :
+            for k in (1, 3, 60, 100, 150) :
+                pairs = [(i, randrange(1000)) for i in range(100)]
+                q = PQ(pairs, arity=arity, capacity=k)
+                self.assertEqual(sorted(v for e, v in q.sorted_items()), sorted(v for e, v in pairs)[-k:])
+                more = [(i, randrange(1000)) for i in range(100, 100 + k // 2)]
+                q.add_all(more)
+                self.assertEqual(q.size(), min(k, 100 + k // 2))
+                self.assertEqual(sorted(v for e, v in q.sorted_items()), sorted(v for e, v in pairs + more)[-k:])
+                for i, p in enumerate(q._heap) :
+                    self.assertEqual(q._index[p[0]], i)
+                m = MaxPQ(pairs, arity=arity, capacity=k)
+                m.add_all(more)
+                self.assertEqual(sorted(v for e, v in m.sorted_items()), sorted(v for e, v in pairs + more)[:k])
+
+
+class TestIterables(unittest.TestCase) :
+
+    def check_heap(self, q) :
+        d = q._arity
+        for i in range(1, len(q._heap)) :
+            self.assertLessEqual(q._heap[(i-1)//d][1], q._heap[i][1])
+        for i, p in enumerate(q._heap) :
+            self.assertEqual(q._index[p[0]], i)
+        self.assertEqual(len(q._index), len(q._heap))
+
+    def test_init_from_generator(self) :
+        q = PQ((i, (7 * i) % 11) for i in range(11))
+        self.check_heap(q)
+        self.assertEqual([v for e, v in q.drain()], list(range(11)))
+        m = MaxPQ((i, i) for i in range(5))
+        self.assertEqual([m.extract_max() for i in range(5)], [4, 3, 2, 1, 0])
+        q = IntPQ(5, ((i, -i) for i in range(5)))
+        self.assertEqual(q.extract_min(), 4)
+        q = PQ(iter([]))
+        self.assertTrue(q.is_empty())
+
+    def test_duplicates(self) :
+        q = PQ([(1, 5), (2, 3), (1, 0), (3, 4), (2, 9)])
+        self.check_heap(q)
+        self.assertEqual(q.size(), 3)
+        self.assertEqual(q.get_priority(1), 5)
+        self.assertEqual(q.get_priority(2), 3)
+        q.add_all([(4, 1), (3, 0), (4, 2)])
+        self.check_heap(q)
+        self.assertEqual(q.size(), 4)
+        self.assertEqual(q.get_priority(3), 4)
+        self.assertEqual(q.get_priority(4), 1)
+        m = MaxPQ([(1, 5), (1, 7)])
+        self.assertEqual(m.get_priority(1), 5)
+
+    def test_add_all_from_failing_generator(self) :
+        def failing() :
+            yield (10, 1)
+            yield (11, 2)
+            raise RuntimeError("source failed")
+        for pairs in ([], [(1, 5), (2, 3)]) :
+            q = PQ(pairs)
+            self.assertRaises(RuntimeError, q.add_all, failing())
+            self.assertEqual(q.size(), len(pairs))
+            self.assertEqual(len(q._index), len(pairs))
+            self.assertFalse(q.contains(10))
+            q.add_all([(10, 4), (12, 0)])
+            self.check_heap(q)
+            self.assertEqual(q.size(), len(pairs) + 2)
+            self.assertEqual(q.extract_min(), 12)
+
+    def test_add_all_from_generator(self) :
+        seed(25)
+        for arity in (2, 3) :
+            for n, k in ((0, 10), (10, 0), (10, 3), (10, 30), (100, 99), (100, 100)) :
+                q = PQ([(i, randrange(100)) for i in range(n)], arity=arity)
+                q.add_all((randrange(n + k), randrange(100)) for i in range(k))
+                self.check_heap(q)
+                q.add_all(set((i, 0) for i in range(n, n + 3)))
+                self.check_heap(q)
+                values = [v for e, v in q.drain()]
+                self.assertEqual(values, sorted(values))
+
+    def test_merge(self) :
+        a = MaxPQ([(i, i) for i in range(5)])
+        b = MaxPQ([(i, 10 * i) for i in range(3, 8)])
+        a.merge(b)
+        self.assertEqual(a.size(), 8)
+        self.assertEqual(a.get_priority(3), 3)
+        self.assertEqual(a.get_priority(7), 70)
+        self.assertEqual(b.size(), 5)
+        a = IntPQ(10, [(1, 1.0)])
+        a.merge(IntPQ(10, [(1, 5.0), (2, 0.5)]))
+        self.assertEqual(a.extract_min(), 2)
+        self.assertEqual(a.get_priority(1), 1.0)
+
+    def test_bounded_stream(self) :
+        q = PQ(((i, i % 1000) for i in range(20000)), capacity=3)
+        self.assertEqual(sorted(v for e, v in q.sorted_items()), [999] * 3)
+
+
+class TestNativeMaxOrder(unittest.TestCase) :
+
+    def test_string_priorities(self) :
+        words = ["pear", "apple", "fig", "kiwi", "banana", "cherry"]
+        q = MaxPQ((i, w) for i, w in enumerate(words))
+        self.assertEqual(q.get_priority(0), "pear")
+        self.assertTrue(q.change_priority(2, "zucchini"))
+        self.assertEqual(q.peek_max(), 2)
+        self.assertEqual(q.nlargest(3, True), [(2, "zucchini"), (0, "pear"), (3, "kiwi")])
+        self.assertEqual(q.extract_while("cherry", True), [(2, "zucchini"), (0, "pear"), (3, "kiwi"), (5, "cherry")])
+        self.assertEqual([w for i, w in q.drain()], ["banana", "apple"])
+
+    def test_tuple_priorities(self) :
+        seed(26)
+        for arity in (2, 3) :
+            for sift_up in ("linear", "binary") :
+                pairs = [(i, (randrange(5), str(randrange(5)))) for i in range(200)]
+                q = MaxPQ(pairs, sift_up, arity)
+                for i in range(0, 200, 7) :
+                    q.change_priority(i, (randrange(5), str(randrange(5))))
+                for i in range(0, 200, 11) :
+                    q.remove(i)
+                items = list(q.sorted_items())
+                self.assertEqual([v for e, v in items], sorted((v for e, v in items), reverse=True))
+                self.assertEqual(q.extract_many(20, True), items[:20])
+                values = []
+                while not q.is_empty() :
+                    values.append(q.get_priority(q.peek_max()))
+                    q.extract_max()
+                self.assertEqual(values, [v for e, v in items[20:]])
+
+    def test_only_less_than(self) :
+        class LessThanOnly(Counted) :
+            def __gt__(self, other) :
+                raise TypeError("only < is supported")
+        q = MaxPQ((i, LessThanOnly(i)) for i in range(100))
+        q.change_priority(5, LessThanOnly(1000))
+        q.change_priority(6, LessThanOnly(-1))
+        q.remove(7)
+        self.assertEqual(q.nlargest(2), [5, 99])
+        self.assertEqual(q.extract_many(3), [5, 99, 98])
+        self.assertEqual(q.extract_max(), 97)
+        self.assertEqual(q.extract_while(LessThanOnly(90)), [96, 95, 94, 93, 92, 91, 90])
+
+    def test_max_heap_order(self) :
+        seed(27)
+        for arity in (2, 4) :
+            q = MaxPQ([(i, randrange(1000)) for i in range(300)], arity=arity)
+            for i in range(100) :
+                q.change_priority(randrange(300), randrange(1000))
+            heap = q._heap
+            for i in range(1, len(heap)) :
+                self.assertGreaterEqual(heap[(i-1)//arity][1], heap[i][1])
+
+
+class TestLazyDeletion(unittest.TestCase) :
+
+    def check_heap(self, q) :
+        d = q._arity
+        heap = q._heap
+        for i in range(1, len(heap)) :
+            self.assertLessEqual(heap[(i-1)//d][1], heap[i][1])
+        live = [p for p in heap if p[0] is not pq._STALE]
+        self.assertEqual(len(heap) - len(live), q._stale)
+        self.assertEqual(q.size(), len(live))
+        self.assertLessEqual(2 * q._stale, len(heap))
+        if len(heap) > 0 :
+            self.assertIsNot(heap[0][0], pq._STALE)
+        for p in live :
+            self.assertIs(heap[q._index[p[0]]], p)
+        # stale slots have no entries in the index
+        self.assertEqual(len(q._index), len(live))
+        self.assertNotIn(pq._STALE, q._index)
+
+    def test_random_operations(self) :
+        seed(28)
+        for arity in (2, 3) :
+            for sift_up in ("linear", "binary") :
+                check_random_operations(self, PQ(sift_up=sift_up, arity=arity, lazy_deletion=True), 3000)
+                check_random_operations(self, MaxPQ(sift_up=sift_up, arity=arity, lazy_deletion=True), 3000, True)
+
+    def test_remove_and_increase(self) :
+        seed(29)
+        for arity in (2, 4) :
+            q = PQ([(i, i) for i in range(200)], arity=arity, lazy_deletion=True)
+            for i in range(150, 100, -1) :
+                self.assertTrue(q.remove(i))
+                self.assertFalse(q.contains(i))
+                self.check_heap(q)
+            self.assertGreater(q._stale, 0)
+            for i in range(0, 100, 3) :
+                self.assertTrue(q.change_priority(i, 1000 + i))
+                self.assertEqual(q.get_priority(i), 1000 + i)
+                self.check_heap(q)
+            self.assertEqual(q.size(), 150)
+            self.assertEqual(q.nsmallest(3), [1, 2, 4])
+            self.assertEqual(len(list(q.sorted_items())), 150)
+            values = [v for e, v in q.drain()]
+            self.assertEqual(values, sorted(values))
+            self.assertEqual(len(values), 150)
+            self.assertEqual(q._stale, 0)
+
+    def test_compaction(self) :
+        q = PQ([(i, i) for i in range(100)], lazy_deletion=True)
+        for i in range(99, 49, -1) :
+            q.remove(i)
+        self.assertEqual(q._stale, 50)
+        self.assertEqual(len(q._heap), 100)
+        q.remove(49)
+        self.assertEqual(q._stale, 0)
+        self.assertEqual(len(q._heap), 49)
+        self.check_heap(q)
+
+    def test_batch_methods(self) :
+        seed(30)
+        for k in (1, 10, 40, 80) :
+            q = PQ([(i, randrange(100)) for i in range(100)], lazy_deletion=True)
+            for i in range(1, 100, 5) :
+                q.remove(i)
+            for i in range(2, 100, 7) :
+                if q.contains(i) :
+                    q.change_priority(i, q.get_priority(i) + 50)
+            self.check_heap(q)
+            expected = sorted(v for e, v in q.sorted_items())
+            self.assertEqual([v for e, v in q.extract_many(k, True)], expected[:k])
+            self.check_heap(q)
+            self.assertEqual([v for e, v in q.extract_while(60, True)], [v for v in expected[k:] if v <= 60])
+            self.check_heap(q)
+            other = PQ(lazy_deletion=True)
+            other.merge(q)
+            self.assertEqual(other.size(), q.size())
+            remaining = q.size()
+            self.assertEqual(q.remove_all(list(range(100))), remaining)
+            self.assertEqual(q.size(), 0)
+
+    def test_bounded(self) :
+        q = PQ(capacity=3, lazy_deletion=True)
+        for i in range(10) :
+            q.add(i, i)
+        self.assertTrue(q.remove(8))
+        self.assertIsNone(q.add(10, 0))
+        self.assertEqual(q.size(), 3)
+        self.assertFalse(q.offer(11, -1))
+        self.assertTrue(q.offer(11, 20))
+        self.assertEqual([e for e, v in q.drain()], [7, 9, 11])
+
+
 if __name__ == '__main__':
-    unittest.main()    
+    unittest.main()
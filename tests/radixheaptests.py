@@ -0,0 +1,122 @@
+##  Python Data Structures Library
+##
+##  Copyright (C) 2017 Vincent A. Cicirello.
+##  http://www.cicirello.org/
+##
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import sys
+sys.path.append('../lib')
+
+import unittest
+from radixheap import RadixPQ
+from pqtests import extract_all
+from random import randrange, shuffle, seed
+
+class TestRadixPQ(unittest.TestCase) :
+
+    def test_empty(self) :
+        q = RadixPQ()
+        self.assertTrue(q.is_empty())
+        self.assertEqual(q.size(), 0)
+        self.assertFalse(q.contains(1))
+        self.assertFalse(q.remove(1))
+        self.assertFalse(q.change_priority(1, 5))
+
+    def test_init_and_add(self) :
+        pairs = [(i, i % 7) for i in range(50)]
+        shuffle(pairs)
+        q = RadixPQ(pairs)
+        self.assertEqual(q.size(), 50)
+        self.assertFalse(q.add(3, 100))
+        self.assertEqual(q.get_priority(3), 3)
+        self.assertTrue(q.add(50, 1 << 70))
+        values = [v for e, v in extract_all(self, q)]
+        self.assertEqual(values, sorted(i % 7 for i in range(50)) + [1 << 70])
+
+    def test_add_all(self) :
+        q = RadixPQ([(1, 5), (2, 3)])
+        q.add_all(iter([(2, 0), (3, 4), (4, 1), (4, 9)]))
+        self.assertEqual(extract_all(self, q), [(4, 1), (2, 3), (3, 4), (1, 5)])
+
+    def test_change_priority(self) :
+        q = RadixPQ([(i, 2 * i) for i in range(20)])
+        self.assertEqual(q.extract_min(), 0)
+        self.assertTrue(q.change_priority(15, 1))
+        self.assertTrue(q.change_priority(1, 60))
+        self.assertTrue(q.change_priority(7, 14))
+        self.assertEqual(q.peek_min(), 15)
+        self.assertEqual(q.extract_min(), 15)
+        self.assertTrue(q.change_priority(19, 3))
+        expected = [(19, 3)] + [(i, 2 * i) for i in range(2, 19) if i != 15] + [(1, 60)]
+        self.assertEqual(extract_all(self, q), expected)
+
+    def test_remove(self) :
+        q = RadixPQ([(i, i) for i in range(20)])
+        self.assertEqual(q.extract_min(), 0)
+        for e in (1, 19, 10, 4) :
+            self.assertTrue(q.remove(e))
+            self.assertFalse(q.contains(e))
+        self.assertFalse(q.remove(4))
+        self.assertEqual(extract_all(self, q), [(i, i) for i in range(2, 19) if i not in (4, 10)])
+
+    def test_non_monotone(self) :
+        self.assertRaises(ValueError, RadixPQ, [(1, -1)])
+        q = RadixPQ([(1, 10), (2, 20), (3, 30)])
+        self.assertEqual(q.extract_min(), 1)
+        self.assertRaises(ValueError, q.add, 4, 9)
+        self.assertRaises(ValueError, q.change_priority, 2, 9)
+        self.assertFalse(q.contains(4))
+        self.assertEqual(q.get_priority(2), 20)
+        self.assertTrue(q.add(4, 10))
+        self.assertTrue(q.change_priority(3, 10))
+        self.assertEqual(q.size(), 3)
+        self.assertEqual([v for e, v in extract_all(self, q)], [10, 10, 20])
+
+    def test_random_operations(self) :
+        seed(23)
+        for steps in (10, 100, 5000) :
+            # applies a random mix of monotone operations, checking each result against a dict of priorities
+            q = RadixPQ()
+            model = {}
+            last = 0
+            for step in range(steps) :
+                op = randrange(6)
+                e = randrange(steps // 2 + 1)
+                if op <= 1 :
+                    value = last + randrange(1000)
+                    self.assertEqual(q.add(e, value), e not in model)
+                    model.setdefault(e, value)
+                elif op == 2 :
+                    value = last + randrange(1000)
+                    self.assertEqual(q.change_priority(e, value), e in model)
+                    if e in model :
+                        model[e] = value
+                elif op == 3 :
+                    self.assertEqual(q.remove(e), e in model)
+                    model.pop(e, None)
+                elif op == 4 and model :
+                    last = min(model.values())
+                    self.assertEqual(model.pop(q.extract_min()), last)
+                self.assertEqual(q.size(), len(model))
+                self.assertEqual(q.contains(e), e in model)
+                if e in model :
+                    self.assertEqual(q.get_priority(e), model[e])
+            values = [v for e, v in extract_all(self, q)]
+            self.assertEqual(values, sorted(model.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()